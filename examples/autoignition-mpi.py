@@ -53,18 +53,19 @@ from mirgecom.integrators import rk4_step
 from mirgecom.steppers import advance_state
 from mirgecom.boundary import AdiabaticSlipBoundary
 from mirgecom.initializers import MixtureInitializer
-from mirgecom.eos import PyrometheusMixture
+from mirgecom.eos import TabulatedPyrometheusMixture, FrozenRateChemistry
 
 from mirgecom.logging_quantities import (
     initialize_logmgr,
     logmgr_add_many_discretization_quantities,
     logmgr_add_device_name,
     logmgr_add_device_memory_usage,
+    logmgr_add_eos_cache_statistics,
+    logmgr_add_chemistry_reuse_statistics,
     set_sim_state
 )
 
 import cantera
-import pyrometheus as pyro
 
 logger = logging.getLogger(__name__)
 
@@ -78,7 +79,7 @@ class MyRuntimeError(RuntimeError):
 @mpi_entry_point
 def main(ctx_factory=cl.create_some_context, use_logmgr=False,
          use_leap=False, use_profiling=False, casename="autoignition",
-         rst_filename=None):
+         rst_filename=None, use_operator_splitting=False, chemistry_max_reuse=0):
     """Drive example."""
     cl_ctx = ctx_factory()
 
@@ -241,12 +242,38 @@ def main(ctx_factory=cl.create_some_context, use_logmgr=False,
 
     # {{{ Create Pyrometheus thermochemistry object & EOS
 
-    # Create a Pyrometheus EOS with the Cantera soln. Pyrometheus uses Cantera and
+    # Create a Pyrometheus EOS for the mechanism. Pyrometheus uses Cantera and
     # generates a set of methods to calculate chemothermomechanical properties and
-    # states for this particular mechanism.
-    pyrometheus_mechanism = pyro.get_thermochem_class(cantera_soln)(actx.np)
-    eos = PyrometheusMixture(pyrometheus_mechanism,
-                             temperature_guess=init_temperature)
+    # states for this particular mechanism. The generated code is cached on disk
+    # and built by one rank only.
+    from mirgecom.mechanisms import get_thermochem_class
+    pyrometheus_mechanism = get_thermochem_class(mech_cti, comm=comm)(actx.np)
+    # The temperature is found from tabulated species energies rather than from
+    # Newton iterations started at a guess.
+    eos = TabulatedPyrometheusMixture(pyrometheus_mechanism)
+    if logmgr:
+        logmgr_add_eos_cache_statistics(logmgr, eos.cache)
+
+    if use_operator_splitting:
+        # Advance the stiff chemistry implicitly, separately from the flow, so
+        # that the flow step is not limited by the chemical time scales
+        if use_leap:
+            raise ValueError("Operator splitting requires a function timestepper.")
+        from mirgecom.steppers import make_operator_split_timestepper
+
+        def integrate_chemistry(state, t, dt):
+            return eos.integrate_chemistry(state, dt)
+
+        timestepper = make_operator_split_timestepper(timestepper,
+                                                      integrate_chemistry)
+
+    chemistry = eos
+    if chemistry_max_reuse > 0:
+        # Reuse the chemistry source terms over several RK stages, unless the
+        # temperature changes by more than a few Kelvin
+        chemistry = FrozenRateChemistry(eos, max_reuse=chemistry_max_reuse)
+        if logmgr:
+            logmgr_add_chemistry_reuse_statistics(logmgr, chemistry)
 
     # }}}
 
@@ -271,6 +298,9 @@ def main(ctx_factory=cl.create_some_context, use_logmgr=False,
             logmgr_set_time(logmgr, current_step, current_t)
         if order == rst_order:
             current_state = restart_data["state"]
+            # The seeds are only used with a warm-started PyrometheusMixture;
+            # the tabulated EOS does not need them
+            eos.set_temperature_seeds(restart_data.get("temperature_seeds", {}))
         else:
             rst_state = restart_data["state"]
             old_discr = EagerDGDiscretization(actx, local_mesh, order=rst_order,
@@ -348,6 +378,7 @@ def main(ctx_factory=cl.create_some_context, use_logmgr=False,
                 "t": t,
                 "step": step,
                 "order": order,
+                "temperature_seeds": eos.get_temperature_seeds(),
                 "global_nelements": global_nelements,
                 "num_parts": nproc
             }
@@ -442,9 +473,10 @@ def main(ctx_factory=cl.create_some_context, use_logmgr=False,
         return state, dt
 
     def my_rhs(t, state):
-        return (euler_operator(discr, cv=state, t=t,
-                               boundaries=boundaries, eos=eos)
-                + eos.get_species_source_terms(state))
+        rhs = euler_operator(discr, cv=state, t=t, boundaries=boundaries, eos=eos)
+        if use_operator_splitting:
+            return rhs
+        return rhs + chemistry.get_species_source_terms(state)
 
     current_dt = get_sim_timestep(discr, current_state, current_t, current_dt,
                                   current_cfl, eos, t_final, constant_cfl)
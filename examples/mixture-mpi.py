@@ -50,8 +50,6 @@ from mirgecom.boundary import PrescribedBoundary
 from mirgecom.initializers import MixtureInitializer
 from mirgecom.eos import PyrometheusMixture
 
-import cantera
-import pyrometheus as pyro
 
 from logpyle import IntervalTimer, set_dt
 from mirgecom.euler import extract_vars_for_logging, units_for_logging
@@ -172,10 +170,10 @@ def main(ctx_factory=cl.create_some_context, use_leap=False,
         ])
 
     # Pyrometheus initialization
-    from mirgecom.mechanisms import get_mechanism_cti
+    from mirgecom.mechanisms import get_mechanism_cti, get_thermochem_class
     mech_cti = get_mechanism_cti("uiuc")
-    sol = cantera.Solution(phase_id="gas", source=mech_cti)
-    pyrometheus_mechanism = pyro.get_thermochem_class(sol)(actx.np)
+    # The generated mechanism code is cached on disk and built by one rank only
+    pyrometheus_mechanism = get_thermochem_class(mech_cti, comm=comm)(actx.np)
 
     nspecies = pyrometheus_mechanism.num_species
     eos = PyrometheusMixture(pyrometheus_mechanism)
@@ -3,6 +3,7 @@
 Boundary Conditions
 ^^^^^^^^^^^^^^^^^^^
 
+.. autoclass:: FluidBoundary
 .. autoclass:: PrescribedBoundary
 .. autoclass:: DummyBoundary
 .. autoclass:: AdiabaticSlipBoundary
@@ -33,20 +34,107 @@ THE SOFTWARE.
 """
 
 import numpy as np
-from meshmode.dof_array import thaw
+from pytools import memoize_in
+from arraycontext import freeze, thaw as thaw_container
 from meshmode.mesh import BTAG_ALL, BTAG_NONE  # noqa
 from grudge.trace_pair import TracePair
 from mirgecom.fluid import make_conserved
+from mirgecom.geometry import get_normal, get_nodes
+from mirgecom.utils import is_tracing
+from mirgecom.eos import (
+    FluidState,
+    make_fluid_state,
+    make_fluid_state_trace_pair
+)
 
 
-class PrescribedBoundary:
+class FluidBoundary:
+    """Base class for fluid boundary conditions.
+
+    .. attribute:: is_time_dependent
+
+        Whether the exterior data of the boundary depends on time. Defaults to
+        *True*.
+
+    .. attribute:: is_state_dependent
+
+        Whether the exterior data of the boundary depends on the interior
+        state. Defaults to *True*.
+
+    Exterior data of boundaries that do not depend on the interior state is
+    cached: if it depends on neither the state nor time, it is computed once
+    per discretization and boundary tag; if it depends on time only, it is
+    reused by all evaluations at the same time, such as Runge-Kutta stages
+    that share a stage time.
+
+    .. automethod:: boundary_pair
+    .. automethod:: boundary_state_pair
+    """
+
+    is_time_dependent = True
+    is_state_dependent = True
+
+    def boundary_pair(self, discr, cv, btag, **kwargs):
+        """Get the interior and exterior solution on the boundary."""
+        raise NotImplementedError()
+
+    def boundary_state_pair(self, discr, eos, btag, cv, **kwargs):
+        """Get the interior and exterior fluid states on the boundary.
+
+        Returns a :class:`grudge.trace_pair.TracePair` of
+        :class:`mirgecom.eos.FluidState` so that the flux routines can reuse the
+        dependent variables on each side of the boundary. By default, the
+        dependent variables are computed from the result of
+        :meth:`boundary_pair`. Subclasses for which the exterior dependent
+        variables are known from the interior ones should override this.
+        """
+        return make_fluid_state_trace_pair(
+            self.boundary_pair(discr, cv=cv, btag=btag, eos=eos, **kwargs), eos)
+
+    def _get_exterior(self, discr, actx, btag, name, compute_exterior, t=None):
+        """Return the exterior data *name*, reusing a cached value if allowed.
+
+        *compute_exterior* is called without arguments to compute the data if
+        the boundary depends on the interior state, or if no cached value for
+        the time *t* is available. Cached data is stored frozen. While a
+        compiled step is traced, the cache is bypassed, since neither the traced
+        time nor the traced data can be stored.
+        """
+        if self.is_state_dependent or is_tracing():
+            return compute_exterior()
+
+        @memoize_in(discr, (FluidBoundary, "exterior_cache", self, btag))
+        def get_exterior_cache():
+            return {}
+
+        cache = get_exterior_cache()
+        key = t if self.is_time_dependent else None
+
+        if name in cache:
+            cached_key, frozen_exterior = cache[name]
+            if cached_key == key:
+                return thaw_container(frozen_exterior, actx)
+
+        exterior = compute_exterior()
+        cache[name] = (key, freeze(exterior, actx))
+        return exterior
+
+
+class PrescribedBoundary(FluidBoundary):
     """Boundary condition prescribes boundary soln with user-specified function.
 
+    The prescribed exterior solution does not depend on the interior state, so
+    it is cached as described in :class:`FluidBoundary`, along with its
+    dependent variables.
+
     .. automethod:: __init__
     .. automethod:: boundary_pair
+    .. automethod:: boundary_state_pair
     """
 
-    def __init__(self, userfunc):
+    is_state_dependent = False
+
+    def __init__(self, userfunc, time_dependent=True):
         """Set the boundary function.
 
         Parameters
@@ -56,33 +144,66 @@ class PrescribedBoundary:
             of the boundary. The given user function (*userfunc*) must take at
             least one parameter that specifies the coordinates at which to prescribe
             the solution.
+        time_dependent: bool
+            Whether *userfunc* depends on time. If *False*, the exterior
+            solution is computed only once per discretization and boundary tag.
         """
         self._userfunc = userfunc
+        self.is_time_dependent = time_dependent
+
+    def _exterior_soln(self, discr, actx, btag, dtype=None, **kwargs):
+        def compute_exterior_soln():
+            nodes = get_nodes(actx, discr, btag, dtype=dtype)
+            return self._userfunc(nodes, **kwargs)
+
+        return self._get_exterior(discr, actx, btag, "soln",
+                                  compute_exterior_soln, t=kwargs.get("t"))
 
     def boundary_pair(self, discr, cv, btag, **kwargs):
         """Get the interior and exterior solution on the boundary."""
         actx = cv.array_context
 
-        boundary_discr = discr.discr_from_dd(btag)
-        nodes = thaw(actx, boundary_discr.nodes())
-        ext_soln = self._userfunc(nodes, **kwargs)
+        ext_soln = self._exterior_soln(discr, actx, btag,
+                                       dtype=cv.mass.entry_dtype, **kwargs)
         int_soln = discr.project("vol", btag, cv)
         return TracePair(btag, interior=int_soln, exterior=ext_soln)
 
+    def boundary_state_pair(self, discr, eos, btag, cv, **kwargs):
+        """Get the interior and exterior fluid states on the boundary.
+
+        The dependent variables of the exterior state are cached along with
+        the exterior solution.
+        """
+        actx = cv.array_context
+
+        def compute_exterior_state():
+            return make_fluid_state(
+                self._exterior_soln(discr, actx, btag, dtype=cv.mass.entry_dtype,
+                                    eos=eos, **kwargs), eos,
+                dd=(btag, "exterior"))
+
+        ext_state = self._get_exterior(discr, actx, btag, ("state", eos),
+                                       compute_exterior_state, t=kwargs.get("t"))
+        int_state = make_fluid_state(discr.project("vol", btag, cv), eos,
+                                     dd=btag)
+        return TracePair(btag, interior=int_state, exterior=ext_state)
 
-class DummyBoundary:
+
+class DummyBoundary(FluidBoundary):
     """Boundary condition that assigns boundary-adjacent soln as the boundary solution.
 
     .. automethod:: boundary_pair
     """
 
+    is_time_dependent = False
+
     def boundary_pair(self, discr, cv, btag, **kwargs):
         """Get the interior and exterior solution on the boundary."""
         dir_soln = discr.project("vol", btag, cv)
         return TracePair(btag, interior=dir_soln, exterior=dir_soln)
 
 
-class AdiabaticSlipBoundary:
+class AdiabaticSlipBoundary(FluidBoundary):
     r"""Boundary condition implementing inviscid slip boundary.
 
     a.k.a. Reflective inviscid wall boundary
@@ -98,8 +219,11 @@ class AdiabaticSlipBoundary:
     boundary conditions described in detail in [Poinsot_1992]_.
 
     .. automethod:: boundary_pair
+    .. automethod:: boundary_state_pair
     """
 
+    is_time_dependent = False
+
     def boundary_pair(self, discr, cv, btag, **kwargs):
         """Get the interior and exterior solution on the boundary.
 
@@ -116,7 +240,7 @@ class AdiabaticSlipBoundary:
         actx = cv.mass.array_context
 
         # Grab a unit normal to the boundary
-        nhat = thaw(actx, discr.normal(btag))
+        nhat = get_normal(actx, discr, btag, dtype=cv.mass.entry_dtype)
 
         # Get the interior/exterior solns
         int_cv = discr.project("vol", btag, cv)
@@ -125,9 +249,7 @@ class AdiabaticSlipBoundary:
         # of velocity from the velocity at the wall to
         # induce an equal but opposite wall-normal (reflected) wave
         # preserving the tangential component
-        mom_normcomp = np.dot(int_cv.momentum, nhat)  # wall-normal component
-        wnorm_mom = nhat * mom_normcomp  # wall-normal mom vec
-        ext_mom = int_cv.momentum - 2.0 * wnorm_mom  # prescribed ext momentum
+        ext_mom = _reflect(int_cv.momentum, nhat)  # prescribed ext momentum
 
         # Form the external boundary solution with the new momentum
         bndry_cv = make_conserved(dim=dim, mass=int_cv.mass,
@@ -136,3 +258,25 @@ class AdiabaticSlipBoundary:
                                   species_mass=int_cv.species_mass)
 
         return TracePair(btag, interior=int_cv, exterior=bndry_cv)
+
+    def boundary_state_pair(self, discr, eos, btag, cv, **kwargs):
+        """Get the interior and exterior fluid states on the boundary.
+
+        The reflection preserves density, energy, and the magnitude of the
+        momentum, so the exterior state shares the dependent variables of the
+        interior state and only the velocity is reflected.
+        """
+        actx = cv.mass.array_context
+        nhat = get_normal(actx, discr, btag, dtype=cv.mass.entry_dtype)
+
+        cv_tpair = self.boundary_pair(discr, cv=cv, btag=btag, eos=eos, **kwargs)
+        int_state = make_fluid_state(cv_tpair.int, eos, dd=cv_tpair.dd)
+        ext_state = FluidState(cv=cv_tpair.ext, dv=int_state.dv,
+                               velocity=_reflect(int_state.velocity, nhat))
+
+        return TracePair(btag, interior=int_state, exterior=ext_state)
+
+
+def _reflect(vec, nhat):
+    """Return *vec* with its component along the unit normal *nhat* reversed."""
+    return vec - 2.0 * (nhat * np.dot(vec, nhat))
@@ -37,10 +37,21 @@ import numpy as np
 import numpy.linalg as la  # noqa
 from pytools.obj_array import make_obj_array, obj_array_vectorize_n_args
 from meshmode.mesh import BTAG_ALL, BTAG_NONE  # noqa
-from meshmode.dof_array import thaw
 from grudge.dof_desc import DOFDesc, as_dofdesc
-from grudge.eager import interior_trace_pair, cross_rank_trace_pairs
+from grudge.eager import interior_trace_pair
 from grudge.trace_pair import TracePair
+from mirgecom.geometry import get_normal
+from mirgecom.trace_pair import (
+    start_cross_rank_trace_pairs,
+    finish_cross_rank_trace_pairs
+)
+
+
+# MPI tag offsets of the cross-rank exchanges of the diffusion operator, which
+# are in flight at the same time
+_U_EXCHANGE_TAG = 1
+_ALPHA_EXCHANGE_TAG = 2
+_GRAD_U_EXCHANGE_TAG = 3
 
 
 def gradient_flux(discr, quad_tag, u_tpair):
@@ -51,7 +62,7 @@ def gradient_flux(discr, quad_tag, u_tpair):
     dd_quad = dd.with_discr_tag(quad_tag)
     dd_allfaces_quad = dd_quad.with_dtag("all_faces")
 
-    normal_quad = thaw(actx, discr.normal(dd_quad))
+    normal_quad = get_normal(actx, discr, dd_quad)
 
     def to_quad(a):
         return discr.project(dd, dd_quad, a)
@@ -71,7 +82,7 @@ def diffusion_flux(discr, quad_tag, alpha_tpair, grad_u_tpair):
     dd_quad = dd.with_discr_tag(quad_tag)
     dd_allfaces_quad = dd_quad.with_dtag("all_faces")
 
-    normal_quad = thaw(actx, discr.normal(dd_quad))
+    normal_quad = get_normal(actx, discr, dd_quad)
 
     def to_quad(a):
         return discr.project(dd, dd_quad, a)
@@ -256,39 +267,55 @@ def diffusion_operator(discr, quad_tag, alpha, boundaries, u, return_grad_u=Fals
     dd_quad = DOFDesc("vol", quad_tag)
     dd_allfaces_quad = DOFDesc("all_faces", quad_tag)
 
+    # Post the halo exchanges before the rank-local work so that they overlap
+    u_exchange = start_cross_rank_trace_pairs(discr, u, tag=_U_EXCHANGE_TAG)
+    alpha_exchange = start_cross_rank_trace_pairs(discr, alpha,
+                                                  tag=_ALPHA_EXCHANGE_TAG)
+
+    grad_u_vol = discr.weak_grad(-u)
+    grad_u_local_flux = (
+        gradient_flux(discr, quad_tag, interior_trace_pair(discr, u))
+        + sum(
+            bdry.get_gradient_flux(discr, quad_tag, as_dofdesc(btag), alpha, u)
+            for btag, bdry in boundaries.items()))
+
     grad_u = discr.inverse_mass(
-        discr.weak_grad(-u)
+        grad_u_vol
         -  # noqa: W504
         discr.face_mass(
             dd_allfaces_quad,
-            gradient_flux(discr, quad_tag, interior_trace_pair(discr, u))
-            + sum(
-                bdry.get_gradient_flux(discr, quad_tag, as_dofdesc(btag), alpha, u)
-                for btag, bdry in boundaries.items())
+            grad_u_local_flux
             + sum(
                 gradient_flux(discr, quad_tag, u_tpair)
-                for u_tpair in cross_rank_trace_pairs(discr, u))
+                for u_tpair in finish_cross_rank_trace_pairs(u_exchange))
             )
         )
 
+    grad_u_exchange = start_cross_rank_trace_pairs(discr, grad_u,
+                                                   tag=_GRAD_U_EXCHANGE_TAG)
+
     alpha_quad = discr.project("vol", dd_quad, alpha)
     grad_u_quad = discr.project("vol", dd_quad, grad_u)
 
+    diff_u_vol = discr.weak_div(dd_quad, -alpha_quad*grad_u_quad)
+    diff_u_local_flux = (
+        diffusion_flux(discr, quad_tag, interior_trace_pair(discr, alpha),
+            interior_trace_pair(discr, grad_u))
+        + sum(
+            bdry.get_diffusion_flux(discr, quad_tag, as_dofdesc(btag), alpha,
+                grad_u) for btag, bdry in boundaries.items()))
+
     diff_u = discr.inverse_mass(
-        discr.weak_div(dd_quad, -alpha_quad*grad_u_quad)
+        diff_u_vol
         -  # noqa: W504
         discr.face_mass(
             dd_allfaces_quad,
-            diffusion_flux(discr, quad_tag, interior_trace_pair(discr, alpha),
-                interior_trace_pair(discr, grad_u))
-            + sum(
-                bdry.get_diffusion_flux(discr, quad_tag, as_dofdesc(btag), alpha,
-                    grad_u) for btag, bdry in boundaries.items())
+            diff_u_local_flux
             + sum(
                 diffusion_flux(discr, quad_tag, alpha_tpair, grad_u_tpair)
                 for alpha_tpair, grad_u_tpair in zip(
-                    cross_rank_trace_pairs(discr, alpha),
-                    cross_rank_trace_pairs(discr, grad_u)))
+                    finish_cross_rank_trace_pairs(alpha_exchange),
+                    finish_cross_rank_trace_pairs(grad_u_exchange)))
             )
         )
 
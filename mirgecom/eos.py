@@ -7,9 +7,28 @@ This module is designed provide Equation of State objects used to compute and
 manage the relationships between and among state and thermodynamic variables.
 
 .. autoclass:: EOSDependentVars
+.. autoclass:: MixtureDependentVars
 .. autoclass:: GasEOS
 .. autoclass:: IdealSingleGas
 .. autoclass:: PyrometheusMixture
+.. autoclass:: TabulatedPyrometheusMixture
+
+EOS Result Caching
+^^^^^^^^^^^^^^^^^^
+
+.. autoclass:: EOSCache
+
+Chemistry Rate Reuse
+^^^^^^^^^^^^^^^^^^^^
+
+.. autoclass:: FrozenRateChemistry
+
+Fluid State Handling
+^^^^^^^^^^^^^^^^^^^^
+
+.. autoclass:: FluidState
+.. autofunction:: make_fluid_state
+.. autofunction:: make_fluid_state_trace_pair
 """
 
 __copyright__ = """
@@ -36,13 +55,24 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 THE SOFTWARE.
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass
 import numpy as np
-from pytools import memoize_in
+from pytools.obj_array import make_obj_array
+from arraycontext import (
+    dataclass_array_container,
+    freeze,
+    thaw
+)
 from meshmode.mesh import BTAG_ALL, BTAG_NONE  # noqa
+from meshmode.dof_array import DOFArray
+from grudge.trace_pair import TracePair
 from mirgecom.fluid import ConservedVars, make_conserved
+from mirgecom.precision import cast_to_dtype
+from mirgecom.utils import get_container_leaves
 
 
+@dataclass_array_container
 @dataclass
 class EOSDependentVars:
     """State-dependent quantities for :class:`GasEOS`.
@@ -52,10 +82,29 @@ class EOSDependentVars:
 
     .. attribute:: temperature
     .. attribute:: pressure
+    .. attribute:: speed_of_sound
     """
 
     temperature: np.ndarray
     pressure: np.ndarray
+    speed_of_sound: np.ndarray
+
+
+@dataclass_array_container
+@dataclass
+class MixtureDependentVars(EOSDependentVars):
+    """Mixture state-dependent quantities for :class:`PyrometheusMixture`.
+
+    .. attribute:: species_mass_fractions
+    .. attribute:: gas_const
+    .. attribute:: specific_heat_cp
+    .. attribute:: gamma
+    """
+
+    species_mass_fractions: np.ndarray
+    gas_const: np.ndarray
+    specific_heat_cp: np.ndarray
+    gamma: np.ndarray
 
 
 class GasEOS:
@@ -77,12 +126,22 @@ class GasEOS:
     .. automethod:: total_energy
     .. automethod:: kinetic_energy
     .. automethod:: gamma
+    .. automethod:: get_host_side_features
     """
 
     def pressure(self, cv: ConservedVars):
         """Get the gas pressure."""
         raise NotImplementedError()
 
+    def get_host_side_features(self):
+        """Return descriptions of the enabled features that work on the host.
+
+        These features keep state between calls keyed on the identity of
+        arrays, or transfer data to the host, so they cannot be traced into a
+        compiled program, see :func:`mirgecom.steppers.make_compiled_timestepper`.
+        """
+        return []
+
     def temperature(self, cv: ConservedVars):
         """Get the gas temperature."""
         raise NotImplementedError()
@@ -111,11 +170,17 @@ class GasEOS:
         """Get the ratio of gas specific heats Cp/Cv."""
         raise NotImplementedError()
 
-    def dependent_vars(self, cv: ConservedVars) -> EOSDependentVars:
-        """Get an agglomerated array of the depedent variables."""
+    def dependent_vars(self, cv: ConservedVars, dd=None) -> EOSDependentVars:
+        """Get an agglomerated array of the depedent variables.
+
+        *dd* identifies the discretization on which *cv* lives, e.g. its DOF
+        descriptor. It is used by EOS implementations that keep data across
+        calls per discretization, and is ignored otherwise.
+        """
         return EOSDependentVars(
             pressure=self.pressure(cv),
             temperature=self.temperature(cv),
+            speed_of_sound=self.sound_speed(cv)
             )
 
 
@@ -231,6 +296,100 @@ class IdealSingleGas(GasEOS):
         return (pressure / (self._gamma - 1.0)
                 + self.kinetic_energy(cv))
 
+    def dependent_vars(self, cv: ConservedVars, dd=None) -> EOSDependentVars:
+        r"""Get the dependent variables, evaluating the internal energy only once.
+
+        All of the dependent variables of the ideal single gas are simple
+        functions of the internal energy density ($\rho{e}$), so it is computed
+        once and shared instead of being recomputed by each of the individual
+        methods.
+        """
+        actx = cv.array_context
+        pressure = self.internal_energy(cv) * (self._gamma - 1.0)
+        return EOSDependentVars(
+            pressure=pressure,
+            temperature=pressure / (self._gas_const * cv.mass),
+            speed_of_sound=actx.np.sqrt(self._gamma / cv.mass * pressure)
+            )
+
+
+class EOSCache:
+    """Bounded cache of the results of expensive EOS evaluations.
+
+    Entries are keyed on the name of the computed quantity and on the identity
+    of the arrays that make up the state, rather than on the state object
+    itself, so that a new :class:`~mirgecom.fluid.ConservedVars` assembled
+    from the same arrays shares the cached results. The cache holds references
+    to these arrays, so that their identities cannot be reused while an entry
+    is alive. When more than *max_entries* results are stored, the least
+    recently used one is evicted.
+
+    The cached results are meant to be shared by the evaluations for the same
+    state within one RHS evaluation, e.g. by the operator and the chemistry
+    source terms. Nothing clears the cache automatically: the results for the
+    states of earlier RHS evaluations (e.g. previous time integrator stages)
+    are evicted as newer results are stored, so that *max_entries* bounds the
+    memory held by the cache. Each entry keeps a state and one derived
+    quantity alive; for a volume state of a mixture of $N$ species in $d$
+    dimensions, that is at most about $2N + d + 9$ volume fields (the state
+    itself, the species mass fractions, and the other dependent variables).
+    The face states are much smaller. Call :meth:`clear` to release the
+    memory sooner.
+
+    .. attribute:: max_entries
+    .. attribute:: hits
+    .. attribute:: misses
+
+    .. automethod:: __init__
+    .. automethod:: get_or_compute
+    .. automethod:: clear
+    """
+
+    def __init__(self, max_entries=32):
+        """Create an empty cache holding at most *max_entries* results."""
+        if max_entries < 1:
+            raise ValueError("EOSCache requires max_entries >= 1.")
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        """Return the number of cached results."""
+        return len(self._entries)
+
+    def get_or_compute(self, name, cv, compute):
+        """Return the cached quantity *name* for *cv*, or compute and store it.
+
+        Parameters
+        ----------
+        name: str
+            Name of the quantity
+        cv: :class:`~mirgecom.fluid.ConservedVars`
+            The state the quantity depends on
+        compute
+            Called without arguments to compute the quantity on a miss
+        """
+        arrays = tuple(get_container_leaves(cv))
+        key = (name, tuple(id(ary) for ary in arrays))
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[1]
+
+        self.misses += 1
+        value = compute()
+        self._entries[key] = (arrays, value)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        """Remove all entries, keeping the hit and miss counts."""
+        self._entries.clear()
+
 
 class PyrometheusMixture(GasEOS):
     r"""Ideal gas mixture ($p = \rho{R}_\mathtt{mix}{T}$).
@@ -253,17 +412,24 @@ class PyrometheusMixture(GasEOS):
     .. automethod:: get_species_molecular_weights
     .. automethod:: get_production_rates
     .. automethod:: get_species_source_terms
+    .. automethod:: integrate_chemistry
     .. automethod:: get_internal_energy
     .. automethod:: species_fractions
     .. automethod:: total_energy
     .. automethod:: gamma
     .. automethod:: gas_const
+    .. automethod:: dependent_vars
+    .. autoattribute:: cache
+    .. automethod:: get_temperature_seeds
+    .. automethod:: set_temperature_seeds
 
     Inherits from (and implements) :class:`GasEOS`.
     """
 
-    def __init__(self, pyrometheus_mech, temperature_guess=300.0):
-        """Initialize Pyrometheus-based EOS with mechanism class.
+    def __init__(self, pyrometheus_mech, temperature_guess=300.0, warm_start=True,
+                 cache=None, activity_temperature=None, activity_rate=None,
+                 activity_recheck_interval=10):
+        r"""Initialize Pyrometheus-based EOS with mechanism class.
 
         Parameters
         ----------
@@ -275,17 +441,73 @@ class PyrometheusMixture(GasEOS):
             mechanisms are provided in `mirgecom/mechanisms/` and can be used through
             the :meth:`mirgecom.mechanisms.get_mechanism_cti`.
 
-        tguess: float
+        temperature_guess: float
             This provides a constant starting temperature for the Newton iterations
             used to find the mixture temperature. It defaults to 300.0 Kelvin. This
             parameter is important for the performance and proper function of the
-            code. Users should set a tguess that is close to the average temperature
-            of the simulated domain.  Ideally, we would use the last computed
-            temperature for the guess, but doing so requires restart infrastructure
-            that is TBD.
+            code. Users should set a temperature_guess that is close to the average
+            temperature of the simulated domain. With *warm_start*, it is only
+            used until a temperature has been computed on a given discretization.
+
+        warm_start: bool
+            If *True* (the default), the most recently computed temperature field
+            on each discretization is kept and used as the per-node starting
+            guess for the next temperature evaluation on that discretization.
+            Use :meth:`get_temperature_seeds` and :meth:`set_temperature_seeds`
+            to carry these fields through restarts. Disable this when tracing
+            the EOS with a lazily-evaluating array context.
+
+        cache: :class:`EOSCache`
+            The cache holding the species fractions, temperatures, and
+            dependent variables computed by this EOS. A cache with the default
+            size is created if not given.
+
+        activity_temperature: float
+            If given, the chemistry is only evaluated at nodes with at least this
+            temperature (or that satisfy the *activity_rate* criterion), and the
+            production rates elsewhere are zero.
+
+        activity_rate: float
+            If given, the chemistry is only evaluated at nodes where the largest
+            species mass production rate $|W_\alpha\dot{\omega}_\alpha|$ of the
+            previous evaluation on the same discretization was at least this
+            large (or that satisfy the *activity_temperature* criterion). All
+            nodes are active in the first evaluation.
+
+        activity_recheck_interval: int
+            With *activity_rate*, every this many evaluations on a
+            discretization all nodes are active again, so that the rate
+            magnitudes of inactive nodes are refreshed, e.g. when a flame front
+            reaches a node that was quiet before. In between, inactive nodes
+            keep the rate magnitude last measured there.
+
+        .. note::
+
+            With an activity criterion, the production rates are evaluated on
+            the host: each evaluation transfers the density, temperature, and
+            species fractions to the host, and the rates back to the device.
+            This pays off when the chemistry is expensive (many species and
+            reactions) and only a small fraction of the nodes is active;
+            otherwise, evaluating the rates everywhere on the device is faster.
         """
         self._pyrometheus_mech = pyrometheus_mech
+        self._host_mech = None
         self._tguess = temperature_guess
+        self._warm_start = warm_start
+        self._temperature_seeds = {}
+        self._activity_temperature = activity_temperature
+        self._activity_rate = activity_rate
+        self._activity_recheck_interval = activity_recheck_interval
+        self._reaction_rate_magnitudes = {}
+        self._activity_evaluations = {}
+        if cache is None:
+            cache = EOSCache()
+        self._cache = cache
+
+    @property
+    def cache(self):
+        """Return the :class:`EOSCache` of this EOS."""
+        return self._cache
 
     def gamma(self, cv: ConservedVars = None):
         r"""Get mixture-averaged specific heat ratio for mixture $\frac{C_p}{C_p - R_s}$.
@@ -299,11 +521,7 @@ class PyrometheusMixture(GasEOS):
         """
         if cv is None:
             raise ValueError("EOS.gamma requires ConservedVars (cv) argument.")
-        temperature = self.temperature(cv)
-        y = self.species_fractions(cv)
-        cp = self._pyrometheus_mech.get_mixture_specific_heat_cp_mass(temperature, y)
-        rspec = self.gas_const(cv)
-        return cp / (cp - rspec)
+        return self.dependent_vars(cv).gamma
 
     def gas_const(self, cv: ConservedVars = None):
         r"""Get specific gas constant $R_s$.
@@ -322,8 +540,7 @@ class PyrometheusMixture(GasEOS):
         """
         if cv is None:
             raise ValueError("EOS.gas_const requires ConservedVars (cv) argument.")
-        y = self.species_fractions(cv)
-        return self._pyrometheus_mech.get_specific_gas_constant(y)
+        return self.dependent_vars(cv).gas_const
 
     def kinetic_energy(self, cv: ConservedVars):
         r"""Get kinetic (i.e. not internal) energy of gas.
@@ -377,15 +594,92 @@ class PyrometheusMixture(GasEOS):
         return self._pyrometheus_mech.wts
 
     def get_production_rates(self, cv: ConservedVars):
-        """Get the production rate for each species."""
+        """Get the production rate for each species.
+
+        If an activity criterion was given to the constructor, the active nodes
+        are gathered into dense arrays on the host, the rates are evaluated
+        there only, and the results are scattered back with zero rates at the
+        inactive nodes.
+        """
         temperature = self.temperature(cv)
         y = self.species_fractions(cv)
-        return self._pyrometheus_mech.get_net_production_rates(
-            cv.mass, temperature, y)
+        if not self._uses_activity_mask:
+            return self._pyrometheus_mech.get_net_production_rates(
+                cv.mass, temperature, y)
+
+        actx = cv.array_context
+        key = _discretization_key(cv.mass)
+        host_mech = self._get_host_mechanism()
+        wts = np.asarray(host_mech.wts, dtype=np.float64)[:, None]
+
+        omega_grps = []
+        rate_magnitudes = []
+        active_masks = []
+        for igrp, mass_grp in enumerate(cv.mass):
+            rho = actx.to_numpy(mass_grp).ravel()
+            temp = actx.to_numpy(temperature[igrp]).ravel()
+            active_masks.append(self._get_chemistry_activity(key, igrp, temp))
+            active = np.flatnonzero(active_masks[-1])
+
+            omega = np.zeros((len(y), len(rho)))
+            if len(active):
+                y_active = np.stack(
+                    [actx.to_numpy(y_i[igrp]).ravel()[active] for y_i in y])
+                omega[:, active] = _stack_species(
+                    host_mech.get_net_production_rates(
+                        rho[active], temp[active], y_active),
+                    active.shape)
+
+            omega_grps.append(omega.reshape((len(y),) + mass_grp.shape))
+            rate_magnitudes.append(np.max(np.abs(wts * omega), axis=0))
+
+        self._record_rate_magnitudes(key, rate_magnitudes, active_masks)
+        return _species_dof_arrays(actx, omega_grps)
+
+    @property
+    def _uses_activity_mask(self):
+        return (self._activity_temperature is not None
+                or self._activity_rate is not None)
+
+    def _get_chemistry_activity(self, key, igrp, temperature):
+        """Return the mask of the active nodes of group *igrp* on the host."""
+        if not self._uses_activity_mask:
+            return np.ones(temperature.shape, dtype=bool)
+
+        active = np.zeros(temperature.shape, dtype=bool)
+        if self._activity_temperature is not None:
+            active |= temperature >= self._activity_temperature
+        if self._activity_rate is not None:
+            rate_magnitudes = self._reaction_rate_magnitudes.get(key)
+            nevaluations = self._activity_evaluations.get(key, 0)
+            if (rate_magnitudes is None
+                    or nevaluations % self._activity_recheck_interval == 0):
+                active[:] = True
+            else:
+                active |= rate_magnitudes[igrp] >= self._activity_rate
+        return active
+
+    def _record_rate_magnitudes(self, key, rate_magnitudes, active_masks):
+        """Store the rate magnitudes measured at the active nodes.
+
+        The inactive nodes were not evaluated, so they keep their previous
+        magnitudes rather than zero, which would deactivate them for good.
+        """
+        previous = self._reaction_rate_magnitudes.get(key)
+        if previous is not None:
+            rate_magnitudes = [
+                np.where(active, magnitudes, prev_magnitudes)
+                for magnitudes, prev_magnitudes, active
+                in zip(rate_magnitudes, previous, active_masks)]
+        self._reaction_rate_magnitudes[key] = rate_magnitudes
+        self._activity_evaluations[key] = (
+            self._activity_evaluations.get(key, 0) + 1)
 
     def species_fractions(self, cv: ConservedVars):
         r"""Get species fractions $Y_\alpha$ from species mass density."""
-        return cv.species_mass / cv.mass
+        def get_y():
+            return cv.species_mass / cv.mass
+        return self._cache.get_or_compute("species_fractions", cv, get_y)
 
     def pressure(self, cv: ConservedVars):
         r"""Get thermodynamic pressure of the gas.
@@ -396,13 +690,7 @@ class PyrometheusMixture(GasEOS):
 
             p = (\gamma_{\mathtt{mix}} - 1)e
         """
-        @memoize_in(cv, (PyrometheusMixture.pressure,
-                         type(self._pyrometheus_mech)))
-        def get_pressure():
-            temperature = self.temperature(cv)
-            y = self.species_fractions(cv)
-            return self._pyrometheus_mech.get_pressure(cv.mass, temperature, y)
-        return get_pressure()
+        return self.dependent_vars(cv).pressure
 
     def sound_speed(self, cv: ConservedVars):
         r"""Get the speed of sound in the gas.
@@ -413,14 +701,39 @@ class PyrometheusMixture(GasEOS):
 
             c = \sqrt{\frac{\gamma_{\mathtt{mix}}{p}}{\rho}}
         """
-        @memoize_in(cv, (PyrometheusMixture.sound_speed,
-                         type(self._pyrometheus_mech)))
-        def get_sos():
+        return self.dependent_vars(cv).speed_of_sound
+
+    def dependent_vars(self, cv: ConservedVars,
+                       dd=None) -> MixtureDependentVars:
+        r"""Get all the mixture dependent variables in a single pass.
+
+        The species mass fractions, the temperature, and the mixture-averaged
+        gas constant and heat capacity are evaluated once for *cv*, and the
+        pressure ($p = \rho{R_s}T$), the specific heat ratio, and the speed of
+        sound are derived from them. The result is kept in the EOS cache, and
+        the individual accessors (:meth:`pressure`, :meth:`gamma`, etc.)
+        return its fields. *dd* is passed on to :meth:`temperature`.
+        """
+        def get_dv():
             actx = cv.array_context
-            return actx.np.sqrt((self.gamma(cv) * self.pressure(cv)) / cv.mass)
-        return get_sos()
-
-    def temperature(self, cv: ConservedVars):
+            y = self.species_fractions(cv)
+            temperature = self.temperature(cv, dd=dd)
+            rspec = self._pyrometheus_mech.get_specific_gas_constant(y)
+            cp = self._pyrometheus_mech.get_mixture_specific_heat_cp_mass(
+                temperature, y)
+            gamma = cp / (cp - rspec)
+            rspec_t = rspec * temperature
+            return MixtureDependentVars(
+                temperature=temperature,
+                pressure=cv.mass * rspec_t,
+                speed_of_sound=actx.np.sqrt(gamma * rspec_t),
+                species_mass_fractions=y,
+                gas_const=rspec,
+                specific_heat_cp=cp,
+                gamma=gamma)
+        return self._cache.get_or_compute("dependent_vars", cv, get_dv)
+
+    def temperature(self, cv: ConservedVars, dd=None):
         r"""Get the thermodynamic temperature of the gas.
 
         The thermodynamic temperature ($T$) is calculated from
@@ -430,15 +743,61 @@ class PyrometheusMixture(GasEOS):
         .. math::
 
             T = \frac{(\gamma_{\mathtt{mix}} - 1)e}{R_s \rho}
+
+        With warm starting, the Newton iterations start from the temperature
+        found by the last call for the same discretization. The discretization
+        is identified by *dd*, e.g. the DOF descriptor of *cv*, along with the
+        group shapes of *cv*, so *dd* should be given whenever states on
+        several discretizations of the same shape are evaluated, such as on
+        different boundaries.
         """
-        @memoize_in(cv, (PyrometheusMixture.temperature,
-                         type(self._pyrometheus_mech)))
         def get_temp():
-            y = self.species_fractions(cv)
-            e = self.internal_energy(cv) / cv.mass
-            return self._pyrometheus_mech.get_temperature(e, self._tguess,
-                                                          y, True)
-        return get_temp()
+            # The Newton iterations need double precision, even if the state
+            # is stored in reduced precision
+            y = cast_to_dtype(self.species_fractions(cv), np.float64)
+            e = cast_to_dtype(self.internal_energy(cv) / cv.mass, np.float64)
+            if not self._warm_start:
+                temperature = self._solve_temperature(e, self._tguess, y)
+            else:
+                actx = cv.array_context
+                seed_key = _discretization_key(cv.mass, dd)
+                frozen_seed = self._temperature_seeds.get(seed_key)
+                if frozen_seed is None:
+                    tseed = self._tguess
+                else:
+                    tseed = thaw(frozen_seed, actx)
+                temperature = self._solve_temperature(e, tseed, y)
+                self._temperature_seeds[seed_key] = freeze(temperature, actx)
+            # The seeds are kept in double precision, while the dependent
+            # variables computed from the temperature are in the precision of
+            # the state
+            return cast_to_dtype(temperature, cv.mass.entry_dtype)
+        return self._cache.get_or_compute("temperature", cv, get_temp)
+
+    def _solve_temperature(self, energy, temperature_seed, y):
+        """Find the temperature from the mass-specific internal energy."""
+        return self._pyrometheus_mech.get_temperature(energy, temperature_seed,
+                                                      y, True)
+
+    def get_temperature_seeds(self):
+        """Return the frozen temperature fields used to warm-start the EOS.
+
+        The returned dictionary can be stored in restart data and passed to
+        :meth:`set_temperature_seeds` upon restart.
+        """
+        return dict(self._temperature_seeds)
+
+    def set_temperature_seeds(self, temperature_seeds):
+        """Set the temperature fields used to warm-start the EOS.
+
+        Parameters
+        ----------
+        temperature_seeds: dict
+            As returned by :meth:`get_temperature_seeds`. Fields that do not match
+            the discretizations in use, e.g. after restarting at a different
+            order, are never used.
+        """
+        self._temperature_seeds = dict(temperature_seeds)
 
     def total_energy(self, cv, pressure):
         r"""
@@ -475,3 +834,457 @@ class PyrometheusMixture(GasEOS):
 
         return make_conserved(dim, rho_source, energy_source, mom_source,
                               species_sources)
+
+    def integrate_chemistry(self, cv: ConservedVars, dt, rtol=1e-6, atol=1e-10):
+        r"""Advance the species by the chemical reactions alone over *dt*.
+
+        The node-local kinetics
+        $\frac{d Y_\alpha}{dt} = \frac{W_\alpha \dot{\omega}_\alpha}{\rho}$,
+        at constant density $\rho$ and internal energy, are integrated for all
+        nodes at once with :func:`~mirgecom.integrators.rosenbrock23_integrate`,
+        on the host. This is the reaction substep of an operator-split time
+        integration, see :func:`mirgecom.steppers.make_operator_split_timestepper`,
+        and replaces adding :meth:`get_species_source_terms` to the RHS.
+
+        If an activity criterion was given to the constructor, only the active
+        nodes are integrated, and the species at the other nodes are unchanged.
+
+        Parameters
+        ----------
+        cv: :class:`mirgecom.fluid.ConservedVars`
+            The state to advance
+        dt: float
+            The time interval
+        rtol: float
+            Relative tolerance on the mass fractions
+        atol: float
+            Absolute tolerance on the mass fractions
+
+        Returns
+        -------
+        :class:`mirgecom.fluid.ConservedVars`
+            The state with advanced species masses
+        """
+        from mirgecom.integrators import rosenbrock23_integrate
+
+        actx = cv.array_context
+        host_mech = self._get_host_mechanism()
+        wts = np.asarray(host_mech.wts, dtype=np.float64)[:, None]
+
+        y_dev = self.species_fractions(cv)
+        e_dev = self.internal_energy(cv) / cv.mass
+        temperature_dev = self.temperature(cv)
+
+        key = _discretization_key(cv.mass)
+
+        species_mass_grps = []
+        rate_magnitudes = []
+        active_masks = []
+        for igrp, mass_grp in enumerate(cv.mass):
+            rho = actx.to_numpy(mass_grp).ravel()
+            y = np.stack([actx.to_numpy(y_i[igrp]).ravel() for y_i in y_dev])
+            temperature = actx.to_numpy(temperature_dev[igrp]).ravel()
+            active_masks.append(
+                self._get_chemistry_activity(key, igrp, temperature))
+            active = np.flatnonzero(active_masks[-1])
+
+            y_new = y.copy()
+            if len(active):
+                rho_active = rho[active]
+                energy = actx.to_numpy(e_dev[igrp]).ravel()[active]
+                temperature = temperature[active]
+
+                def rhs(y, nodes):
+                    # The last temperature at each node seeds the next solve
+                    temp = host_mech.get_temperature(
+                        energy[nodes], temperature[nodes], y, True)
+                    temperature[nodes] = temp
+                    omega = host_mech.get_net_production_rates(
+                        rho_active[nodes], temp, y)
+                    return wts * _stack_species(omega, temp.shape) \
+                        / rho_active[nodes]
+
+                y_new[:, active] = rosenbrock23_integrate(
+                    rhs, y[:, active], dt, rtol=rtol, atol=atol)
+
+            species_mass_grps.append((rho * y_new).reshape(
+                (len(y_dev),) + mass_grp.shape))
+            rate_magnitudes.append(rho * np.max(np.abs(y_new - y), axis=0) / dt)
+
+        self._record_rate_magnitudes(key, rate_magnitudes, active_masks)
+        return make_conserved(cv.dim, mass=cv.mass, energy=cv.energy,
+                              momentum=cv.momentum,
+                              species_mass=_species_dof_arrays(
+                                  actx, species_mass_grps))
+
+    def get_host_side_features(self):
+        """Return descriptions of the enabled features that work on the host."""
+        features = []
+        if self._warm_start:
+            features.append("temperature warm-start seeds (warm_start=True)")
+        if self._uses_activity_mask:
+            features.append("host-side chemistry activity masking "
+                            "(activity_temperature, activity_rate)")
+        return features
+
+    def _get_host_mechanism(self):
+        """Return a :mod:`numpy`-based instance of the mechanism class."""
+        if self._host_mech is None:
+            self._host_mech = type(self._pyrometheus_mech)(np)
+        return self._host_mech
+
+
+class TabulatedPyrometheusMixture(PyrometheusMixture):
+    r"""Pyrometheus-based mixture EOS with a tabulated temperature inversion.
+
+    Instead of Newton iterations started from a guess, the temperature is
+    found from the mass-specific internal energy $e$ and the mass fractions
+    $Y_\alpha$ by looking up $e = \sum_\alpha Y_\alpha e_\alpha(T)$ in tables
+    of the species internal energies $e_\alpha$ on a uniform temperature grid,
+    interpolating linearly within the bracketing interval, and applying a
+    single Newton correction with the exact mixture energy and heat capacity.
+
+    The lookup is a vectorized bisection over the table intervals, carried out
+    on the host, and is bounded: energies outside of the table are clamped to
+    its end points before the correction step. The tables only depend on the
+    thermodynamic data of the mechanism, so they are built once and stored in
+    a :class:`pytools.persistent_dict.WriteOncePersistentDict`.
+
+    .. automethod:: __init__
+
+    Inherits from (and implements) :class:`PyrometheusMixture`.
+    """
+
+    def __init__(self, pyrometheus_mech, temperature_min=200.0,
+                 temperature_max=4000.0, temperature_step=5.0,
+                 table_cache_dir=None, **kwargs):
+        """Initialize the EOS and build (or load) the energy tables.
+
+        Parameters
+        ----------
+        pyrometheus_mech: :class:`pyrometheus.Thermochemistry`
+            The :mod:`pyrometheus` mechanism object, see
+            :class:`PyrometheusMixture`.
+        temperature_min: float
+            Lower bound of the tabulated temperature range.
+        temperature_max: float
+            Upper bound of the tabulated temperature range.
+        temperature_step: float
+            Spacing of the temperature grid.
+        table_cache_dir: str
+            Directory in which to store the tables. Defaults to the
+            :mod:`pytools` user cache directory.
+
+        Further keyword arguments, such as *cache* or *activity_temperature*,
+        are passed on to :class:`PyrometheusMixture`. The table lookup needs
+        no starting guess, so warm starting is not supported.
+        """
+        if kwargs.pop("warm_start", False):
+            raise ValueError("TabulatedPyrometheusMixture does not support "
+                             "warm_start.")
+        super().__init__(pyrometheus_mech, warm_start=False, **kwargs)
+
+        ntemperatures = int(np.ceil(
+            (temperature_max - temperature_min) / temperature_step)) + 1
+        self._temperature_table = np.linspace(temperature_min, temperature_max,
+                                              ntemperatures)
+        self._species_energy_table = _get_species_energy_table(
+            pyrometheus_mech, self._temperature_table, table_cache_dir)
+
+    def get_host_side_features(self):
+        """Return descriptions of the enabled features that work on the host."""
+        return (super().get_host_side_features()
+                + ["host-side tabulated temperature lookup"])
+
+    def _lookup_temperature(self, energy, y):
+        """Return the table estimate of the temperature on the host.
+
+        *energy* is a :class:`numpy.ndarray` of mass-specific internal
+        energies, and *y* the array of mass fractions with the species on its
+        first axis.
+        """
+        temperatures = self._temperature_table
+        species_energies = self._species_energy_table
+
+        energy = energy.reshape(-1)
+        y = y.reshape(len(species_energies), -1)
+
+        def mixture_energy(idx):
+            return np.einsum("in,in->n", y, species_energies[:, idx])
+
+        lower = np.zeros(energy.shape, dtype=np.intp)
+        upper = np.full(energy.shape, len(temperatures) - 1, dtype=np.intp)
+        for _ in range(int(np.ceil(np.log2(len(temperatures) - 1)))):
+            mid = (lower + upper) // 2
+            below = mixture_energy(mid) <= energy
+            # Intervals that are already down to one table step stay put
+            # (mid == lower there), so that out-of-range energies are clamped
+            below |= (upper - lower) <= 1
+            lower = np.where(below, mid, lower)
+            upper = np.where(below, upper, mid)
+
+        e_lower = mixture_energy(lower)
+        e_upper = mixture_energy(upper)
+        frac = np.clip((energy - e_lower) / (e_upper - e_lower), 0, 1)
+        return (temperatures[lower]
+                + frac * (temperatures[upper] - temperatures[lower]))
+
+    def _solve_temperature(self, energy, temperature_seed, y):
+        """Find the temperature by table lookup and one Newton correction."""
+        actx = energy.array_context
+
+        temperature = DOFArray(actx, tuple(
+            actx.from_numpy(
+                self._lookup_temperature(
+                    actx.to_numpy(e_grp),
+                    np.stack([actx.to_numpy(y_i[igrp]) for y_i in y])
+                ).reshape(e_grp.shape))
+            for igrp, e_grp in enumerate(energy)))
+
+        mech = self._pyrometheus_mech
+        return temperature + (
+            (energy - mech.get_mixture_internal_energy_mass(temperature, y))
+            / mech.get_mixture_specific_heat_cv_mass(temperature, y))
+
+
+class FrozenRateChemistry:
+    r"""Species source terms that are reused across RHS evaluations.
+
+    When the flow time step is much smaller than the chemical time scales, the
+    production rates change little from one RHS evaluation to the next. This
+    wrapper evaluates :meth:`PyrometheusMixture.get_species_source_terms` of
+    *eos*, and then returns the same (frozen) source terms for up to
+    *max_reuse* subsequent calls. With an $s$-stage time integrator, reusing
+    the rates for $n$ steps corresponds to *max_reuse* $= ns - 1$.
+
+    The rates are refreshed early when the temperature at any node has changed
+    by more than *temperature_tolerance* since they were evaluated, so that
+    igniting regions are tracked closely. This check needs the temperature,
+    which the RHS typically computes anyway, so that it is shared through the
+    :attr:`PyrometheusMixture.cache`.
+
+    .. attribute:: max_reuse
+    .. attribute:: temperature_tolerance
+    .. attribute:: evaluations
+
+        Number of calls that evaluated the source terms.
+
+    .. attribute:: skips
+
+        Number of calls that reused frozen source terms.
+
+    .. automethod:: __init__
+    .. automethod:: get_species_source_terms
+    .. automethod:: reset
+    """
+
+    def __init__(self, eos, max_reuse=3, temperature_tolerance=5.0):
+        """Wrap the chemistry of *eos*, a :class:`PyrometheusMixture`."""
+        if max_reuse < 0:
+            raise ValueError("FrozenRateChemistry requires max_reuse >= 0.")
+        self._eos = eos
+        self.max_reuse = max_reuse
+        self.temperature_tolerance = temperature_tolerance
+        self.evaluations = 0
+        self.skips = 0
+        self._frozen = {}
+
+    def get_species_source_terms(self, cv: ConservedVars):
+        """Get the species mass source terms, reusing recent ones if possible.
+
+        Frozen source terms are kept per discretization, so that, e.g., several
+        grids can share one instance.
+        """
+        actx = cv.array_context
+        key = _discretization_key(cv.mass)
+        temperature = self._eos.temperature(cv)
+
+        entry = self._frozen.get(key)
+        if entry is not None and entry["reuses"] < self.max_reuse:
+            temperature_change = max(
+                np.max(np.abs(actx.to_numpy(temp_grp) - ref_grp), initial=0)
+                for temp_grp, ref_grp in zip(temperature,
+                                             entry["temperature"]))
+            if temperature_change <= self.temperature_tolerance:
+                entry["reuses"] += 1
+                self.skips += 1
+                return thaw(entry["sources"], actx)
+
+        self.evaluations += 1
+        sources = self._eos.get_species_source_terms(cv)
+        self._frozen[key] = {
+            "sources": freeze(sources, actx),
+            "temperature": [actx.to_numpy(temp_grp) for temp_grp in temperature],
+            "reuses": 0}
+        return sources
+
+    def reset(self):
+        """Discard the frozen source terms, keeping the counts.
+
+        Call this when the state changes discontinuously, e.g. after a restart
+        or a change of the time step.
+        """
+        self._frozen.clear()
+
+
+def _get_species_energy_table(pyrometheus_mech, temperatures, cache_dir=None):
+    """Return the mass-specific species internal energies at *temperatures*.
+
+    The table is evaluated with a host (:mod:`numpy`) instance of the mechanism
+    class and is cached on disk, keyed by the species, their molecular weights,
+    the temperature grid, and a sample of the species energies that stands in
+    for the thermodynamic data of the mechanism.
+    """
+    from pytools.persistent_dict import (
+        WriteOncePersistentDict, NoSuchEntryError)
+
+    host_mech = type(pyrometheus_mech)(np)
+
+    def species_energies(temps):
+        e_rt = host_mech.get_species_internal_energies_rt(temps)
+        return np.array([
+            np.broadcast_to(e_rt[i], temps.shape)
+            * host_mech.gas_constant * temps / host_mech.wts[i]
+            for i in range(host_mech.num_species)])
+
+    probe_temperatures = np.linspace(temperatures[0], temperatures[-1], 7)
+    key = (tuple(host_mech.species_names),
+           tuple(float(w) for w in host_mech.wts),
+           tuple(float(t) for t in temperatures),
+           tuple(float(e) for e in
+                 species_energies(probe_temperatures).ravel()))
+
+    table_cache = WriteOncePersistentDict(
+        "mirgecom-species-energy-tables-v1", container_dir=cache_dir)
+    try:
+        return table_cache.fetch(key)
+    except NoSuchEntryError:
+        table = species_energies(temperatures)
+        table_cache.store_if_not_present(key, table)
+        return table
+
+
+def _stack_species(values, shape):
+    """Stack the per-species host *values*, broadcasting constants to *shape*."""
+    return np.stack([np.broadcast_to(value, shape) for value in values])
+
+
+def _species_dof_arrays(actx, grp_arrays):
+    """Return an object array of per-species DOF arrays from host group data.
+
+    *grp_arrays* holds one array per element group, with the species on the
+    first axis.
+    """
+    nspecies = len(grp_arrays[0])
+    return make_obj_array([
+        DOFArray(actx, tuple(actx.from_numpy(grp_ary[i].copy())
+                             for grp_ary in grp_arrays))
+        for i in range(nspecies)])
+
+
+def _discretization_key(ary, dd=None):
+    """Return a key identifying the discretization on which *ary* lives.
+
+    A :class:`~meshmode.dof_array.DOFArray` does not know its discretization,
+    so its group shapes stand in for it, along with *dd*, if given, which tells
+    apart discretizations of the same shape.
+    """
+    return (dd, tuple(grp_ary.shape for grp_ary in ary))
+
+
+@dataclass_array_container
+@dataclass(frozen=True)
+class FluidState:
+    r"""Gas state along with the quantities derived from it by the EOS.
+
+    A :class:`FluidState` is meant to be created once per state evaluation, e.g.
+    once on the volume and once on each face per RHS evaluation, and then to be
+    handed to the flux, wavespeed, and boundary routines so that they need not
+    call back into the EOS.
+
+    .. attribute:: cv
+
+        :class:`~mirgecom.fluid.ConservedVars` for the fluid conserved state
+
+    .. attribute:: dv
+
+        :class:`EOSDependentVars` computed by the EOS from :attr:`cv`
+
+    .. attribute:: velocity
+
+        Object array of :class:`~meshmode.dof_array.DOFArray` with the fluid
+        velocity $\vec{V} = \frac{\rho\vec{V}}{\rho}$
+
+    .. autoattribute:: pressure
+    .. autoattribute:: temperature
+    .. autoattribute:: speed_of_sound
+    """
+
+    cv: ConservedVars
+    dv: EOSDependentVars
+    velocity: np.ndarray
+
+    @property
+    def array_context(self):
+        """Return the array context of the fluid state."""
+        return self.cv.array_context
+
+    @property
+    def dim(self):
+        """Return the number of physical dimensions."""
+        return self.cv.dim
+
+    @property
+    def pressure(self):
+        """Return the gas pressure."""
+        return self.dv.pressure
+
+    @property
+    def temperature(self):
+        """Return the gas temperature."""
+        return self.dv.temperature
+
+    @property
+    def speed_of_sound(self):
+        """Return the speed of sound in the gas."""
+        return self.dv.speed_of_sound
+
+
+def make_fluid_state(cv: ConservedVars, eos: GasEOS, dd=None) -> FluidState:
+    """Create a :class:`FluidState` from the conserved state *cv* using *eos*.
+
+    The dependent variables are evaluated exactly once here, by
+    :meth:`GasEOS.dependent_vars`, to which *dd*, identifying the
+    discretization of *cv*, is passed on.
+    """
+    return FluidState(cv=cv, dv=eos.dependent_vars(cv, dd=dd),
+                      velocity=cv.velocity)
+
+
+def make_fluid_state_trace_pair(cv_tpair, eos: GasEOS):
+    """Create a trace pair of :class:`FluidState` from a trace pair of states.
+
+    Parameters
+    ----------
+    cv_tpair: :class:`grudge.trace_pair.TracePair`
+        Trace pair of :class:`~mirgecom.fluid.ConservedVars` for the face
+    eos: :class:`GasEOS`
+        The EOS used to compute the dependent variables on each side of the face
+
+    Returns
+    -------
+    :class:`grudge.trace_pair.TracePair`
+        Trace pair of :class:`FluidState` for the face. If the interior and
+        exterior states of *cv_tpair* are the same object, the dependent
+        variables are only computed once. The EOS is given the DOF descriptor
+        of the trace as the *dd* of the interior state, and
+        ``(dd, "exterior")`` as that of the exterior state, see
+        :meth:`GasEOS.dependent_vars`.
+    """
+    int_state = make_fluid_state(cv_tpair.int, eos, dd=cv_tpair.dd)
+    if cv_tpair.ext is cv_tpair.int:
+        ext_state = int_state
+    else:
+        ext_state = make_fluid_state(cv_tpair.ext, eos,
+                                     dd=(cv_tpair.dd, "exterior"))
+    return TracePair(cv_tpair.dd, interior=int_state, exterior=ext_state)
@@ -53,25 +53,32 @@ THE SOFTWARE.
 """
 
 import numpy as np  # noqa
-from meshmode.dof_array import thaw
+from arraycontext import rec_map_array_container
+from grudge.dof_desc import DOFDesc, DISCR_TAG_BASE, as_dofdesc
 from grudge.symbolic.primitives import TracePair
-from grudge.eager import (
-    interior_trace_pair,
-    cross_rank_trace_pairs
+from mirgecom.fluid import split_conserved
+from mirgecom.geometry import get_normal
+from mirgecom.eos import (
+    FluidState,
+    make_fluid_state,
+    make_fluid_state_trace_pair
 )
-from mirgecom.fluid import (
-    compute_wavespeed,
-    split_conserved,
+from mirgecom.trace_pair import (
+    start_cross_rank_trace_pairs,
+    finish_cross_rank_trace_pairs
 )
 
 from mirgecom.inviscid import (
     inviscid_flux
 )
-from functools import partial
-from mirgecom.flux import lfr_flux
+from mirgecom.flux import (
+    rusanov_flux,
+    get_numerical_flux
+)
 
 
-def _facial_flux(discr, eos, cv_tpair, local=False):
+def _facial_flux(discr, eos, cv_tpair=None, local=False, state_tpair=None,
+                 numerical_flux_func=rusanov_flux):
     """Return the flux across a face given the solution on both sides *cv_tpair*.
 
     Parameters
@@ -88,29 +95,159 @@ def _facial_flux(discr, eos, cv_tpair, local=False):
         set to *False* (the default), the returned fluxes are projected to
         "all_faces."  If set to *True*, the returned fluxes are not projected to
         "all_faces"; remaining instead on the boundary restriction.
+
+    state_tpair: :class:`grudge.trace_pair.TracePair`
+        Optional trace pair of :class:`~mirgecom.eos.FluidState` for the face. If
+        given, *cv_tpair* is not needed, and the dependent variables are taken
+        from *state_tpair* instead of being computed by *eos*. The flux is
+        computed on the discretization of the trace pair, which may be a
+        quadrature discretization of the face.
+
+    numerical_flux_func:
+        The numerical flux function, see :mod:`mirgecom.flux`. Defaults to
+        :func:`~mirgecom.flux.rusanov_flux`.
     """
-    actx = cv_tpair.int.array_context
-    dim = cv_tpair.int.dim
+    if state_tpair is None:
+        state_tpair = make_fluid_state_trace_pair(cv_tpair, eos)
 
-    euler_flux = partial(inviscid_flux, discr, eos)
-    lam = actx.np.maximum(
-        compute_wavespeed(dim, eos, cv_tpair.int),
-        compute_wavespeed(dim, eos, cv_tpair.ext)
-    )
-    normal = thaw(actx, discr.normal(cv_tpair.dd))
+    actx = state_tpair.int.array_context
+    normal = get_normal(actx, discr, state_tpair.dd,
+                        dtype=state_tpair.int.cv.mass.entry_dtype)
+
+    flux_tpair = TracePair(
+        state_tpair.dd,
+        interior=inviscid_flux(discr, eos, state_tpair.int.cv,
+                               state=state_tpair.int),
+        exterior=inviscid_flux(discr, eos, state_tpair.ext.cv,
+                               state=state_tpair.ext))
 
-    # todo: user-supplied flux routine
-    flux_weak = lfr_flux(cv_tpair=cv_tpair, flux_func=euler_flux,
-                         normal=normal, lam=lam)
+    flux_weak = numerical_flux_func(state_tpair=state_tpair, f_tpair=flux_tpair,
+                                    normal=normal)
 
     if local is False:
-        return discr.project(cv_tpair.dd, "all_faces", flux_weak)
+        dd = as_dofdesc(state_tpair.dd)
+        return discr.project(dd, dd.with_dtag("all_faces"), flux_weak)
     return flux_weak
 
 
-def euler_operator(discr, eos, boundaries, cv, t=0.0):
+def _project_tpair(discr, tpair, quad_tag):
+    """Project both sides of *tpair* to the *quad_tag* discretization of its faces.
+
+    If the interior and exterior of *tpair* are the same object, so are those of
+    the projected trace pair.
+    """
+    dd = as_dofdesc(tpair.dd)
+    dd_quad = dd.with_discr_tag(quad_tag)
+    if dd_quad == dd:
+        return tpair
+    interior = discr.project(dd, dd_quad, tpair.int)
+    if tpair.ext is tpair.int:
+        exterior = interior
+    else:
+        exterior = discr.project(dd, dd_quad, tpair.ext)
+    return TracePair(dd_quad, interior=interior, exterior=exterior)
+
+
+def _interior_facial_flux(discr, eos, cv, quad_tag=DISCR_TAG_BASE,
+                          numerical_flux_func=rusanov_flux):
+    """Return the flux across the interior faces, projected to "all_faces".
+
+    Each interior face appears twice on the "int_faces" discretization, once
+    as seen from each of its neighboring elements. Rather than evaluating the
+    dependent variables for both sides of the trace pair, they are evaluated
+    for the interior side only, and the exterior ones are gathered from the
+    opposite face nodes along with the exterior state. This avoids a second,
+    possibly iterative, EOS evaluation (e.g. the temperature solve of
+    :class:`~mirgecom.eos.PyrometheusMixture`) at the cost of gathering the
+    dependent variables. The exterior velocity and physical flux are cheap
+    pointwise functions of the gathered quantities and are not gathered. The
+    opposite-face gather is only available on the base discretization, so with
+    overintegration both sides are evaluated on the face quadrature nodes.
+
+    Parameters
+    ----------
+    eos: mirgecom.eos.GasEOS
+        Implementing the pressure and temperature functions for
+        returning pressure and temperature as a function of the state q.
+
+    cv: :class:`~mirgecom.fluid.ConservedVars`
+        Fluid conserved state on the volume
+
+    quad_tag
+        The discretization tag of the face quadrature on which to compute the
+        flux. Defaults to the base discretization.
+
+    numerical_flux_func:
+        The numerical flux function, see :mod:`mirgecom.flux`. Defaults to
+        :func:`~mirgecom.flux.rusanov_flux`.
+    """
+    dd_int = DOFDesc("int_faces", DISCR_TAG_BASE)
+    cv_int = discr.project("vol", dd_int, cv)
+
+    opposite_face = discr.opposite_face_connection()
+
+    def _exterior(ary):
+        return rec_map_array_container(opposite_face, ary)
+
+    if quad_tag != DISCR_TAG_BASE:
+        cv_tpair = _project_tpair(
+            discr, TracePair(dd_int, interior=cv_int, exterior=_exterior(cv_int)),
+            quad_tag)
+        return _facial_flux(discr, eos,
+                            state_tpair=make_fluid_state_trace_pair(cv_tpair, eos),
+                            numerical_flux_func=numerical_flux_func)
+
+    int_state = make_fluid_state(cv_int, eos, dd=dd_int)
+    actx = int_state.array_context
+
+    cv_ext = _exterior(cv_int)
+    ext_state = FluidState(cv=cv_ext, dv=_exterior(int_state.dv),
+                           velocity=cv_ext.velocity)
+    state_tpair = TracePair(dd_int, interior=int_state, exterior=ext_state)
+
+    normal = get_normal(actx, discr, dd_int, dtype=cv.mass.entry_dtype)
+
+    flux_tpair = TracePair(
+        dd_int,
+        interior=inviscid_flux(discr, eos, int_state.cv, state=int_state),
+        exterior=inviscid_flux(discr, eos, ext_state.cv, state=ext_state))
+
+    flux_weak = numerical_flux_func(state_tpair=state_tpair, f_tpair=flux_tpair,
+                                    normal=normal)
+
+    return discr.project(dd_int, dd_int.with_dtag("all_faces"), flux_weak)
+
+
+def _boundary_state_pair(discr, eos, boundary, btag, cv, t,
+                         quad_tag=DISCR_TAG_BASE):
+    """Get the fluid state trace pair on *btag* from *boundary*.
+
+    Boundaries that do not implement
+    :meth:`~mirgecom.boundary.FluidBoundary.boundary_state_pair` get their
+    dependent variables computed from their
+    :meth:`~mirgecom.boundary.FluidBoundary.boundary_pair`. With
+    overintegration, the boundary states are projected to the face quadrature
+    and the dependent variables are computed there.
+    """
+    if quad_tag != DISCR_TAG_BASE:
+        cv_tpair = boundary.boundary_pair(discr, eos=eos, btag=btag, t=t, cv=cv)
+        return make_fluid_state_trace_pair(
+            _project_tpair(discr, cv_tpair, quad_tag), eos)
+    if hasattr(boundary, "boundary_state_pair"):
+        return boundary.boundary_state_pair(discr, eos=eos, btag=btag, t=t, cv=cv)
+    return make_fluid_state_trace_pair(
+        boundary.boundary_pair(discr, eos=eos, btag=btag, t=t, cv=cv), eos)
+
+
+def euler_operator(discr, eos, boundaries, cv, t=0.0,
+                   numerical_flux_func=rusanov_flux, quad_tag=DISCR_TAG_BASE):
     r"""Compute RHS of the Euler flow equations.
 
+    The dependent variables (pressure, temperature, speed of sound, and velocity)
+    are computed once for the volume state and once for each face state, see
+    :class:`~mirgecom.eos.FluidState`, and are shared by the flux, wavespeed,
+    and boundary routines.
+
     Returns
     -------
     numpy.ndarray
@@ -136,35 +273,71 @@ def euler_operator(discr, eos, boundaries, cv, t=0.0):
         Implementing the pressure and temperature functions for
         returning pressure and temperature as a function of the state q.
 
+    numerical_flux_func
+        The numerical flux function used on all faces, or the name of one
+        registered with :func:`~mirgecom.flux.get_numerical_flux`. Defaults to
+        :func:`~mirgecom.flux.rusanov_flux`.
+
+    quad_tag
+        The discretization tag of the quadrature on which the volume and face
+        fluxes, and the dependent variables they need, are evaluated. Defaults
+        to the base discretization; a quadrature discretization of higher degree
+        overintegrates the fluxes to control aliasing.
+
     Returns
     -------
     numpy.ndarray
         Agglomerated object array of DOF arrays representing the RHS of the Euler
         flow equations.
     """
-    vol_weak = discr.weak_div(inviscid_flux(discr=discr, eos=eos, cv=cv).join())
+    if isinstance(numerical_flux_func, str):
+        numerical_flux_func = get_numerical_flux(numerical_flux_func)
 
-    boundary_flux = (
-        _facial_flux(discr=discr, eos=eos, cv_tpair=interior_trace_pair(discr, cv))
-        + sum(
-            _facial_flux(
-                discr, eos=eos,
-                cv_tpair=TracePair(
-                    part_pair.dd,
-                    interior=split_conserved(discr.dim, part_pair.int),
-                    exterior=split_conserved(discr.dim, part_pair.ext)))
-            for part_pair in cross_rank_trace_pairs(discr, cv.join()))
+    # Post the halo exchange first so that it overlaps with the rank-local work
+    cv_exchange = start_cross_rank_trace_pairs(discr, cv.join())
+
+    dd_quad = DOFDesc("vol", quad_tag)
+    dd_allfaces_quad = DOFDesc("all_faces", quad_tag)
+
+    cv_quad = discr.project("vol", dd_quad, cv)
+    state_quad = make_fluid_state(cv_quad, eos, dd=dd_quad)
+    vol_weak = discr.weak_div(
+        dd_quad,
+        inviscid_flux(discr=discr, eos=eos, cv=cv_quad, state=state_quad).join())
+
+    local_flux = (
+        _interior_facial_flux(discr, eos=eos, cv=cv, quad_tag=quad_tag,
+                              numerical_flux_func=numerical_flux_func)
         + sum(
             _facial_flux(
                 discr=discr, eos=eos,
-                cv_tpair=boundaries[btag].boundary_pair(
-                    discr, eos=eos, btag=btag, t=t, cv=cv)
-            )
+                state_tpair=_boundary_state_pair(
+                    discr, eos=eos, boundary=boundaries[btag], btag=btag, t=t,
+                    cv=cv, quad_tag=quad_tag),
+                numerical_flux_func=numerical_flux_func)
             for btag in boundaries)
+    )
+
+    boundary_flux = (
+        local_flux
+        + sum(
+            _facial_flux(
+                discr, eos=eos,
+                state_tpair=make_fluid_state_trace_pair(
+                    _project_tpair(discr, TracePair(
+                        part_pair.dd,
+                        interior=split_conserved(discr.dim, part_pair.int),
+                        exterior=split_conserved(discr.dim, part_pair.ext)),
+                        quad_tag),
+                    eos),
+                numerical_flux_func=numerical_flux_func)
+            for part_pair in finish_cross_rank_trace_pairs(cv_exchange))
     ).join()
 
     return split_conserved(
-        discr.dim, discr.inverse_mass(vol_weak - discr.face_mass(boundary_flux))
+        discr.dim,
+        discr.inverse_mass(
+            vol_weak - discr.face_mass(dd_allfaces_quad, boundary_flux))
     )
 
 
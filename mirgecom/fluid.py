@@ -8,6 +8,12 @@ State Vector Handling
 .. autofunction:: join_conserved
 .. autofunction:: make_conserved
 
+Packed State Storage
+^^^^^^^^^^^^^^^^^^^^
+
+.. autoclass:: PackedConservedVars
+.. autofunction:: pack_conserved
+
 Helper Functions
 ^^^^^^^^^^^^^^^^
 
@@ -40,6 +46,7 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 THE SOFTWARE.
 """
 import numpy as np  # noqa
+from pytools import memoize
 from pytools.obj_array import make_obj_array
 from meshmode.dof_array import DOFArray  # noqa
 from dataclasses import dataclass, fields
@@ -294,8 +301,12 @@ def split_conserved(dim, q):
     masses, from an agglomerated object array, *q*. For single component gases,
     i.e. for those state vectors *q* that do not contain multi-species mixtures, the
     returned dataclass :attr:`ConservedVars.species_mass` will be set to an empty
-    array.
+    array. For a :class:`PackedConservedVars` *q*, the returned dataclass holds
+    views into the packed buffer.
     """
+    if isinstance(q, PackedConservedVars):
+        return q.unpack()
+
     nspec = get_num_species(dim, q)
     return ConservedVars(mass=q[0], energy=q[1], momentum=q[2:2+dim],
                          species_mass=q[2+dim:2+dim+nspec])
@@ -338,6 +349,138 @@ def make_conserved(dim, mass, energy, momentum, species_mass=None):
     )
 
 
+class PackedConservedVars:
+    r"""Fluid conserved variables stored in one contiguous buffer per group.
+
+    For each element group, all $N_{\text{eq}}$ equations are stored in one
+    array of shape ``(neq, nelements, ndofs)``, in the order of
+    :func:`join_conserved`. Container arithmetic then acts on the whole state in
+    one operation per element group, rather than one per equation, which pays
+    off for mixtures with many species. Create instances with
+    :func:`pack_conserved`.
+
+    The attributes :attr:`mass`, :attr:`energy`, :attr:`momentum`, and
+    :attr:`species_mass` are views into the buffer, so that
+    :meth:`unpack` and :meth:`join` do not move any data. Discretization
+    operators expect per-equation arrays, so a right-hand side typically
+    computes on :meth:`unpack` of its input and packs its result::
+
+        def rhs(t, state):
+            return pack_conserved(euler_operator(discr, cv=state.unpack(), t=t,
+                                                 boundaries=boundaries, eos=eos))
+
+    .. attribute:: data
+
+        :class:`~meshmode.dof_array.DOFArray` holding the packed buffer of each
+        element group.
+
+    .. attribute:: dim
+    .. attribute:: nspecies
+    .. attribute:: mass
+    .. attribute:: energy
+    .. attribute:: momentum
+    .. attribute:: species_mass
+
+    .. automethod:: unpack
+    .. automethod:: join
+    """
+
+    dim = None
+
+    @property
+    def array_context(self):
+        """Return an array context for the :class:`PackedConservedVars` object."""
+        return self.data.array_context
+
+    @property
+    def nspecies(self):
+        """Return the number of mixture species."""
+        return self.data[0].shape[0] - (self.dim + 2)
+
+    def _component(self, i):
+        """Return a view of equation *i* as a :class:`DOFArray`."""
+        return DOFArray(self.data.array_context,
+                        tuple(grp_ary[i] for grp_ary in self.data))
+
+    @property
+    def mass(self):
+        """Return a view of the mass density."""
+        return self._component(0)
+
+    @property
+    def energy(self):
+        """Return a view of the energy density."""
+        return self._component(1)
+
+    @property
+    def momentum(self):
+        """Return an object array of views of the momentum density components."""
+        return make_obj_array([self._component(2 + i) for i in range(self.dim)])
+
+    @property
+    def species_mass(self):
+        """Return an object array of views of the species mass densities."""
+        return make_obj_array([self._component(2 + self.dim + i)
+                               for i in range(self.nspecies)])
+
+    @property
+    def velocity(self):
+        """Return the fluid velocity = momentum / mass."""
+        return self.momentum / self.mass
+
+    def unpack(self):
+        """Return a :class:`ConservedVars` of views into the packed buffer."""
+        return ConservedVars(mass=self.mass, energy=self.energy,
+                             momentum=self.momentum,
+                             species_mass=self.species_mass)
+
+    def join(self):
+        """Call :func:`join_conserved` on the views into the packed buffer."""
+        return self.unpack().join()
+
+    def __reduce__(self):
+        """Return a tuple reproduction of self for pickling."""
+        return (_make_packed_conserved_vars, (self.dim, self.data))
+
+
+@memoize
+def _get_packed_conserved_vars_class(dim):
+    """Return the array container class of :class:`PackedConservedVars` for *dim*.
+
+    The dimension is needed to tell momentum from species apart in the buffer,
+    but is not an array, so it is a class attribute of a per-dimension class.
+    """
+    @with_container_arithmetic(bcast_obj_array=False, rel_comparison=True)
+    @dataclass_array_container
+    @dataclass(frozen=True)
+    class _PackedConservedVars(PackedConservedVars):
+        data: DOFArray
+
+    _PackedConservedVars.dim = dim
+    _PackedConservedVars.__name__ = f"PackedConservedVars{dim}D"
+    return _PackedConservedVars
+
+
+def _make_packed_conserved_vars(dim, data):
+    return _get_packed_conserved_vars_class(dim)(data=data)
+
+
+def pack_conserved(cv: ConservedVars):
+    """Copy the scalar fields of *cv* into a :class:`PackedConservedVars`.
+
+    A :class:`PackedConservedVars` is returned unchanged.
+    """
+    if isinstance(cv, PackedConservedVars):
+        return cv
+
+    actx = cv.array_context
+    components = list(cv.join())
+    data = DOFArray(actx, tuple(
+        actx.np.stack([component[igrp] for component in components])
+        for igrp in range(len(cv.mass))))
+    return _make_packed_conserved_vars(cv.dim, data)
+
+
 def velocity_gradient(discr, cv, grad_cv):
     r"""
     Compute the gradient of fluid velocity.
@@ -423,7 +566,7 @@ def species_mass_fraction_gradient(discr, cv, grad_cv):
                                        for i in range(nspecies)])
 
 
-def compute_wavespeed(dim, eos, cv: ConservedVars):
+def compute_wavespeed(dim, eos, cv: ConservedVars, state=None):
     r"""Return the wavespeed in the flow.
 
     The wavespeed is calculated as:
@@ -433,7 +576,15 @@ def compute_wavespeed(dim, eos, cv: ConservedVars):
         s_w = \|\mathbf{v}\| + c,
 
     where $\mathbf{v}$ is the flow velocity and c is the speed of sound in the fluid.
+
+    If a :class:`~mirgecom.eos.FluidState` for *cv* is given in *state*, its
+    velocity and speed of sound are used instead of being recomputed.
     """
     actx = cv.array_context
-    v = cv.velocity
-    return actx.np.sqrt(np.dot(v, v)) + eos.sound_speed(cv)
+    if state is None:
+        v = cv.velocity
+        sos = eos.sound_speed(cv)
+    else:
+        v = state.velocity
+        sos = state.speed_of_sound
+    return actx.np.sqrt(np.dot(v, v)) + sos
@@ -4,6 +4,26 @@ Numerical Flux Routines
 ^^^^^^^^^^^^^^^^^^^^^^^
 
 .. autofunction:: lfr_flux
+
+Numerical Fluxes for Gas Dynamics
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+The following numerical fluxes share a common interface,
+``flux(state_tpair, f_tpair, normal)``, where *state_tpair* is a
+:class:`~grudge.trace_pair.TracePair` of :class:`~mirgecom.eos.FluidState`,
+*f_tpair* is a :class:`~grudge.trace_pair.TracePair` of the physical
+(inviscid) fluxes evaluated from those states, and *normal* is the outward
+facing normal. Each returns the normal component of the numerical flux as a
+:class:`~mirgecom.fluid.ConservedVars`, computed with whole-container arithmetic
+over all conserved quantities at once. Any of them can be passed as the
+*numerical_flux_func* to :func:`mirgecom.euler.euler_operator`.
+
+.. autofunction:: rusanov_flux
+.. autofunction:: hll_flux
+.. autofunction:: hllc_flux
+.. autofunction:: roe_flux
+.. autofunction:: get_numerical_flux
+.. autofunction:: register_numerical_flux
 """
 
 __copyright__ = """
@@ -30,8 +50,17 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 THE SOFTWARE.
 """
 
+import numpy as np  # noqa
+from pytools.obj_array import make_obj_array
+from grudge.trace_pair import TracePair
+from mirgecom.fluid import (
+    compute_wavespeed,
+    make_conserved,
+    split_conserved
+)
 
-def lfr_flux(cv_tpair, flux_func, normal, lam):
+
+def lfr_flux(cv_tpair, f_tpair, normal, lam):
     r"""Compute Lax-Friedrichs/Rusanov flux after [Hesthaven_2008]_, Section 6.6.
 
     The Lax-Friedrichs/Rusanov flux is calculated as:
@@ -48,13 +77,14 @@ def lfr_flux(cv_tpair, flux_func, normal, lam):
 
     Parameters
     ----------
-    flux_func:
+    cv_tpair: :class:`grudge.trace_pair.TracePair`
 
-        function should return ambient dim-vector fluxes given *q* values
+        Trace pair for the face upon which flux calculation is to be performed
 
-    q_tpair: :class:`grudge.trace_pair.TracePair`
+    f_tpair: :class:`grudge.trace_pair.TracePair`
 
-        Trace pair for the face upon which flux calculation is to be performed
+        Trace pair of the ambient dim-vector fluxes, $\mathbf{F}(q^-)$ and
+        $\mathbf{F}(q^+)$, evaluated on the interior and exterior of the face
 
     normal: numpy.ndarray
 
@@ -72,7 +102,278 @@ def lfr_flux(cv_tpair, flux_func, normal, lam):
         object array of :class:`meshmode.dof_array.DOFArray` with the
         Lax-Friedrichs/Rusanov flux.
     """
-    flux_avg = 0.5*(flux_func(cv_tpair.int)
-                    + flux_func(cv_tpair.ext))
-    return flux_avg @ normal - 0.5*lam*(cv_tpair.ext
-                                        - cv_tpair.int)
+    return f_tpair.avg @ normal - 0.5*lam*(cv_tpair.ext - cv_tpair.int)
+
+
+def _species_fractions(cv):
+    return make_obj_array([y_mass/cv.mass for y_mass in cv.species_mass])
+
+
+def _davis_signal_speeds(state_tpair, normal):
+    """Return the Davis estimates of the slowest and fastest signal speeds."""
+    actx = state_tpair.int.array_context
+    un_int = np.dot(state_tpair.int.velocity, normal)
+    un_ext = np.dot(state_tpair.ext.velocity, normal)
+    c_int = state_tpair.int.speed_of_sound
+    c_ext = state_tpair.ext.speed_of_sound
+    s_minus = actx.np.minimum(un_int - c_int, un_ext - c_ext)
+    s_plus = actx.np.maximum(un_int + c_int, un_ext + c_ext)
+    return s_minus, s_plus
+
+
+def rusanov_flux(state_tpair, f_tpair, normal):
+    r"""Compute the Rusanov (local Lax-Friedrichs) numerical flux.
+
+    Uses :func:`lfr_flux` with the jump coefficient
+    $\lambda = \max(\|\mathbf{v}^-\| + c^-, \|\mathbf{v}^+\| + c^+)$.
+
+    Parameters
+    ----------
+    state_tpair: :class:`grudge.trace_pair.TracePair`
+        Trace pair of :class:`~mirgecom.eos.FluidState` for the face
+    f_tpair: :class:`grudge.trace_pair.TracePair`
+        Trace pair of the physical fluxes, $\mathbf{F}(q^-)$ and
+        $\mathbf{F}(q^+)$
+    normal: numpy.ndarray
+        object array of :class:`meshmode.dof_array.DOFArray` with outward-pointing
+        normals
+
+    Returns
+    -------
+    :class:`~mirgecom.fluid.ConservedVars`
+        The normal numerical flux
+    """
+    state_int = state_tpair.int
+    state_ext = state_tpair.ext
+    actx = state_int.array_context
+    lam = actx.np.maximum(
+        compute_wavespeed(state_int.dim, eos=None, cv=state_int.cv,
+                          state=state_int),
+        compute_wavespeed(state_ext.dim, eos=None, cv=state_ext.cv,
+                          state=state_ext)
+    )
+    cv_tpair = TracePair(state_tpair.dd, interior=state_int.cv,
+                         exterior=state_ext.cv)
+    return lfr_flux(cv_tpair=cv_tpair, f_tpair=f_tpair, normal=normal, lam=lam)
+
+
+def hll_flux(state_tpair, f_tpair, normal):
+    r"""Compute the Harten-Lax-van Leer (HLL) numerical flux.
+
+    The HLL flux after [Toro_2009]_, Section 10.3, is calculated as:
+
+    .. math::
+
+        f_{\mathtt{HLL}} = \frac{s^+\mathbf{F}(q^-)\cdot\hat{n}
+        - s^-\mathbf{F}(q^+)\cdot\hat{n} + s^+s^-(q^+ - q^-)}{s^+ - s^-},
+
+    with $s^- = \min(0, v_n^- - c^-, v_n^+ - c^+)$ and
+    $s^+ = \max(0, v_n^- + c^-, v_n^+ + c^+)$, so that the upwind cases need no
+    branching.
+
+    The parameters and return value are as for :func:`rusanov_flux`.
+    """
+    actx = state_tpair.int.array_context
+    s_minus, s_plus = _davis_signal_speeds(state_tpair, normal)
+    zeros = 0*s_minus
+    s_minus = actx.np.minimum(s_minus, zeros)
+    s_plus = actx.np.maximum(s_plus, zeros)
+
+    fn_int = f_tpair.int @ normal
+    fn_ext = f_tpair.ext @ normal
+    q_jump = state_tpair.ext.cv - state_tpair.int.cv
+
+    return (s_plus*fn_int - s_minus*fn_ext + (s_plus*s_minus)*q_jump) \
+        / (s_plus - s_minus)
+
+
+def _hllc_star_flux(state, fn, s_k, s_star, normal):
+    """Return the HLLC flux through the star region on one side of the face."""
+    cv = state.cv
+    un = np.dot(state.velocity, normal)
+    rho_rel = cv.mass*(s_k - un)
+    factor = rho_rel/(s_k - s_star)
+    cv_star = make_conserved(
+        cv.dim,
+        mass=factor,
+        energy=factor*(cv.energy/cv.mass
+                       + (s_star - un)*(s_star + state.pressure/rho_rel)),
+        momentum=factor*(state.velocity + (s_star - un)*normal),
+        species_mass=factor*_species_fractions(cv))
+    return fn + s_k*(cv_star - cv)
+
+
+def hllc_flux(state_tpair, f_tpair, normal):
+    r"""Compute the HLLC (HLL-contact) numerical flux.
+
+    The HLLC flux after [Toro_2009]_, Section 10.4, restores the contact wave
+    that the HLL flux smears. With $s^\pm$ the Davis signal speed estimates and
+    $s^*$ the contact speed, the flux is
+
+    .. math::
+
+        f_{\mathtt{HLLC}} = \begin{cases}
+        \mathbf{F}^-\cdot\hat{n} + \min(s^-, 0)(q^{*-} - q^-) & s^* \ge 0, \\
+        \mathbf{F}^+\cdot\hat{n} + \max(s^+, 0)(q^{*+} - q^+) & s^* < 0,
+        \end{cases}
+
+    where $q^{*\pm}$ are the star states. Both cases are evaluated everywhere
+    and the flux is selected node by node, so that values on the side that is
+    not used (e.g. a division by zero in a star state) do not leak into the
+    result. Species mass fractions are advected as passive scalars.
+
+    The parameters and return value are as for :func:`rusanov_flux`.
+    """
+    state_int = state_tpair.int
+    state_ext = state_tpair.ext
+    actx = state_int.array_context
+
+    s_minus, s_plus = _davis_signal_speeds(state_tpair, normal)
+
+    un_int = np.dot(state_int.velocity, normal)
+    un_ext = np.dot(state_ext.velocity, normal)
+    rho_rel_int = state_int.cv.mass*(s_minus - un_int)
+    rho_rel_ext = state_ext.cv.mass*(s_plus - un_ext)
+    s_star = (
+        (state_ext.pressure - state_int.pressure
+         + rho_rel_int*un_int - rho_rel_ext*un_ext)
+        / (rho_rel_int - rho_rel_ext))
+
+    zeros = 0*s_star
+    flux_int = _hllc_star_flux(state_int, f_tpair.int @ normal,
+                               actx.np.minimum(s_minus, zeros), s_star, normal)
+    flux_ext = _hllc_star_flux(state_ext, f_tpair.ext @ normal,
+                               actx.np.maximum(s_plus, zeros), s_star, normal)
+
+    upwind_int = s_star >= 0
+    return split_conserved(state_int.dim, make_obj_array([
+        actx.np.where(upwind_int, f_int, f_ext)
+        for f_int, f_ext in zip(flux_int.join(), flux_ext.join())]))
+
+
+def roe_flux(state_tpair, f_tpair, normal, entropy_fix=0.1):
+    r"""Compute the Roe numerical flux.
+
+    The Roe flux after [Toro_2009]_, Section 11.2, is calculated as:
+
+    .. math::
+
+        f_{\mathtt{Roe}} = \frac{1}{2}(\mathbf{F}(q^-) + \mathbf{F}(q^+))\cdot
+        \hat{n} - \frac{1}{2}|\tilde{A}|(q^+ - q^-),
+
+    where $|\tilde{A}|$ is the absolute flux Jacobian evaluated at the
+    Roe-averaged state. The dissipation is assembled from the acoustic, entropy,
+    and shear waves in the direction of *normal*; species mass fractions are
+    advected as passive scalars. The ratio of specific heats is obtained on each
+    side from the state as $\gamma = \rho c^2/p$, so no further EOS evaluations
+    are needed.
+
+    The parameters and return value are as for :func:`rusanov_flux`, with
+    the addition of:
+
+    Parameters
+    ----------
+    entropy_fix: float
+        The acoustic wave speeds smaller than *entropy_fix* times the Roe-averaged
+        speed of sound are smoothed with Harten's entropy fix. Set to 0 to
+        disable the fix.
+    """
+    state_int = state_tpair.int
+    state_ext = state_tpair.ext
+    cv_int = state_int.cv
+    cv_ext = state_ext.cv
+    actx = state_int.array_context
+
+    # Roe averages
+    w_int = actx.np.sqrt(cv_int.mass)
+    w_ext = actx.np.sqrt(cv_ext.mass)
+    w_sum = w_int + w_ext
+
+    def roe_avg(a_int, a_ext):
+        return (w_int*a_int + w_ext*a_ext)/w_sum
+
+    rho = w_int*w_ext
+    vel = roe_avg(state_int.velocity, state_ext.velocity)
+    enthalpy = roe_avg((cv_int.energy + state_int.pressure)/cv_int.mass,
+                       (cv_ext.energy + state_ext.pressure)/cv_ext.mass)
+    y = roe_avg(_species_fractions(cv_int), _species_fractions(cv_ext))
+    gamma = roe_avg(
+        cv_int.mass*state_int.speed_of_sound**2/state_int.pressure,
+        cv_ext.mass*state_ext.speed_of_sound**2/state_ext.pressure)
+    vel_sq = np.dot(vel, vel)
+    sos = actx.np.sqrt((gamma - 1)*(enthalpy - 0.5*vel_sq))
+    un = np.dot(vel, normal)
+
+    # Jumps and wave strengths
+    d_pressure = state_ext.pressure - state_int.pressure
+    d_mass = cv_ext.mass - cv_int.mass
+    d_vel = state_ext.velocity - state_int.velocity
+    d_un = np.dot(d_vel, normal)
+    d_vel_tan = d_vel - d_un*normal
+    d_y = _species_fractions(cv_ext) - _species_fractions(cv_int)
+
+    sos_sq = sos*sos
+    alpha_minus = (d_pressure - rho*sos*d_un)/(2*sos_sq)
+    alpha_entropy = d_mass - d_pressure/sos_sq
+    alpha_plus = (d_pressure + rho*sos*d_un)/(2*sos_sq)
+
+    lam_minus = actx.np.fabs(un - sos)
+    lam_plus = actx.np.fabs(un + sos)
+    lam_shear = actx.np.fabs(un)
+    if entropy_fix > 0:
+        delta = entropy_fix*sos
+
+        def harten(lam):
+            return actx.np.where(lam - delta >= 0, lam,
+                                 (lam*lam + delta*delta)/(2*delta))
+
+        lam_minus = harten(lam_minus)
+        lam_plus = harten(lam_plus)
+
+    wave_minus = lam_minus*alpha_minus
+    wave_plus = lam_plus*alpha_plus
+    mass_diss = wave_minus + lam_shear*alpha_entropy + wave_plus
+    dissipation = make_conserved(
+        cv_int.dim,
+        mass=mass_diss,
+        energy=(wave_minus*(enthalpy - sos*un)
+                + lam_shear*(0.5*vel_sq*alpha_entropy
+                             + rho*np.dot(vel, d_vel_tan))
+                + wave_plus*(enthalpy + sos*un)),
+        momentum=(wave_minus*(vel - sos*normal)
+                  + lam_shear*(alpha_entropy*vel + rho*d_vel_tan)
+                  + wave_plus*(vel + sos*normal)),
+        species_mass=mass_diss*y + (lam_shear*rho)*d_y)
+
+    return 0.5*(f_tpair.int @ normal + f_tpair.ext @ normal) - 0.5*dissipation
+
+
+_NUMERICAL_FLUXES = {
+    "rusanov": rusanov_flux,
+    "lfr": rusanov_flux,
+    "hll": hll_flux,
+    "hllc": hllc_flux,
+    "roe": roe_flux,
+}
+
+
+def get_numerical_flux(name):
+    """Return the numerical flux function registered under *name*.
+
+    The built-in fluxes are registered as ``"rusanov"`` (or ``"lfr"``),
+    ``"hll"``, ``"hllc"``, and ``"roe"``.
+    """
+    try:
+        return _NUMERICAL_FLUXES[name.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown numerical flux '{name}'. Valid names are: "
+                         f"{', '.join(sorted(_NUMERICAL_FLUXES))}.") from None
+
+
+def register_numerical_flux(name, flux_func):
+    """Register *flux_func* for retrieval by :func:`get_numerical_flux`.
+
+    *flux_func* must follow the ``flux(state_tpair, f_tpair, normal)``
+    interface of the built-in numerical fluxes.
+    """
+    _NUMERICAL_FLUXES[name.lower()] = flux_func
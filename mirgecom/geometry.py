@@ -0,0 +1,142 @@
+"""Cached geometric quantities of a discretization.
+
+The flux and boundary routines need the face normals, nodes, and face
+Jacobians (area elements) of the discretization on every RHS evaluation. The
+functions here hand these out thawed and ready to use, computing them only
+once per array context and DOF descriptor. The cached arrays are shared and
+must not be modified in place. While a compiled step is traced (see
+:func:`mirgecom.utils.is_tracing`), they are computed without caching.
+
+.. autofunction:: get_normal
+.. autofunction:: get_nodes
+.. autofunction:: get_area_element
+.. autofunction:: clear_geometry_cache
+"""
+
+__copyright__ = """
+Copyright (C) 2021 University of Illinois Board of Trustees
+"""
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import numpy as np
+from pytools import memoize_in
+from meshmode.dof_array import thaw
+from grudge.dof_desc import as_dofdesc
+from mirgecom.precision import cast_to_dtype
+from mirgecom.utils import is_tracing
+
+
+def _get_geometry_cache(discr):
+    @memoize_in(discr, (_get_geometry_cache, "geometry_cache"))
+    def get_cache():
+        return {}
+
+    return get_cache()
+
+
+def _get_cached(actx, discr, name, dd, compute, dtype=None):
+    if dtype is not None:
+        dtype = np.dtype(dtype)
+
+    def compute_with_dtype():
+        result = compute()
+        if dtype is not None:
+            result = cast_to_dtype(result, dtype)
+        return result
+
+    if is_tracing():
+        # Traced arrays must not outlive the trace
+        return compute_with_dtype()
+
+    cache = _get_geometry_cache(discr)
+    key = (actx, name, dd, dtype)
+    try:
+        return cache[key]
+    except KeyError:
+        result = compute_with_dtype()
+        cache[key] = result
+        return result
+
+
+def get_normal(actx, discr, dd, dtype=None):
+    """Return the thawed outward-facing unit normals on the faces *dd*.
+
+    Parameters
+    ----------
+    actx: :class:`arraycontext.ArrayContext`
+        The array context in which to thaw the normals
+    discr: :class:`grudge.eager.EagerDGDiscretization`
+        The discretization
+    dd
+        A DOF descriptor (or something convertible to one) of a face
+        discretization, e.g. a boundary tag, "int_faces", or "all_faces"
+    dtype: numpy.dtype
+        Optional floating point type of the result, e.g. the type of a state
+        stored in reduced precision, so that arithmetic with the state is not
+        promoted to double precision. The conversion is done once, and the
+        result is cached per type.
+
+    Returns
+    -------
+    numpy.ndarray
+        Object array of :class:`~meshmode.dof_array.DOFArray` with the normals
+    """
+    dd = as_dofdesc(dd)
+    return _get_cached(actx, discr, "normal", dd,
+                       lambda: thaw(actx, discr.normal(dd)), dtype=dtype)
+
+
+def get_nodes(actx, discr, dd="vol", dtype=None):
+    """Return the thawed nodes of the discretization of *dd*.
+
+    The parameters are as for :func:`get_normal`, with *dd* defaulting to the
+    volume.
+    """
+    dd = as_dofdesc(dd)
+    return _get_cached(actx, discr, "nodes", dd,
+                       lambda: thaw(actx, discr.discr_from_dd(dd).nodes()),
+                       dtype=dtype)
+
+
+def get_area_element(actx, discr, dd="vol", dtype=None):
+    """Return the thawed area element (Jacobian determinant) on *dd*.
+
+    On a face discretization, this is the face Jacobian. The parameters are as
+    for :func:`get_nodes`.
+    """
+    dd = as_dofdesc(dd)
+
+    def compute_area_element():
+        from grudge.geometry import area_element
+        return area_element(actx, discr, dd=dd)
+
+    return _get_cached(actx, discr, "area_element", dd, compute_area_element,
+                       dtype=dtype)
+
+
+def clear_geometry_cache(discr):
+    """Drop all cached geometric quantities of *discr*.
+
+    Call this if the geometry of *discr* changes, or to release the memory held
+    by the cache.
+    """
+    _get_geometry_cache(discr).clear()
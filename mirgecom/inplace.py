@@ -0,0 +1,250 @@
+""":mod:`mirgecom.inplace` provides in-place updates of arrays and containers.
+
+In-place state updates
+^^^^^^^^^^^^^^^^^^^^^^
+
+Expressions such as ``state + dt*rhs`` allocate a new array for every
+intermediate result. The functions here instead overwrite an existing array
+(or every array in a container, such as a :class:`~meshmode.dof_array.DOFArray`
+or a :class:`~mirgecom.fluid.ConservedVars`) with a fused update, so that time
+integrators can run on a fixed set of preallocated registers.
+
+Arrays that cannot be modified in place (e.g. numbers, or the arrays of a lazy
+array context) are updated out of place instead. The updated value is always
+returned, so callers should use it, as in ``y = axpy(a, x, y)``.
+
+Registers that an integrator does not return, such as stage increments, are
+borrowed with :func:`lend_register`, which keeps them across steps rather than
+allocating them anew on every step.
+
+.. autofunction:: axpy
+.. autofunction:: axpby
+.. autofunction:: scale
+.. autofunction:: lend_register
+.. autofunction:: copy_container
+.. autofunction:: view_container
+.. autofunction:: detach_container
+"""
+
+__copyright__ = """
+Copyright (C) 2021 University of Illinois Board of Trustees
+"""
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+from contextlib import contextmanager
+
+import numpy as np
+import pyopencl.array as cla
+from arraycontext import (
+    is_array_container, rec_map_array_container, rec_multimap_array_container,
+    serialize_container)
+
+
+def _is_mutable(ary):
+    """Return whether *ary* is an array that can be updated in place."""
+    return (isinstance(ary, cla.Array)
+            or (isinstance(ary, np.ndarray) and ary.dtype != object))
+
+
+def _run_cl_kernel(kernel_name, out, *args):
+    """Run the element-wise kernel *kernel_name* of :mod:`pyopencl` into *out*.
+
+    The fused kernels of :class:`pyopencl.array.Array` used here (``_axpbyz``
+    for ``a*x + b*y`` and ``_axpbz`` for ``a*x + b``, with scalar *a* and *b*)
+    are not part of its public interface. Returns *out*, or *None* if the
+    kernel is not available, in which case the caller updates out of place.
+    """
+    kernel = getattr(cla.Array, kernel_name, None)
+    add_event = getattr(out, "add_event", None)
+    if kernel is None or add_event is None:
+        return None
+    add_event(kernel(out, *args))
+    return out
+
+
+def _axpby_leaf(a, x, b, y, out):
+    """Return *out* overwritten with ``a*x + b*y``, if possible in place."""
+    if not _is_mutable(out):
+        return a*x + b*y
+
+    if isinstance(out, cla.Array):
+        if (isinstance(x, cla.Array) and isinstance(y, cla.Array)
+                and x.shape == y.shape == out.shape):
+            result = _run_cl_kernel("_axpbyz", out, out.dtype.type(a), x,
+                                    out.dtype.type(b), y)
+            if result is not None:
+                return result
+        return a*x + b*y
+
+    if out is y and not np.may_share_memory(out, x):
+        out *= b
+        out += a*x
+    elif np.may_share_memory(out, x) or np.may_share_memory(out, y):
+        # Overwriting *out* in two passes would clobber an aliased input
+        out[...] = a*x + b*y
+    else:
+        np.multiply(a, x, out=out)
+        out += b*y
+    return out
+
+
+def axpby(a, x, b, y, out=None):
+    """Overwrite *out* with ``a*x + b*y``, and return it.
+
+    Parameters
+    ----------
+    a: float
+        Scalar factor of *x*
+    x
+        An array or array container
+    b: float
+        Scalar factor of *y*
+    y
+        An array or array container with the same structure as *x*
+    out
+        The array or array container to overwrite, by default *y*. It may be
+        the same as *x* or *y*.
+    """
+    if out is None:
+        out = y
+    return rec_multimap_array_container(
+        lambda x_i, y_i, out_i: _axpby_leaf(a, x_i, b, y_i, out_i),
+        x, y, out)
+
+
+def axpy(a, x, y):
+    """Overwrite *y* with ``a*x + y``, and return it."""
+    return axpby(a, x, 1, y)
+
+
+def scale(a, y, out=None):
+    """Overwrite *out* (by default *y*) with ``a*y``, and return it."""
+    def scale_leaf(y_i, out_i):
+        if not _is_mutable(out_i):
+            return a*y_i
+        if isinstance(out_i, cla.Array):
+            if out_i is y_i:
+                y_i *= y_i.dtype.type(a)
+                return y_i
+            if isinstance(y_i, cla.Array) and y_i.shape == out_i.shape:
+                result = _run_cl_kernel("_axpbz", out_i, out_i.dtype.type(a),
+                                        y_i, out_i.dtype.type(0))
+                if result is not None:
+                    return result
+            return a*y_i
+        np.multiply(a, y_i, out=out_i)
+        return out_i
+
+    if out is None:
+        out = y
+    return rec_multimap_array_container(scale_leaf, y, out)
+
+
+# Registers lent by lend_register, by name and structure
+_registers = {}
+_MAX_REGISTERS = 8
+
+
+def _get_structure(ary):
+    """Return a key for the container structure and the array layout of *ary*."""
+    if is_array_container(ary):
+        return (type(ary), tuple((key, _get_structure(subary))
+                                 for key, subary in serialize_container(ary)))
+    if isinstance(ary, cla.Array):
+        return (cla.Array, ary.shape, ary.dtype, ary.queue)
+    if _is_mutable(ary):
+        return (np.ndarray, ary.shape, ary.dtype)
+    return type(ary)
+
+
+@contextmanager
+def lend_register(name, template):
+    """Lend a register with the structure of *template*, reused across calls.
+
+    Integrators use this for the registers that they do not return, e.g. stage
+    increments, so that these are allocated once instead of on every step. The
+    register is identified by *name* and by the structure, array shapes, and
+    types of *template*. Its contents on entry are undefined, so it must be
+    overwritten (e.g. with the *out* argument of :func:`axpby` or
+    :func:`scale`) before it is read. While a register is lent, requests for the
+    same register get a new one. Arrays that cannot be modified in place are
+    not kept.
+    """
+    key = (name, _get_structure(template))
+    register = _registers.pop(key, None)
+    if register is None:
+        register = rec_map_array_container(
+            lambda subary: subary.copy() if _is_mutable(subary) else 0,
+            template)
+    try:
+        yield register
+    finally:
+        _registers[key] = register
+        while len(_registers) > _MAX_REGISTERS:
+            del _registers[next(iter(_registers))]
+
+
+def copy_container(ary):
+    """Return a copy of *ary* that owns its data, to be used as a register."""
+    return rec_map_array_container(
+        lambda subary: subary.copy() if _is_mutable(subary) else subary, ary)
+
+
+def _shares_memory(ary, other):
+    """Return whether the arrays *ary* and *other* may share storage."""
+    if isinstance(ary, cla.Array) and isinstance(other, cla.Array):
+        return ary.base_data is not None and ary.base_data == other.base_data
+    if isinstance(ary, np.ndarray) and isinstance(other, np.ndarray):
+        return np.may_share_memory(ary, other)
+    return False
+
+
+def detach_container(ary, register):
+    """Return *ary*, with copies of the arrays that share storage with *register*.
+
+    A RHS may return (a view of) its argument, e.g. an identity or pass-through
+    RHS. Integrators that keep a stage derivative while updating the register
+    it was computed from in place use this to keep the derivative intact.
+    """
+    return rec_multimap_array_container(
+        lambda subary, reg_subary: (subary.copy()
+                                    if _shares_memory(subary, reg_subary)
+                                    else subary),
+        ary, register)
+
+
+def view_container(ary):
+    """Return *ary* with new array objects that share its data.
+
+    Caches keyed on the identity of arrays, such as
+    :class:`~mirgecom.eos.EOSCache`, cannot notice in-place updates. Passing
+    a view of a register that is updated in place (rather than the register
+    itself) to such consumers makes every update look like a new state.
+    """
+    def view(subary):
+        if isinstance(subary, cla.Array):
+            return subary.with_queue(subary.queue)
+        if isinstance(subary, np.ndarray):
+            return subary.view()
+        return subary
+
+    return rec_map_array_container(view, ary)
@@ -26,10 +26,15 @@ THE SOFTWARE.
 
 from .explicit_rk import rk4_step                          # noqa: F401
 from .lsrk import euler_step, lsrk54_step, lsrk144_step    # noqa: F401
+from .rosenbrock import rosenbrock23_integrate             # noqa: F401
+from .embedded_rk import (bs32_step, dp54_step,            # noqa: F401
+                          AdaptiveRKIntegrator)
 
 __doc__ = """
 .. automodule:: mirgecom.integrators.explicit_rk
 .. automodule:: mirgecom.integrators.lsrk
+.. automodule:: mirgecom.integrators.rosenbrock
+.. automodule:: mirgecom.integrators.embedded_rk
 """
 
 
@@ -0,0 +1,410 @@
+"""Timestepping routines for embedded, error-controlled Runge-Kutta methods.
+
+An embedded Runge-Kutta pair advances the state with a method of one order,
+and estimates the local error from the difference to a method of another order
+that shares its stages. :class:`AdaptiveRKIntegrator` uses this estimate to
+accept or reject each step and to choose the size of the next one with a PI
+controller ([Gustafsson_1991]_). Passed as the *timestepper* to
+:func:`mirgecom.steppers.advance_state`, it takes steps of its own choosing.
+
+.. autoclass:: EmbeddedRKCoefficients
+.. autofunction:: embedded_rk_step
+.. autofunction:: bs32_step
+.. autofunction:: dp54_step
+.. autoclass:: AdaptiveRKIntegrator
+"""
+
+__copyright__ = """
+Copyright (C) 2021 University of Illinois Board of Trustees
+"""
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+from arraycontext import (
+    is_array_container, rec_multimap_array_container, serialize_container)
+
+from mirgecom.inplace import (
+    axpby, axpy, copy_container, detach_container, view_container)
+from mirgecom.utils import get_container_leaves
+
+
+@dataclass(frozen=True)
+class EmbeddedRKCoefficients:
+    """Butcher tableau of an embedded Runge-Kutta pair.
+
+    .. attribute:: A
+
+        Lower triangular matrix of the stage coefficients.
+
+    .. attribute:: B
+
+        Weights of the method that advances the state.
+
+    .. attribute:: B_hat
+
+        Weights of the embedded method, used for the error estimate only.
+
+    .. attribute:: C
+
+        Stage times, as fractions of the step.
+
+    .. attribute:: order
+
+        Order of the method that advances the state.
+
+    .. attribute:: embedded_order
+
+        Order of the embedded method.
+
+    .. attribute:: fsal
+
+        Whether the last stage is evaluated at the new state ("first same as
+        last"), so that its derivative can be reused as the first stage of the
+        next step.
+    """
+
+    A: np.ndarray
+    B: np.ndarray
+    B_hat: np.ndarray
+    C: np.ndarray
+    order: int
+    embedded_order: int
+    fsal: bool = False
+
+
+BogackiShampine32Coefs = EmbeddedRKCoefficients(
+    A=np.array([
+        [0., 0., 0., 0.],
+        [1/2, 0., 0., 0.],
+        [0., 3/4, 0., 0.],
+        [2/9, 1/3, 4/9, 0.]]),
+    B=np.array([2/9, 1/3, 4/9, 0.]),
+    B_hat=np.array([7/24, 1/4, 1/3, 1/8]),
+    C=np.array([0., 1/2, 3/4, 1.]),
+    order=3, embedded_order=2, fsal=True)
+
+
+DormandPrince54Coefs = EmbeddedRKCoefficients(
+    A=np.array([
+        [0., 0., 0., 0., 0., 0., 0.],
+        [1/5, 0., 0., 0., 0., 0., 0.],
+        [3/40, 9/40, 0., 0., 0., 0., 0.],
+        [44/45, -56/15, 32/9, 0., 0., 0., 0.],
+        [19372/6561, -25360/2187, 64448/6561, -212/729, 0., 0., 0.],
+        [9017/3168, -355/33, 46732/5247, 49/176, -5103/18656, 0., 0.],
+        [35/384, 0., 500/1113, 125/192, -2187/6784, 11/84, 0.]]),
+    B=np.array([35/384, 0., 500/1113, 125/192, -2187/6784, 11/84, 0.]),
+    B_hat=np.array([5179/57600, 0., 7571/16695, 393/640, -92097/339200,
+                    187/2100, 1/40]),
+    C=np.array([0., 1/5, 3/10, 4/5, 8/9, 1., 1.]),
+    order=5, embedded_order=4, fsal=True)
+
+
+def _embedded_rk_step(coefs, state, t, dt, rhs, first_rhs=None):
+    """Take one step, and return the new state, the error, and the stage RHSs.
+
+    *first_rhs*, if given, is used as the derivative of the first stage.
+    """
+    nstages = len(coefs.C)
+    ks = [rhs(t, state) if first_rhs is None else first_rhs]
+
+    stage = copy_container(state)
+    for i in range(1, nstages):
+        stage = axpby(1, state, dt*coefs.A[i, 0], ks[0], out=stage)
+        for j in range(1, i):
+            if coefs.A[i, j] != 0:
+                stage = axpy(dt*coefs.A[i, j], ks[j], stage)
+        # The stage derivatives must survive the updates of the stage register
+        ks.append(detach_container(
+            rhs(t + coefs.C[i]*dt, view_container(stage)), stage))
+
+    if coefs.fsal:
+        # The last stage is the new state
+        new_state = stage
+    else:
+        new_state = copy_container(state)
+        for b, k in zip(coefs.B, ks):
+            if b != 0:
+                new_state = axpy(dt*b, k, new_state)
+
+    error = dt*(coefs.B[0] - coefs.B_hat[0])*ks[0]
+    for b, b_hat, k in zip(coefs.B[1:], coefs.B_hat[1:], ks[1:]):
+        if b != b_hat:
+            error = axpy(dt*(b - b_hat), k, error)
+
+    return new_state, error, ks
+
+
+def _get_array_context(ary):
+    """Return the array context of the first array in *ary* that has one."""
+    actx = getattr(ary, "array_context", None)
+    if actx is not None or not is_array_container(ary):
+        return actx
+    for _, subary in serialize_container(ary):
+        actx = _get_array_context(subary)
+        if actx is not None:
+            return actx
+    return None
+
+
+def _weighted_rms_norm(error, state, new_state, atol, rtol, comm=None):
+    """Return the RMS of *error*, weighted entrywise by the tolerances.
+
+    Each entry of *error* is divided by ``atol + rtol*max(|y|, |y_new|)``,
+    where *y* and *y_new* are the matching entries of *state* and *new_state*.
+    All three may be numbers, arrays, or array containers of the same
+    structure. If *comm* is given, the mean is taken over all ranks.
+    """
+    actx = _get_array_context(new_state)
+    xp = np if actx is None else actx.np
+
+    def scaled_leaf(error_i, y_i, new_y_i):
+        return error_i / (atol + rtol*xp.maximum(abs(y_i), abs(new_y_i)))
+
+    sum_of_squares = 0.
+    nentries = 0
+    for ary in get_container_leaves(
+            rec_multimap_array_container(scaled_leaf, error, state, new_state)):
+        ary_sum = xp.sum(ary*ary)
+        if actx is not None:
+            ary_sum = actx.to_numpy(ary_sum)
+        sum_of_squares += float(ary_sum)
+        nentries += np.size(ary)
+
+    if comm is not None:
+        sum_of_squares = comm.allreduce(sum_of_squares)
+        nentries = comm.allreduce(nentries)
+
+    return np.sqrt(sum_of_squares / max(nentries, 1))
+
+
+def embedded_rk_step(coefs, state, t, dt, rhs):
+    """Take one step using an embedded Runge-Kutta pair.
+
+    Parameters
+    ----------
+    coefs: EmbeddedRKCoefficients
+        The Runge-Kutta pair
+    state
+        The state at time *t*
+    t: float
+        The current time
+    dt: float
+        The step size
+    rhs
+        Function with signature ``rhs(t, state)`` returning the time
+        derivative of the state
+
+    Returns
+    -------
+    tuple
+        The state at time *t* + *dt*, and the estimate of its local error
+    """
+    new_state, error, _ = _embedded_rk_step(coefs, state, t, dt, rhs)
+    return new_state, error
+
+
+def bs32_step(state, t, dt, rhs):
+    """Take one step using the 3rd-order Bogacki-Shampine method.
+
+    The method is described in [Bogacki_1989]_. This fixed-step variant discards
+    the error estimate.
+    """
+    return embedded_rk_step(BogackiShampine32Coefs, state, t, dt, rhs)[0]
+
+
+def dp54_step(state, t, dt, rhs):
+    """Take one step using the 5th-order Dormand-Prince method.
+
+    The method is described in [Dormand_1980]_. This fixed-step variant discards
+    the error estimate.
+    """
+    return embedded_rk_step(DormandPrince54Coefs, state, t, dt, rhs)[0]
+
+
+class AdaptiveRKIntegrator:
+    r"""Error-controlled time integration with an embedded Runge-Kutta pair.
+
+    Each step is accepted if its error estimate $e$ satisfies $\epsilon \le 1$,
+    where
+
+    .. math::
+
+        \epsilon = \sqrt{\frac{1}{N} \sum_{i=1}^N \left(
+            \frac{e_i}{\mathtt{atol} + \mathtt{rtol}\max(|y_i|, |\hat{y}_i|)}
+            \right)^2}
+
+    is the weighted RMS over all $N$ entries of the state, and $y$ and
+    $\hat{y}$ are the states before and after the step. Otherwise, it is
+    retried with a smaller step. After an
+    accepted step, the next step size is chosen by the PI controller
+
+    .. math::
+
+        \Delta t_{n+1} = \Delta t_n \, s \,
+            \epsilon_n^{-0.7/k} \, \epsilon_{n-1}^{0.4/k},
+
+    where $k$ is one more than the embedded order and $s$ is a safety factor.
+
+    For methods that are "first same as last", the derivative at the new state
+    is reused by the next step, if that starts from the same state object, i.e.
+    if the state was not changed between the steps.
+
+    .. attribute:: coefs
+    .. attribute:: naccepted
+
+        Number of accepted steps.
+
+    .. attribute:: nrejected
+
+        Number of rejected steps.
+
+    .. attribute:: nrhs
+
+        Number of RHS evaluations.
+
+    .. automethod:: __init__
+    .. automethod:: __call__
+    .. automethod:: adaptive_step
+    """
+
+    def __init__(self, coefs=DormandPrince54Coefs, rtol=1e-6, atol=1e-10,
+                 norm=None, safety=0.9, min_factor=0.2, max_factor=5.0,
+                 max_dt=None, max_rejections=20, comm=None):
+        """Create the integrator.
+
+        Parameters
+        ----------
+        coefs: EmbeddedRKCoefficients
+            The Runge-Kutta pair, e.g. ``BogackiShampine32Coefs`` or
+            ``DormandPrince54Coefs`` (the default)
+        rtol: float
+            Relative error tolerance
+        atol: float
+            Absolute error tolerance
+        norm
+            Optional function returning the norm of a state-like quantity,
+            e.g. ``lambda cv: max(discr.norm(ary, np.inf) for ary in cv.join())``.
+            If given, the error is measured as ``norm(e)/(atol + rtol*norm(y))``
+            for the new state *y*, instead of by the weighted RMS.
+        safety: float
+            Safety factor applied to the step size proposals
+        min_factor: float
+            Smallest factor by which a step size may shrink at once
+        max_factor: float
+            Largest factor by which a step size may grow at once
+        max_dt: float
+            Optional upper bound on the step size, e.g. a CFL limit
+        max_rejections: int
+            An error is raised if a step is rejected more than this many times
+            in a row
+        comm
+            MPI communicator over which the weighted RMS is reduced, so that
+            all ranks take the same steps. Without it, the RMS is rank-local.
+        """
+        self.coefs = coefs
+        self.rtol = rtol
+        self.atol = atol
+        self.norm = norm
+        self.safety = safety
+        self.min_factor = min_factor
+        self.max_factor = max_factor
+        self.max_dt = max_dt
+        self.max_rejections = max_rejections
+        self.comm = comm
+
+        self.naccepted = 0
+        self.nrejected = 0
+        self.nrhs = 0
+
+        self._prev_error = None
+        self._fsal_state = None
+        self._fsal_rhs = None
+
+    def __call__(self, state, t, dt, rhs):
+        """Take one step of size *dt* without error control."""
+        self.nrhs += len(self.coefs.C)
+        return embedded_rk_step(self.coefs, state, t, dt, rhs)[0]
+
+    def adaptive_step(self, state, t, dt, rhs):
+        """Take one accepted step, starting with a step size proposal *dt*.
+
+        Returns
+        -------
+        tuple
+            The new state, the size of the accepted step, and the proposed
+            size of the next step
+        """
+        k = self.coefs.embedded_order + 1
+        if self.max_dt is not None:
+            dt = min(dt, self.max_dt)
+
+        first_rhs = None
+        if self.coefs.fsal and state is self._fsal_state:
+            first_rhs = self._fsal_rhs
+
+        for _ in range(self.max_rejections + 1):
+            new_state, error, ks = _embedded_rk_step(
+                self.coefs, state, t, dt, rhs, first_rhs=first_rhs)
+            self.nrhs += len(self.coefs.C) - (first_rhs is not None)
+            # The first stage derivative does not depend on the step size
+            first_rhs = ks[0]
+
+            if self.norm is None:
+                scaled_error = _weighted_rms_norm(
+                    error, state, new_state, self.atol, self.rtol, comm=self.comm)
+            else:
+                scaled_error = self.norm(error) / (
+                    self.atol + self.rtol*self.norm(new_state))
+            if not np.isfinite(scaled_error):
+                scaled_error = np.inf
+
+            if scaled_error <= 1:
+                break
+
+            self.nrejected += 1
+            dt *= max(self.min_factor,
+                      self.safety*scaled_error**(-1/k) if scaled_error < np.inf
+                      else self.min_factor)
+        else:
+            raise RuntimeError(
+                f"Step rejected {self.max_rejections + 1} times in a row "
+                f"at t={t}.")
+
+        self.naccepted += 1
+        scaled_error = max(scaled_error, 1e-10)
+        factor = self.safety*scaled_error**(-0.7/k)
+        if self._prev_error is not None:
+            factor *= self._prev_error**(0.4/k)
+        factor = min(self.max_factor, max(self.min_factor, factor))
+        self._prev_error = scaled_error
+
+        if self.coefs.fsal:
+            self._fsal_state = new_state
+            self._fsal_rhs = ks[-1]
+
+        next_dt = dt*factor
+        if self.max_dt is not None:
+            next_dt = min(next_dt, self.max_dt)
+        return new_state, dt, next_dt
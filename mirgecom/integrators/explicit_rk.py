@@ -27,12 +27,31 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 THE SOFTWARE.
 """
 
+from mirgecom.inplace import (
+    axpby, axpy, copy_container, detach_container, lend_register,
+    view_container)
 
-def rk4_step(state, t, dt, rhs):
-    """Take one step using the fourth-order Classical Runge-Kutta method."""
-    k1 = rhs(t, state)
-    k2 = rhs(t+dt/2, state + dt/2*k1)
-    k3 = rhs(t+dt/2, state + dt/2*k2)
-    k4 = rhs(t+dt, state + dt*k3)
 
-    return state + dt/6*(k1 + 2*k2 + 2*k3 + k4)
+def rk4_step(state, t, dt, rhs):
+    """Take one step using the fourth-order Classical Runge-Kutta method.
+
+    Rather than storing all four stage derivatives, each is accumulated into
+    the result as soon as it is available, so that the step uses two
+    registers the size of *state* (the result and the stage state), updated
+    in place with the primitives from :mod:`mirgecom.inplace`. The stage state
+    is kept across steps (see :func:`~mirgecom.inplace.lend_register`), and
+    the result, which is returned, is allocated once per step.
+    """
+    result = copy_container(state)
+
+    k = rhs(t, state)
+    result = axpy(dt/6, k, result)
+    with lend_register("rk4_stage", state) as stage:
+        for stage_dt, weight in [(dt/2, dt/3), (dt/2, dt/3), (dt, dt/6)]:
+            stage = axpby(1, state, stage_dt, k, out=stage)
+            # The stage register is overwritten while k is read
+            k = detach_container(rhs(t + stage_dt, view_container(stage)),
+                                 stage)
+            result = axpy(weight, k, result)
+
+    return result
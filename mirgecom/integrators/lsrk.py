@@ -33,6 +33,9 @@ from dataclasses import dataclass
 
 import numpy as np
 
+from mirgecom.inplace import (
+    axpby, axpy, copy_container, lend_register, scale, view_container)
+
 
 @dataclass(frozen=True)
 class LSRKCoefficients:
@@ -47,11 +50,25 @@ class LSRKCoefficients:
 
 
 def lsrk_step(coefs, state, t, dt, rhs):
-    """Take one step using a low-storage Runge-Kutta method."""
-    k = 0.0 * state
-    for i in range(len(coefs.A)):
-        k = coefs.A[i]*k + dt*rhs(t + coefs.C[i]*dt, state)
-        state += coefs.B[i]*k
+    """Take one step using a low-storage Runge-Kutta method.
+
+    The step uses two registers the size of *state*, the updated state and the
+    stage increment, which are updated in place with the primitives from
+    :mod:`mirgecom.inplace`. The stage increment is kept across steps (see
+    :func:`~mirgecom.inplace.lend_register`), and the updated state, which is
+    returned, is allocated once per step. The input *state* is not modified.
+    """
+    state = copy_container(state)
+    with lend_register("lsrk_increment", state) as k:
+        for i in range(len(coefs.A)):
+            stage_rhs = rhs(t + coefs.C[i]*dt, view_container(state))
+            if i == 0:
+                # A[0] vanishes for all LSRK schemes, and the register holds
+                # the increment of the previous step
+                k = scale(dt, stage_rhs, out=k)
+            else:
+                k = axpby(dt, stage_rhs, coefs.A[i], k)
+            state = axpy(coefs.B[i], k, state)
 
     return state
 
@@ -0,0 +1,141 @@
+"""Linearly-implicit integration of batched, node-local stiff ODE systems.
+
+These routines integrate many independent, small systems of ODEs at once, such
+as the chemical kinetics at each node of a discretization, on the host with
+:mod:`numpy`. Each system takes its own adaptive substeps.
+
+.. autofunction:: rosenbrock23_integrate
+"""
+
+__copyright__ = """
+Copyright (C) 2021 University of Illinois Board of Trustees
+"""
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import numpy as np
+
+
+# Coefficients of the ode23s method of Shampine and Reichelt (1997)
+_ROS23_D = 1 / (2 + np.sqrt(2))
+_ROS23_E32 = 6 + np.sqrt(2)
+
+
+def _finite_difference_jacobian(rhs, y, nodes, f0):
+    """Return the Jacobians of *rhs* at *y* (shape ``(nnodes, neq, neq)``)."""
+    neq, nnodes = y.shape
+    delta = np.sqrt(np.finfo(y.dtype).eps) * np.maximum(np.abs(y), 1)
+
+    jac = np.empty((nnodes, neq, neq), dtype=y.dtype)
+    for j in range(neq):
+        y_pert = y.copy()
+        y_pert[j] += delta[j]
+        jac[:, :, j] = ((rhs(y_pert, nodes) - f0) / delta[j]).T
+
+    return jac
+
+
+def rosenbrock23_integrate(rhs, y, dt, jacobian=None, rtol=1e-6, atol=1e-10,
+                           max_substeps=10000):
+    r"""Integrate the autonomous systems $y' = f(y)$ over the interval *dt*.
+
+    Uses the modified Rosenbrock method of order two with an embedded
+    third-order error estimate from [Shampine_1997]_, which is L-stable and
+    whose error estimate remains reliable for very stiff components. Each
+    system adapts its own substep size, and only the systems that have not yet
+    reached the end of the interval are evaluated.
+
+    Parameters
+    ----------
+    rhs
+        Function with signature ``rhs(y, nodes)`` returning $f(y)$, where *y*
+        has shape ``(neq, len(nodes))`` and *nodes* holds the indices of the
+        systems whose states are the columns of *y*.
+    y: numpy.ndarray
+        Initial states, with shape ``(neq, nsystems)``
+    dt: float
+        Length of the time interval
+    jacobian
+        Optional function with signature ``jacobian(y, nodes, f)`` returning
+        the Jacobians $\partial f/\partial y$ with shape
+        ``(len(nodes), neq, neq)``, where *f* is ``rhs(y, nodes)``. Finite
+        differences of *rhs* are used if not given.
+    rtol: float
+        Relative tolerance of the local error
+    atol: float
+        Absolute tolerance of the local error
+    max_substeps: int
+        Maximum number of substeps, after which a :exc:`RuntimeError` is raised
+
+    Returns
+    -------
+    numpy.ndarray
+        The states at the end of the interval
+    """
+    if jacobian is None:
+        def jacobian(y, nodes, f):
+            return _finite_difference_jacobian(rhs, y, nodes, f)
+
+    y = np.array(y, dtype=np.float64)
+    neq, nsystems = y.shape
+    identity = np.eye(neq)
+
+    t = np.zeros(nsystems)
+    h = np.full(nsystems, float(dt))
+    t_end = (1 - 1e-12) * dt
+
+    for _ in range(max_substeps):
+        nodes = np.flatnonzero(t < t_end)
+        if len(nodes) == 0:
+            return y
+
+        hn = np.minimum(h[nodes], dt - t[nodes])
+        yn = y[:, nodes]
+
+        f0 = rhs(yn, nodes)
+        w = identity - (_ROS23_D * hn)[:, None, None] * jacobian(yn, nodes, f0)
+
+        def solve(b):
+            return np.linalg.solve(w, b.T[..., None])[..., 0].T
+
+        k1 = solve(f0)
+        f1 = rhs(yn + 0.5 * hn * k1, nodes)
+        k2 = solve(f1 - k1) + k1
+        y_new = yn + hn * k2
+        f2 = rhs(y_new, nodes)
+        k3 = solve(f2 - _ROS23_E32 * (k2 - f1) - 2 * (k1 - f0))
+
+        # Error of the second-order step, estimated against the embedded
+        # third-order solution
+        scale = atol + rtol * np.maximum(np.abs(yn), np.abs(y_new))
+        err = np.max(np.abs(hn / 6 * (k1 - 2 * k2 + k3)) / scale, axis=0)
+        err = np.where(np.isfinite(err), err, np.inf)
+
+        accept = err <= 1
+        y[:, nodes[accept]] = y_new[:, accept]
+        t[nodes[accept]] += hn[accept]
+
+        # Step-size controller; the local error is of third order in the step
+        h[nodes] = hn * np.clip(
+            0.9 * np.maximum(err, 1e-10) ** (-1 / 3), 0.2, 5)
+
+    raise RuntimeError("rosenbrock23_integrate: maximum number of substeps "
+                       "exceeded.")
@@ -40,13 +40,16 @@ import numpy as np
 from mirgecom.fluid import make_conserved
 
 
-def inviscid_flux(discr, eos, cv):
+def inviscid_flux(discr, eos, cv, state=None):
     r"""Compute the inviscid flux vectors from fluid conserved vars *cv*.
 
     The inviscid fluxes are
     $(\rho\vec{V},(\rho{E}+p)\vec{V},\rho(\vec{V}\otimes\vec{V})
     +p\mathbf{I}, \rho{Y_s}\vec{V})$
 
+    If a :class:`~mirgecom.eos.FluidState` for *cv* is given in *state*, its
+    pressure and velocity are used instead of being recomputed.
+
     .. note::
 
         The fluxes are returned as a :class:`mirgecom.fluid.ConservedVars`
@@ -55,15 +58,20 @@ def inviscid_flux(discr, eos, cv):
         how the fluxes are represented.
     """
     dim = cv.dim
-    p = eos.pressure(cv)
+    if state is None:
+        p = eos.pressure(cv)
+        vel = cv.velocity
+    else:
+        p = state.pressure
+        vel = state.velocity
 
     mom = cv.momentum
 
     return make_conserved(
-        dim, mass=mom, energy=mom * (cv.energy + p) / cv.mass,
-        momentum=np.outer(mom, mom) / cv.mass + np.eye(dim)*p,
+        dim, mass=mom, energy=vel * (cv.energy + p),
+        momentum=np.outer(mom, vel) + np.eye(dim)*p,
         species_mass=(  # reshaped: (nspecies, dim)
-            (mom / cv.mass) * cv.species_mass.reshape(-1, 1)))
+            vel * cv.species_mass.reshape(-1, 1)))
 
 
 def get_inviscid_timestep(discr, eos, cv):
@@ -86,10 +94,21 @@ def get_inviscid_timestep(discr, eos, cv):
         The maximum stable timestep at each node.
     """
     from grudge.dt_utils import characteristic_lengthscales
+    from grudge.dof_desc import DD_VOLUME
     from mirgecom.fluid import compute_wavespeed
+    from mirgecom.eos import make_fluid_state
+    from mirgecom.precision import cast_to_dtype
+
+    # The wavespeed comes from the EOS dependent variables, which the mixture
+    # EOS evaluates together in a single pass
+    state = make_fluid_state(cv, eos, dd=DD_VOLUME)
+    wavespeed = compute_wavespeed(discr.dim, eos, cv, state=state)
+
+    # Time step estimates are computed in double precision, regardless of the
+    # precision of the state
     return (
         characteristic_lengthscales(cv.array_context, discr)
-        / compute_wavespeed(discr, eos, cv)
+        / cast_to_dtype(wavespeed, np.float64)
     )
 
 
@@ -30,9 +30,13 @@ __doc__ = """
 .. autoclass:: KernelProfile
 .. autoclass:: PythonMemoryUsage
 .. autoclass:: DeviceMemoryUsage
+.. autoclass:: EOSCacheStatistics
+.. autoclass:: ChemistryReuseStatistics
 .. autofunction:: initialize_logmgr
 .. autofunction:: logmgr_add_cl_device_info
 .. autofunction:: logmgr_add_device_memory_usage
+.. autofunction:: logmgr_add_eos_cache_statistics
+.. autofunction:: logmgr_add_chemistry_reuse_statistics
 .. autofunction:: logmgr_add_many_discretization_quantities
 .. autofunction:: add_package_versions
 .. autofunction:: set_sim_state
@@ -98,6 +102,16 @@ def logmgr_add_device_memory_usage(logmgr: LogManager, queue: cl.CommandQueue):
     logmgr.add_quantity(DeviceMemoryUsage())
 
 
+def logmgr_add_eos_cache_statistics(logmgr: LogManager, eos_cache):
+    """Add the hit and miss counts of *eos_cache* to the log."""
+    logmgr.add_quantity(EOSCacheStatistics(eos_cache))
+
+
+def logmgr_add_chemistry_reuse_statistics(logmgr: LogManager, chemistry):
+    """Add the evaluation and skip counts of *chemistry* to the log."""
+    logmgr.add_quantity(ChemistryReuseStatistics(chemistry))
+
+
 def logmgr_add_many_discretization_quantities(logmgr: LogManager, discr, dim,
       extract_vars_for_logging, units_for_logging):
     """Add default discretization quantities to the logmgr."""
@@ -282,7 +296,9 @@ class DiscretizationBasedQuantity(PostLogQuantity, StateConsumer):
         if self.axis is not None:  # e.g. momentum
             quantity = quantity[self.axis]
 
-        return self._discr_reduction(quantity)
+        # Reduce in double precision, regardless of the precision of the state
+        from mirgecom.precision import cast_to_dtype
+        return self._discr_reduction(cast_to_dtype(quantity, np.float64))
 
 # }}}
 
@@ -396,3 +412,76 @@ class DeviceMemoryUsage(PostLogQuantity):
             return (self.total.value - self.free.value) / 1024 / 1024
 
 # }}}
+
+
+# {{{ EOS cache statistics
+
+class EOSCacheStatistics(MultiPostLogQuantity):
+    """Logging support for the hits and misses of an EOS result cache.
+
+    Reports the number of cache hits and misses (i.e., recomputations of the
+    thermochemistry) since the previous log entry.
+
+    Parameters
+    ----------
+    eos_cache
+        The :class:`~mirgecom.eos.EOSCache` to monitor, e.g. the
+        :attr:`~mirgecom.eos.PyrometheusMixture.cache` of the EOS.
+    """
+
+    def __init__(self, eos_cache, name_prefix: str = "eos_cache") -> None:
+        """Create the hit and miss quantities named after *name_prefix*."""
+        super().__init__([f"{name_prefix}_hits", f"{name_prefix}_misses"],
+                         ["1", "1"],
+                         ["EOS cache hits", "EOS cache misses"])
+
+        self.eos_cache = eos_cache
+        self._last_hits = eos_cache.hits
+        self._last_misses = eos_cache.misses
+
+    def __call__(self) -> list:
+        """Return the hits and misses since the last call."""
+        hits = self.eos_cache.hits - self._last_hits
+        misses = self.eos_cache.misses - self._last_misses
+        self._last_hits = self.eos_cache.hits
+        self._last_misses = self.eos_cache.misses
+
+        return [hits, misses]
+
+# }}}
+
+
+# {{{ Chemistry reuse statistics
+
+class ChemistryReuseStatistics(MultiPostLogQuantity):
+    """Logging support for the reuse of frozen chemistry source terms.
+
+    Reports the number of evaluations and of skipped evaluations (i.e., reuses
+    of frozen source terms) of the chemistry since the previous log entry.
+
+    Parameters
+    ----------
+    chemistry
+        The :class:`~mirgecom.eos.FrozenRateChemistry` to monitor.
+    """
+
+    def __init__(self, chemistry, name_prefix: str = "chemistry") -> None:
+        """Create the evaluation and skip quantities named after *name_prefix*."""
+        super().__init__([f"{name_prefix}_evaluations", f"{name_prefix}_skips"],
+                         ["1", "1"],
+                         ["Chemistry evaluations", "Chemistry evaluations skipped"])
+
+        self.chemistry = chemistry
+        self._last_evaluations = chemistry.evaluations
+        self._last_skips = chemistry.skips
+
+    def __call__(self) -> list:
+        """Return the evaluations and skips since the last call."""
+        evaluations = self.chemistry.evaluations - self._last_evaluations
+        skips = self.chemistry.skips - self._last_skips
+        self._last_evaluations = self.chemistry.evaluations
+        self._last_skips = self.chemistry.skips
+
+        return [evaluations, skips]
+
+# }}}
@@ -4,6 +4,7 @@
 .. autofunction:: get_mechanism_file_name
 .. autofunction:: get_mechanism_cti
 .. autofunction:: import_mechdata
+.. autofunction:: get_thermochem_class
 """
 
 __copyright__ = """
@@ -63,7 +64,84 @@ def import_mechdata():
 
 
 def get_mechanism_cti(mechanism_name: str) -> str:
-    """Get the contents of a mechanism CTI file."""
+    """Get the contents of a mechanism CTI file.
+
+    *mechanism_name* is either the name of a mechanism shipped with
+    :mod:`mirgecom` (e.g. ``"uiuc"``), or the path of a CTI file, such as
+    one written from a :class:`~mirgecom.mechanisms.reduction.MechanismReduction`.
+    """
+    if mechanism_name.endswith(".cti"):
+        with open(mechanism_name) as mech_file:
+            return mech_file.read()
+
     mech_data = import_mechdata()
     mech_file = mech_data / get_mechanism_file_name(mechanism_name)
     return mech_file.read_text()
+
+
+def get_thermochem_class(mechanism_cti: str, cache_dir: str = None, comm=None):
+    """Return the :mod:`pyrometheus` thermochemistry class for a mechanism.
+
+    The Python code generated by :mod:`pyrometheus` for the mechanism is stored
+    in a :class:`pytools.persistent_dict.WriteOncePersistentDict`, keyed by
+    *mechanism_cti*, a hash of the sources of :mod:`pyrometheus`, and the
+    version of :mod:`cantera`, and is reused from there when it is already
+    present. Only one rank of *comm* runs :mod:`cantera` and generates the
+    code if needed, while the others wait and then read the cached code.
+
+    Parameters
+    ----------
+    mechanism_cti: str
+        The contents of the mechanism CTI file, e.g. as returned by
+        :func:`get_mechanism_cti`.
+    cache_dir: str
+        Directory holding the generated code. Defaults to the :mod:`pytools`
+        cache directory. For large runs, it should be on a file system that is
+        visible to all ranks.
+    comm
+        Optional MPI communicator. Rank 0 generates the code.
+
+    Returns
+    -------
+    type
+        The generated :class:`pyrometheus.Thermochemistry` class, which is
+        instantiated with the array namespace to use, e.g. ``actx.np``.
+    """
+    from pytools.persistent_dict import (
+        WriteOncePersistentDict, NoSuchEntryError)
+    from mirgecom.utils import get_package_source_hash, get_package_version
+
+    code_cache = WriteOncePersistentDict(
+        "mirgecom-pyrometheus-thermochem-code-v1", container_dir=cache_dir)
+    key = (mechanism_cti, get_package_source_hash("pyrometheus"),
+           get_package_version("cantera"))
+
+    rank = 0 if comm is None else comm.Get_rank()
+
+    error = None
+    if rank == 0:
+        try:
+            code_cache.fetch(key)
+        except NoSuchEntryError:
+            try:
+                import cantera
+                import pyrometheus
+                sol = cantera.Solution(phase_id="gas", source=mechanism_cti)
+                code_cache.store_if_not_present(
+                    key, pyrometheus.gen_thermochem_code(sol))
+            except Exception as e:  # noqa: B902
+                error = e
+
+    if comm is not None:
+        # Doubles as a barrier: no rank proceeds before the code is stored
+        failed = comm.bcast(error is not None, root=0)
+        if failed and error is None:
+            raise RuntimeError("Generating the thermochemistry code failed "
+                               "on rank 0.")
+    if error is not None:
+        raise error
+
+    # As in pyrometheus.get_thermochem_class
+    namespace = {}
+    exec(compile(code_cache.fetch(key), "<generated code>", "exec"), namespace)
+    return namespace["Thermochemistry"]
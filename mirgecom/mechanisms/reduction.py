@@ -0,0 +1,289 @@
+"""Skeletal reduction of thermochemistry mechanisms.
+
+.. autoclass:: MechanismReduction
+.. autofunction:: reduce_mechanism
+"""
+
+__copyright__ = """
+Copyright (C) 2021 University of Illinois Board of Trustees
+"""
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import ast
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class MechanismReduction:
+    """Result of a skeletal mechanism reduction by :func:`reduce_mechanism`.
+
+    .. attribute:: cti
+
+        The CTI text of the skeletal mechanism.
+
+    .. attribute:: species
+
+        Names of the species retained in the skeletal mechanism.
+
+    .. attribute:: nreactions
+
+        Number of reactions retained in the skeletal mechanism.
+
+    .. attribute:: ignition_delay_errors
+
+        Relative errors of the ignition delay time of the skeletal mechanism
+        with respect to the full mechanism, one per target condition.
+
+    .. attribute:: temperature_errors
+
+        Maximum relative deviations of the temperature history of the skeletal
+        mechanism from that of the full mechanism, one per target condition.
+    """
+
+    cti: str
+    species: Tuple[str, ...]
+    nreactions: int
+    ignition_delay_errors: np.ndarray
+    temperature_errors: np.ndarray
+
+
+def _get_stoich_coeffs(sol, name):
+    """Return a dense species-by-reaction stoichiometric coefficient array."""
+    coeffs = getattr(sol, name)
+    if callable(coeffs):  # Cantera < 2.6
+        coeffs = coeffs()
+    if hasattr(coeffs, "toarray"):  # sparse
+        coeffs = coeffs.toarray()
+    return np.asarray(coeffs)
+
+
+def _run_reactor(sol, condition, times):
+    """Return the temperatures and mass fractions of a constant-pressure reactor.
+
+    The reactor is started from *condition*, a tuple of temperature, pressure,
+    and composition (as mole fractions), and sampled at *times*.
+    """
+    import cantera
+
+    sol.TPX = condition
+    reactor = cantera.IdealGasConstPressureReactor(sol)
+    net = cantera.ReactorNet([reactor])
+
+    temperatures = np.empty(len(times))
+    mass_fractions = np.empty((len(times), sol.n_species))
+    for i, t in enumerate(times):
+        if t > 0:
+            net.advance(t)
+        temperatures[i] = reactor.T
+        mass_fractions[i] = reactor.thermo.Y
+
+    return temperatures, mass_fractions
+
+
+def _get_drg_coefficients(sol, pressure, temperatures, mass_fractions):
+    r"""Return the maximum over the samples of the DRG coefficients $r_{AB}$.
+
+    $r_{AB} = \sum_i |\nu_{A,i}\omega_i\delta_{B,i}| / \sum_i |\nu_{A,i}\omega_i|$,
+    where $\delta_{B,i}$ is one if species $B$ takes part in reaction $i$.
+    """
+    reactant_coeffs = _get_stoich_coeffs(sol, "reactant_stoich_coeffs")
+    product_coeffs = _get_stoich_coeffs(sol, "product_stoich_coeffs")
+    net_coeffs = product_coeffs - reactant_coeffs
+    involved = ((reactant_coeffs != 0) | (product_coeffs != 0)).astype(np.float64)
+
+    r_max = np.zeros((sol.n_species, sol.n_species))
+    for temperature, y in zip(temperatures, mass_fractions):
+        sol.TPY = temperature, pressure, y
+        abs_rates = np.abs(net_coeffs * sol.net_rates_of_progress)
+        denominator = abs_rates.sum(axis=1)
+        numerator = abs_rates @ involved.T
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r_ab = np.where(denominator[:, None] > 0,
+                            numerator / denominator[:, None], 0)
+        r_max = np.maximum(r_max, r_ab)
+
+    return r_max
+
+
+def _filter_cti(mechanism_cti, species, reaction_mask):
+    """Return the CTI text with only the given species and reactions.
+
+    The CTI input (which is Python syntax) is parsed, and its entries are
+    copied verbatim, except for the dropped species and reactions and for the
+    species lists and third-body efficiencies, which are rewritten.
+    """
+    species = set(species)
+    tree = ast.parse(mechanism_cti)
+
+    def replace_keyword(entry_text, call, keyword, new_value):
+        for kw in call.keywords:
+            if kw.arg == keyword:
+                old_value = ast.get_source_segment(mechanism_cti, kw.value)
+                return entry_text.replace(old_value, repr(new_value), 1)
+        return entry_text
+
+    entries = []
+    ireaction = 0
+    for stmt in tree.body:
+        entry_text = ast.get_source_segment(mechanism_cti, stmt)
+        call = stmt.value if isinstance(stmt, ast.Expr) else None
+        if not isinstance(call, ast.Call) or not isinstance(call.func, ast.Name):
+            entries.append(entry_text)
+            continue
+
+        func = call.func.id
+        kwargs = {kw.arg: kw.value for kw in call.keywords}
+        if func == "ideal_gas":
+            old_species = ast.literal_eval(kwargs["species"]).split()
+            entry_text = replace_keyword(
+                entry_text, call, "species",
+                " ".join(s for s in old_species if s in species))
+        elif func == "species":
+            name = ast.literal_eval(kwargs["name"] if "name" in kwargs
+                                    else call.args[0])
+            if name not in species:
+                continue
+        elif func.endswith("reaction"):
+            keep = reaction_mask[ireaction]
+            ireaction += 1
+            if not keep:
+                continue
+            if "efficiencies" in kwargs:
+                efficiencies = ast.literal_eval(kwargs["efficiencies"]).split()
+                entry_text = replace_keyword(
+                    entry_text, call, "efficiencies",
+                    " ".join(eff for eff in efficiencies
+                             if eff.split(":")[0] in species))
+
+        entries.append(entry_text)
+
+    if ireaction != len(reaction_mask):
+        raise ValueError("could not match the CTI reaction entries to the "
+                         "reactions of the mechanism")
+
+    return "\n\n".join(
+        ["# Skeletal mechanism generated by mirgecom.mechanisms.reduction"]
+        + entries) + "\n"
+
+
+def reduce_mechanism(mechanism_cti, conditions, target_species,
+                     threshold=0.1, t_end=1e-2, nsamples=500):
+    """Build a skeletal mechanism by directed relation graph (DRG) analysis.
+
+    Constant-pressure reactors are run with the full mechanism from each of
+    the target *conditions*, and the DRG coefficients between each pair of
+    species are evaluated on the sampled states. The skeletal mechanism retains
+    the species reachable from *target_species* (and those present initially)
+    through graph edges whose coefficient exceeds *threshold* in any sample,
+    and the reactions among them. The reactors are then rerun with the
+    skeletal mechanism to report the reduction error.
+
+    Parameters
+    ----------
+    mechanism_cti: str
+        The CTI text of the full mechanism, e.g. from
+        :func:`~mirgecom.mechanisms.get_mechanism_cti`.
+    conditions
+        List of tuples of initial temperature, pressure, and composition
+        (mole fractions, in any format accepted by :mod:`cantera`).
+    target_species
+        Names of the species that the skeletal mechanism must reproduce,
+        e.g. the fuel, oxidizer, and major products.
+    threshold: float
+        The DRG threshold; larger values give smaller mechanisms.
+    t_end: float
+        Length of the reactor runs, which should cover ignition.
+    nsamples: int
+        Number of uniformly spaced samples in each reactor run.
+
+    Returns
+    -------
+    MechanismReduction
+        The skeletal mechanism and its error against the full mechanism. Its
+        :attr:`~MechanismReduction.cti` can be written to a file and loaded
+        with :func:`~mirgecom.mechanisms.get_mechanism_cti`, or passed to
+        :func:`~mirgecom.mechanisms.get_thermochem_class`.
+    """
+    import cantera
+
+    sol = cantera.Solution(phase_id="gas", source=mechanism_cti)
+    species_index = {name: i for i, name in enumerate(sol.species_names)}
+    times = np.linspace(0, t_end, nsamples)
+
+    full_runs = []
+    r_max = np.zeros((sol.n_species, sol.n_species))
+    required = set(target_species)
+    for condition in conditions:
+        temperatures, mass_fractions = _run_reactor(sol, condition, times)
+        full_runs.append(temperatures)
+        required.update(
+            name for name, y in zip(sol.species_names, mass_fractions[0])
+            if y > 0)
+        r_max = np.maximum(r_max, _get_drg_coefficients(
+            sol, condition[1], temperatures, mass_fractions))
+
+    # Graph search from the required species
+    unknown = required - set(species_index)
+    if unknown:
+        raise ValueError(f"unknown species: {', '.join(sorted(unknown))}")
+    kept = set(species_index[name] for name in required)
+    stack = list(kept)
+    while stack:
+        a = stack.pop()
+        for b in np.flatnonzero(r_max[a] > threshold):
+            if b not in kept:
+                kept.add(b)
+                stack.append(b)
+
+    kept_species = tuple(name for i, name in enumerate(sol.species_names)
+                         if i in kept)
+    reaction_mask = [
+        all(name in kept_species
+            for name in list(rxn.reactants) + list(rxn.products))
+        for rxn in sol.reactions()]
+
+    reduced_cti = _filter_cti(mechanism_cti, kept_species, reaction_mask)
+    reduced_sol = cantera.Solution(phase_id="gas", source=reduced_cti)
+
+    def ignition_delay(temperatures):
+        return times[np.argmax(np.gradient(temperatures, times))]
+
+    ignition_delay_errors = []
+    temperature_errors = []
+    for condition, full_temperatures in zip(conditions, full_runs):
+        reduced_temperatures, _ = _run_reactor(reduced_sol, condition, times)
+        full_delay = ignition_delay(full_temperatures)
+        ignition_delay_errors.append(
+            abs(ignition_delay(reduced_temperatures) - full_delay)
+            / max(full_delay, times[1]))
+        temperature_errors.append(np.max(
+            np.abs(reduced_temperatures - full_temperatures) / full_temperatures))
+
+    return MechanismReduction(
+        cti=reduced_cti,
+        species=kept_species,
+        nreactions=sum(reaction_mask),
+        ignition_delay_errors=np.array(ignition_delay_errors),
+        temperature_errors=np.array(temperature_errors))
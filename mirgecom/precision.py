@@ -0,0 +1,164 @@
+""":mod:`mirgecom.precision` provides control over the floating point precision.
+
+Floating point precision policies
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Time stepping a bandwidth-bound solver moves the solution state (and the
+Runge-Kutta stage data) through memory several times per step, so storing it in
+single precision halves the bytes moved. Quantities that need the full precision
+(the temperature Newton iterations, reductions, and time step estimates) are
+evaluated in double precision regardless of the storage precision.
+
+.. autoclass:: PrecisionPolicy
+.. autofunction:: cast_to_dtype
+.. autofunction:: make_mixed_precision_timestepper
+"""
+
+__copyright__ = """
+Copyright (C) 2021 University of Illinois Board of Trustees
+"""
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+from dataclasses import dataclass, field
+from typing import Mapping
+
+import numpy as np
+from arraycontext import is_array_container, rec_map_array_container
+
+
+def cast_to_dtype(ary, dtype):
+    """Return *ary* with all its floating point arrays converted to *dtype*.
+
+    *ary* may be an array, an array container (e.g. a
+    :class:`~meshmode.dof_array.DOFArray` or a
+    :class:`~mirgecom.fluid.ConservedVars`), or anything else, which is
+    returned unchanged. Arrays that already have the requested type are not
+    copied.
+    """
+    dtype = np.dtype(dtype)
+
+    def cast(subary):
+        subary_dtype = getattr(subary, "dtype", None)
+        if (subary_dtype is None or subary_dtype.kind != "f"
+                or subary_dtype == dtype):
+            return subary
+        return subary.astype(dtype)
+
+    if is_array_container(ary):
+        return rec_map_array_container(cast, ary)
+    return cast(ary)
+
+
+@dataclass(frozen=True)
+class PrecisionPolicy:
+    """Floating point types used for the different classes of data.
+
+    .. attribute:: state_dtype
+
+        Type in which the solution state and time integrator stage data are
+        stored, :class:`numpy.float64` by default.
+
+    .. attribute:: io_dtype
+
+        Default type of the fields written to restart and visualization files,
+        :class:`numpy.float64` by default.
+
+    .. attribute:: io_field_dtypes
+
+        Mapping from field names (keys of the restart data, or names of the
+        visualization fields) to the types in which they are written,
+        overriding :attr:`io_dtype`.
+
+    .. automethod:: to_state
+    .. automethod:: to_full
+    .. automethod:: get_io_dtype
+    .. automethod:: cast_io_fields
+    .. automethod:: cast_restart_data
+    """
+
+    state_dtype: np.dtype = np.float64
+    io_dtype: np.dtype = np.float64
+    io_field_dtypes: Mapping[str, np.dtype] = field(default_factory=dict)
+
+    def to_state(self, ary):
+        """Convert *ary* to the storage precision of the solution state."""
+        return cast_to_dtype(ary, self.state_dtype)
+
+    def to_full(self, ary):
+        """Convert *ary* to double precision, e.g. for reductions or solves."""
+        return cast_to_dtype(ary, np.float64)
+
+    def get_io_dtype(self, name):
+        """Return the type in which the field *name* is written."""
+        return self.io_field_dtypes.get(name, self.io_dtype)
+
+    def cast_io_fields(self, io_fields):
+        """Convert a list of ``(name, field)`` tuples for visualization."""
+        return [(name, cast_to_dtype(fld, self.get_io_dtype(name)))
+                for name, fld in io_fields]
+
+    def cast_restart_data(self, restart_data):
+        """Convert the fields of the restart data dictionary *restart_data*."""
+        return {name: cast_to_dtype(value, self.get_io_dtype(name))
+                for name, value in restart_data.items()}
+
+
+def make_mixed_precision_timestepper(timestepper, precision_policy):
+    """Wrap *timestepper* to store the state and stages in reduced precision.
+
+    The state passed to the RHS and the RHS result are converted to
+    :attr:`PrecisionPolicy.state_dtype`, so that the stage data of the
+    integrator, as well as the returned state, are stored in that precision.
+
+    The operators keep their temporaries in the precision of the state: the
+    normals and nodes are converted once to the type of the state and cached
+    (see :mod:`mirgecom.geometry`), and the mixture EOS returns its dependent
+    variables in that type after solving for the temperature in double
+    precision. Data that is already in the state type is not copied, so the
+    conversions only cost a pass over the operator results that the
+    :mod:`grudge` operators return in double precision.
+
+    Parameters
+    ----------
+    timestepper
+        Function that advances the state from t=time to t=(time+dt), with call
+        signature ``timestepper(state, t, dt, rhs)``, e.g.
+        :func:`~mirgecom.integrators.rk4_step`.
+    precision_policy: :class:`PrecisionPolicy`
+        The precision policy
+
+    Returns
+    -------
+    callable
+        A timestepper with call signature ``timestepper(state, t, dt, rhs)``
+        that can be passed to :func:`mirgecom.steppers.advance_state`.
+    """
+    to_state = precision_policy.to_state
+
+    def mixed_precision_timestepper(state, t, dt, rhs):
+        def state_rhs(t, state):
+            return to_state(rhs(t, to_state(state)))
+
+        return to_state(timestepper(state=to_state(state), t=t, dt=dt,
+                                    rhs=state_rhs))
+
+    return mixed_precision_timestepper
@@ -41,8 +41,17 @@ def read_restart_data(actx, filename):
             return pickle.load(f)
 
 
-def write_restart_file(actx, restart_data, filename, comm=None):
-    """Pickle the simulation data into a file for use in restarting."""
+def write_restart_file(actx, restart_data, filename, comm=None,
+                       precision_policy=None):
+    """Pickle the simulation data into a file for use in restarting.
+
+    If a :class:`~mirgecom.precision.PrecisionPolicy` is given in
+    *precision_policy*, the fields of *restart_data* are stored in the
+    precision it assigns to them.
+    """
+    if precision_policy is not None:
+        restart_data = precision_policy.cast_restart_data(restart_data)
+
     rank = 0
     if comm:
         rank = comm.Get_rank()
@@ -19,6 +19,8 @@ Mesh utilities
 --------------
 
 .. autofunction:: generate_and_distribute_mesh
+.. autofunction:: group_boundary_tags
+.. autoclass:: BoundaryTagGroup
 """
 
 __copyright__ = """
@@ -46,6 +48,7 @@ THE SOFTWARE.
 """
 
 import logging
+from dataclasses import dataclass
 
 import numpy as np
 import grudge.op as op
@@ -130,7 +133,8 @@ def get_sim_timestep(discr, state, t, dt, cfl, eos,
 
 
 def write_visfile(discr, io_fields, visualizer, vizname,
-                  step=0, t=0, overwrite=False, vis_timer=None):
+                  step=0, t=0, overwrite=False, vis_timer=None,
+                  precision_policy=None):
     """Write VTK output for the fields specified in *io_fields*.
 
     Parameters
@@ -140,7 +144,12 @@ def write_visfile(discr, io_fields, visualizer, vizname,
         VTK output object.
     io_fields:
         List of tuples indicating the (name, data) for each field to write.
+    precision_policy: :class:`~mirgecom.precision.PrecisionPolicy`
+        If given, the fields are written in the precision it assigns to them.
     """
+    if precision_policy is not None:
+        io_fields = precision_policy.cast_io_fields(io_fields)
+
     from contextlib import nullcontext
     from mirgecom.io import make_rank_fname, make_par_fname
 
@@ -242,6 +251,116 @@ def generate_and_distribute_mesh(comm, generate_mesh):
     return local_mesh, global_nelements
 
 
+@dataclass(frozen=True)
+class BoundaryTagGroup:
+    """Boundary tag for the union of the faces of several boundary tags.
+
+    Created by :func:`group_boundary_tags`.
+
+    .. attribute:: tags
+
+        Tuple of the boundary tags whose faces carry this tag.
+    """
+
+    tags: tuple
+
+
+def group_boundary_tags(mesh, boundaries):
+    """Merge boundary tags that share a boundary condition into a single tag.
+
+    For each boundary condition object that is used for several tags in
+    *boundaries*, the faces of all of those tags are additionally tagged with
+    a :class:`BoundaryTagGroup`. Operators such as
+    :func:`mirgecom.euler.euler_operator` then evaluate that condition on a
+    single boundary restriction, with one set of projections and one flux
+    evaluation, so that the number of boundary kernels depends on the number of
+    distinct boundary conditions rather than on the number of tags.
+
+    The mesh may be a local partition of a distributed mesh. A face that is in
+    several of the grouped tags is only counted once in the group.
+
+    Parameters
+    ----------
+    mesh: :class:`meshmode.mesh.Mesh`
+        The mesh carrying the tags in *boundaries*
+    boundaries
+        Dictionary mapping boundary tags to boundary condition objects
+
+    Returns
+    -------
+    grouped_mesh: :class:`meshmode.mesh.Mesh`
+        *mesh* with the additional group tags, or *mesh* itself if no tags were
+        grouped
+    grouped_boundaries
+        Dictionary mapping the group tags (as
+        :class:`~grudge.dof_desc.DTAG_BOUNDARY`), and any tags that were not
+        grouped, to their boundary condition objects. Use this with
+        discretizations of *grouped_mesh*.
+    """
+    from grudge.dof_desc import DOFDesc, DTAG_BOUNDARY
+
+    def mesh_btag(btag):
+        if isinstance(btag, DOFDesc):
+            btag = btag.domain_tag
+        if isinstance(btag, DTAG_BOUNDARY):
+            btag = btag.tag
+        return btag
+
+    btags_for_boundary = {}
+    for btag, bndry in boundaries.items():
+        btags_for_boundary.setdefault(id(bndry), (bndry, []))[1].append(btag)
+
+    grouped_boundaries = {}
+    group_tags = []
+    for bndry, btags in btags_for_boundary.values():
+        if len(btags) == 1:
+            grouped_boundaries[btags[0]] = bndry
+        else:
+            group_tag = BoundaryTagGroup(tuple(mesh_btag(btag) for btag in btags))
+            grouped_boundaries[DTAG_BOUNDARY(group_tag)] = bndry
+            group_tags.append(group_tag)
+
+    if not group_tags:
+        return mesh, boundaries
+
+    # Appending keeps the bit positions of the existing tags
+    boundary_tags = list(mesh.boundary_tags) + group_tags
+    group_bits = [
+        (sum(mesh.boundary_tag_bit(btag) for btag in group_tag.tags),
+         1 << boundary_tags.index(group_tag))
+        for group_tag in group_tags]
+
+    facial_adjacency_groups = []
+    for fagrp_map in mesh.facial_adjacency_groups:
+        new_fagrp_map = {}
+        for ineighbor_group, fagrp in fagrp_map.items():
+            if ineighbor_group is None:
+                # Boundary faces store their tags as a negated bit field
+                is_bdry = fagrp.neighbors < 0
+                tag_bits = np.where(is_bdry, -fagrp.neighbors, 0)
+                for member_bits, group_bit in group_bits:
+                    tag_bits = np.where(tag_bits & member_bits,
+                                        tag_bits | group_bit, tag_bits)
+                fagrp = fagrp.copy(
+                    neighbors=np.where(is_bdry, -tag_bits, fagrp.neighbors)
+                    .astype(fagrp.neighbors.dtype))
+            new_fagrp_map[ineighbor_group] = fagrp
+        facial_adjacency_groups.append(new_fagrp_map)
+
+    from meshmode.mesh import Mesh
+    grouped_mesh = Mesh(
+        vertices=mesh.vertices,
+        groups=mesh.groups,
+        nodal_adjacency=mesh.nodal_adjacency,
+        facial_adjacency_groups=facial_adjacency_groups,
+        boundary_tags=boundary_tags,
+        vertex_id_dtype=mesh.vertex_id_dtype,
+        element_id_dtype=mesh.element_id_dtype,
+        is_conforming=mesh.is_conforming)
+
+    return grouped_mesh, grouped_boundaries
+
+
 def create_parallel_grid(comm, generate_grid):
     """Generate and distribute mesh compatibility interface."""
     from warnings import warn
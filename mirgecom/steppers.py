@@ -2,6 +2,9 @@
 
 .. autofunction:: advance_state
 .. autofunction:: generate_singlerate_leap_advancer
+.. autofunction:: make_compiled_timestepper
+.. autofunction:: make_operator_split_timestepper
+.. autoclass:: MultirateMethod
 """
 
 __copyright__ = """
@@ -27,8 +30,11 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 THE SOFTWARE.
 """
+from arraycontext import freeze, thaw
 from logpyle import set_dt
 from mirgecom.logging_quantities import set_sim_state
+from mirgecom.integrators.embedded_rk import AdaptiveRKIntegrator
+from mirgecom.utils import tracing
 
 
 def _advance_state_stepper_func(rhs, timestepper,
@@ -96,8 +102,16 @@ def _advance_state_stepper_func(rhs, timestepper,
         if pre_step_callback is not None:
             state, dt = pre_step_callback(state=state, step=istep, t=t, dt=dt)
 
-        state = timestepper(state=state, t=t, dt=dt, rhs=rhs)
-        t += dt
+        if isinstance(timestepper, AdaptiveRKIntegrator):
+            # The integrator picks the step size, but must not step past t_final
+            remaining = t_final - t
+            state, dt, next_dt = timestepper.adaptive_step(
+                state=state, t=t, dt=min(dt, remaining), rhs=rhs)
+            t = t_final if dt >= remaining else t + dt
+            dt = next_dt
+        else:
+            state = timestepper(state=state, t=t, dt=dt, rhs=rhs)
+            t += dt
         istep += 1
 
         if post_step_callback is not None:
@@ -128,7 +142,8 @@ def _advance_state_leap(rhs, timestepper, state,
         This function should take time and state as arguments, with
         a call with signature ``rhs(t, state)``.
     timestepper
-        An instance of :class:`leap.MethodBuilder`.
+        An instance of :class:`leap.MethodBuilder` or of
+        :class:`MultirateMethod`.
     get_timestep
         Function that should return dt for the next step. This interface allows
         user-defined adaptive timestepping. A negative return value indicated that
@@ -170,8 +185,14 @@ def _advance_state_leap(rhs, timestepper, state,
     if get_timestep:
         dt = get_timestep(state=state, t=t, dt=dt)
 
-    stepper_cls = generate_singlerate_leap_advancer(timestepper, component_id,
-                                                    rhs, t, dt, state)
+    if isinstance(timestepper, MultirateMethod):
+        stepper_cls = _set_up_leap_stepper(timestepper,
+                                           timestepper.component_id,
+                                           timestepper.get_function_map(),
+                                           t, dt, state)
+    else:
+        stepper_cls = generate_singlerate_leap_advancer(timestepper, component_id,
+                                                        rhs, t, dt, state)
     while t < t_final:
 
         if get_timestep:
@@ -201,10 +222,126 @@ def _advance_state_leap(rhs, timestepper, state,
     return istep, t, state
 
 
+# Generated leap stepper classes, by method and component id
+_leap_stepper_classes = {}
+
+
+def _get_leap_parameter_key(value):
+    """Return a hashable key for *value*, part of the state of a leap method.
+
+    Raises :exc:`TypeError` for values, such as functions, whose effect on the
+    generated code cannot be determined.
+    """
+    from numbers import Number
+    import numpy as np
+
+    if value is None or isinstance(value, (bool, Number, str)):
+        # The type tells apart e.g. 1, 1.0, and True
+        return (type(value).__name__, repr(value))
+    if isinstance(value, (tuple, list)):
+        return (type(value).__name__,
+                tuple(_get_leap_parameter_key(item) for item in value))
+    if isinstance(value, dict):
+        return ("dict", tuple(sorted(
+            ((_get_leap_parameter_key(k), _get_leap_parameter_key(v))
+             for k, v in value.items()), key=repr)))
+    if isinstance(value, np.ndarray) and value.dtype != object:
+        return ("ndarray", value.dtype.str, value.shape,
+                tuple(value.ravel().tolist()))
+
+    if hasattr(value, "__getinitargs__"):
+        # pymbolic expressions
+        state = value.__getinitargs__()
+    elif hasattr(value, "__dict__") and not callable(value):
+        state = vars(value)
+    else:
+        raise TypeError(f"cannot determine the effect of {value!r} on the "
+                        "generated leap code")
+
+    value_type = type(value)
+    return (f"{value_type.__module__}.{value_type.__qualname__}",
+            _get_leap_parameter_key(state))
+
+
+def _get_leap_stepper_key(timestepper, component_id):
+    """Return a key identifying the code generated for *timestepper*.
+
+    The key is made of the class and the complete instance state of the method
+    builder, and of hashes of the sources of :mod:`leap` and :mod:`dagrt`,
+    which generate the code. Returns *None* if part of the state cannot be
+    turned into a key, in which case the code must not be cached.
+    """
+    from mirgecom.utils import get_package_source_hash
+
+    method_builder = timestepper
+    if isinstance(timestepper, MultirateMethod):
+        method_builder = timestepper.method_builder
+
+    try:
+        builder_key = _get_leap_parameter_key(method_builder)
+    except TypeError:
+        return None
+
+    return (builder_key, component_id,
+            get_package_source_hash("leap"), get_package_source_hash("dagrt"))
+
+
+def _get_leap_stepper_class(timestepper, component_id, cache_dir=None):
+    """Return the generated stepper class for *timestepper*.
+
+    *timestepper* is a :class:`leap.MethodBuilder` or a
+    :class:`MultirateMethod`. Classes are cached in memory, and the generated
+    Python code also on disk (in *cache_dir*, by default the :mod:`pytools`
+    cache directory), so that the code generation is done once per method
+    rather than once per :func:`advance_state` call. Methods whose state
+    includes values of unknown effect on the generated code, such as
+    functions, are not cached.
+    """
+    key = _get_leap_stepper_key(timestepper, component_id)
+    if key is not None:
+        stepper_cls = _leap_stepper_classes.get(key)
+        if stepper_cls is not None:
+            return stepper_cls
+
+    from pytools.persistent_dict import (
+        WriteOncePersistentDict, NoSuchEntryError)
+    code_cache = WriteOncePersistentDict(
+        "mirgecom-leap-stepper-code-v3", container_dir=cache_dir)
+
+    class_name = "Method"
+    try:
+        if key is None:
+            raise NoSuchEntryError(key)
+        python_code = code_cache.fetch(key)
+    except NoSuchEntryError:
+        method_builder = timestepper
+        if isinstance(timestepper, MultirateMethod):
+            method_builder = timestepper.method_builder
+
+        from dagrt.codegen import PythonCodeGenerator
+        codegen = PythonCodeGenerator(class_name=class_name)
+        python_code = codegen(method_builder.generate())
+        if key is not None:
+            code_cache.store_if_not_present(key, python_code)
+
+    # As in dagrt.codegen.PythonCodeGenerator.get_class
+    namespace = {}
+    exec(compile(python_code, "<generated code>", "exec"), namespace)
+    stepper_cls = namespace[class_name]
+
+    if key is not None:
+        _leap_stepper_classes[key] = stepper_cls
+    return stepper_cls
+
+
 def generate_singlerate_leap_advancer(timestepper, component_id, rhs, t, dt,
-                                      state):
+                                      state, cache_dir=None):
     """Generate Leap code to advance all state at the same timestep, without substepping.
 
+    The generated stepper class is cached in memory and on disk, keyed by the
+    type and the instance state of *timestepper* and by *component_id*, so that
+    only the state, time, and timestep are set up anew on later calls.
+
     Parameters
     ----------
     timestepper
@@ -223,23 +360,109 @@ def generate_singlerate_leap_advancer(timestepper, component_id, rhs, t, dt,
     state: numpy.ndarray
         Agglomerated object array containing at least the state variables that
         will be advanced by this stepper
+    cache_dir: str
+        Optional directory for the on-disk cache of the generated code
 
     Returns
     -------
     dagrt.codegen.python.StepperInterface
         Python class implementing leap method, and generated by dagrt
     """
-    code = timestepper.generate()
-    from dagrt.codegen import PythonCodeGenerator
-    codegen = PythonCodeGenerator(class_name="Method")
-    stepper_cls = codegen.get_class(code)(function_map={
-        "<func>" + component_id: rhs,
-        })
+    return _set_up_leap_stepper(timestepper, component_id,
+                                {"<func>" + component_id: rhs}, t, dt, state,
+                                cache_dir=cache_dir)
+
+
+def _set_up_leap_stepper(timestepper, component_id, function_map, t, dt,
+                         state, cache_dir=None):
+    """Return the generated stepper of *timestepper*, set up to start at *t*."""
+    method_cls = _get_leap_stepper_class(timestepper, component_id,
+                                         cache_dir=cache_dir)
+    stepper_cls = method_cls(function_map=function_map)
     stepper_cls.set_up(t_start=t, dt_start=dt, context={component_id: state})
 
     return stepper_cls
 
 
+class MultirateMethod:
+    r"""Multirate time integration of a right-hand side with several components.
+
+    The time derivative of the state is the sum of the components, e.g. of the
+    :func:`~mirgecom.euler.euler_operator`, the
+    :func:`~mirgecom.diffusion.diffusion_operator`, and the chemical species
+    sources. Each component is evaluated every *interval* substeps, where a
+    substep is the largest step divided by the largest interval, so that
+    components limited to small steps (*interval* 1) are evaluated every
+    substep, and the others less often. The integration uses the multirate
+    Adams-Bashforth methods of
+    :class:`leap.multistep.multirate.MultiRateMultiStepMethodBuilder`.
+
+    Pass an instance as the *timestepper* to :func:`advance_state`, together
+    with the largest step as *dt*. The *rhs* argument of :func:`advance_state`
+    is then ignored.
+
+    .. attribute:: components
+
+        Tuple of tuples ``(name, rhs, interval)``, where *rhs* has the
+        signature ``rhs(t, state)``.
+
+    .. attribute:: order
+    .. attribute:: component_id
+    .. attribute:: method_builder
+
+        The :class:`leap.MethodBuilder` of the method.
+
+    .. automethod:: __init__
+    .. automethod:: get_function_map
+    """
+
+    def __init__(self, components, order=3, component_id="state"):
+        """Create the method.
+
+        Parameters
+        ----------
+        components
+            Sequence of tuples ``(name, rhs, interval)``, one per RHS component.
+            The intervals must be divisors of the largest interval.
+        order: int
+            Order of the Adams-Bashforth methods
+        component_id
+            State id (required input for leap method generation)
+        """
+        from leap.multistep.multirate import (
+            MultiRateMultiStepMethodBuilder, MultiRateHistory)
+
+        components = tuple(components)
+        if not components:
+            raise ValueError("MultirateMethod requires at least one component.")
+        names = [name for name, _, _ in components]
+        if len(set(names)) != len(names):
+            raise ValueError("RHS component names must be unique.")
+        nsubsteps = max(interval for _, _, interval in components)
+        for name, _, interval in components:
+            if interval < 1 or nsubsteps % interval:
+                raise ValueError(f"Interval {interval} of RHS component '{name}' "
+                                 f"is not a divisor of {nsubsteps}.")
+
+        self.components = components
+        self.order = order
+        self.component_id = component_id
+        self.method_builder = MultiRateMultiStepMethodBuilder(
+            default_order=order,
+            system_description=(
+                ("dt", component_id, "=",
+                 *[MultiRateHistory(interval, f"<func>{name}", (component_id,))
+                   for name, _, interval in components]),),
+            static_dt=True)
+
+    def get_function_map(self):
+        """Return the functions for the generated code, by name."""
+        def wrap(rhs):
+            return lambda t, **kwargs: rhs(t, kwargs[self.component_id])
+
+        return {f"<func>{name}": wrap(rhs) for name, rhs, _ in self.components}
+
+
 def advance_state(rhs, timestepper, state, t_final,
                   component_id="state",
                   t=0.0, istep=0, dt=0,
@@ -263,6 +486,11 @@ def advance_state(rhs, timestepper, state, t_final,
         responsible for generating timestepper code from the method instructions
         before using it, as well as providing context in the form of the state
         to be integrated, the initial time and timestep, and the RHS function.
+        It may also be a :class:`MultirateMethod`, or a
+        :class:`~mirgecom.integrators.embedded_rk.AdaptiveRKIntegrator`, which
+        takes *dt* as the proposal for the first step, and then chooses the
+        step sizes itself. The *dt* passed to the callbacks is then the proposal
+        for the next step.
     component_id
         State id (required input for leap method generation)
     get_timestep
@@ -323,6 +551,10 @@ def advance_state(rhs, timestepper, state, t_final,
         if isinstance(timestepper, MethodBuilder):
             leap_timestepper = True
 
+    if isinstance(timestepper, MultirateMethod):
+        leap_timestepper = True
+        component_id = timestepper.component_id
+
     if leap_timestepper:
         (current_step, current_t, current_state) = \
             _advance_state_leap(
@@ -347,3 +579,151 @@ def advance_state(rhs, timestepper, state, t_final,
             )
 
     return current_step, current_t, current_state
+
+
+def make_compiled_timestepper(actx, timestepper, comm=None, eos=None):
+    """Wrap *timestepper* so that each step runs as a single compiled program.
+
+    The first time the returned timestepper is called with a given *rhs*, one
+    full step of *timestepper*, including all the RHS evaluations it makes
+    (e.g. :func:`~mirgecom.euler.euler_operator`,
+    :func:`~mirgecom.diffusion.diffusion_operator`, and the EOS calls within
+    them), is traced with :meth:`arraycontext.ArrayContext.compile`. Subsequent
+    steps reuse the compiled program, with the time and timestep size passed as
+    run-time arguments.
+
+    With a lazily-evaluating array context (e.g. one based on :mod:`pytato`),
+    this fuses the whole step into a single program and removes the per-kernel
+    Python dispatch and launch overhead of eager evaluation. With an eager array
+    context, the step runs unchanged.
+
+    Parameters
+    ----------
+    actx: :class:`arraycontext.ArrayContext`
+        The array context on which the state lives
+    timestepper
+        Function that advances the state from t=time to t=(time+dt), with call
+        signature ``timestepper(state, t, dt, rhs)``, e.g.
+        :func:`~mirgecom.integrators.rk4_step`. :mod:`leap` methods are not
+        supported.
+    comm
+        Optional MPI communicator. The cross-rank face exchange cannot be traced
+        into a compiled program, so an error is raised if it has more than one
+        rank.
+    eos: :class:`~mirgecom.eos.GasEOS`
+        The EOS used by the RHS. The host-side features of an EOS, such as the
+        temperature warm start and the activity masking of
+        :class:`~mirgecom.eos.PyrometheusMixture`, or the tabulated temperature
+        lookup, cannot be traced, so an error is raised if any are enabled (see
+        :meth:`~mirgecom.eos.GasEOS.get_host_side_features`). Its
+        :class:`~mirgecom.eos.EOSCache` is cleared before and after tracing,
+        so that the trace neither reuses eagerly computed results nor keeps the
+        traced arrays alive. Pass the EOS, since these checks cannot be
+        done otherwise.
+
+    While the step is traced, :func:`mirgecom.utils.is_tracing` is *True*, and
+    the caches of boundary exterior data and of geometric quantities are
+    bypassed, since the time is a traced argument and the traced arrays must
+    not outlive the trace.
+
+    Returns
+    -------
+    callable
+        A timestepper with call signature ``timestepper(state, t, dt, rhs)``
+        that can be passed to :func:`advance_state`.
+    """
+    if comm is not None and comm.Get_size() > 1:
+        raise NotImplementedError("Compiled timestepping does not yet support "
+                                  "distributed-memory runs.")
+
+    host_side_features = ([] if eos is None
+                          else eos.get_host_side_features())
+    if host_side_features:
+        raise ValueError("Compiled timestepping cannot trace the host-side EOS "
+                         "features: " + ", ".join(host_side_features) + ".")
+
+    eos_cache = getattr(eos, "cache", None)
+    compiled_steps = {}
+
+    def compiled_timestepper(state, t, dt, rhs):
+        try:
+            step_func, compiled_step = compiled_steps[rhs]
+        except KeyError:
+            def step_func(state, t, dt):
+                return timestepper(state=state, t=t, dt=dt, rhs=rhs)
+
+            def traced_step_func(state, t, dt):
+                # Keeps the boundary and geometry caches out of the trace
+                with tracing():
+                    return step_func(state, t, dt)
+
+            compiled_step = actx.compile(traced_step_func)
+            if compiled_step is traced_step_func:
+                compiled_step = step_func
+            compiled_steps[rhs] = step_func, compiled_step
+
+        if compiled_step is step_func:
+            # Eager array context; nothing was compiled
+            return step_func(state, t, dt)
+
+        # The (first) call traces the step, whose arrays must neither hit
+        # eagerly computed cache entries nor be kept alive by the cache
+        if eos_cache is not None:
+            eos_cache.clear()
+
+        # Compiled programs take evaluated data as input
+        result = compiled_step(thaw(freeze(state, actx), actx), t, dt)
+
+        if eos_cache is not None:
+            eos_cache.clear()
+        return result
+
+    return compiled_timestepper
+
+
+def make_operator_split_timestepper(timestepper, source_integrator,
+                                    splitting="strang"):
+    """Wrap *timestepper* to advance a stiff source term separately.
+
+    The returned timestepper advances the state over each step by alternating
+    *timestepper*, applied to the RHS passed to it (e.g. the flow operator
+    without reaction sources), and *source_integrator*, which advances the
+    state by the source term alone. This lets the flow step keep its own (e.g.
+    acoustic CFL) step size while the stiff source, such as the chemistry of
+    :meth:`mirgecom.eos.PyrometheusMixture.integrate_chemistry`, is integrated
+    implicitly with its own substeps.
+
+    Parameters
+    ----------
+    timestepper
+        Function that advances the state from t=time to t=(time+dt), with call
+        signature ``timestepper(state, t, dt, rhs)``, e.g.
+        :func:`~mirgecom.integrators.rk4_step`.
+    source_integrator
+        Function with call signature ``source_integrator(state, t, dt)`` that
+        returns the state advanced over *dt* by the source term alone.
+    splitting: str
+        Either ``"strang"`` (the default), for second-order Strang splitting
+        with a half source step before and after the flow step, or ``"lie"``,
+        for first-order Lie splitting with the full source step after the flow
+        step.
+
+    Returns
+    -------
+    callable
+        A timestepper with call signature ``timestepper(state, t, dt, rhs)``
+        that can be passed to :func:`advance_state`.
+    """
+    if splitting == "strang":
+        def split_timestepper(state, t, dt, rhs):
+            state = source_integrator(state, t, dt/2)
+            state = timestepper(state=state, t=t, dt=dt, rhs=rhs)
+            return source_integrator(state, t + dt/2, dt/2)
+    elif splitting == "lie":
+        def split_timestepper(state, t, dt, rhs):
+            state = timestepper(state=state, t=t, dt=dt, rhs=rhs)
+            return source_integrator(state, t, dt)
+    else:
+        raise ValueError(f"unknown splitting '{splitting}'")
+
+    return split_timestepper
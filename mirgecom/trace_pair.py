@@ -0,0 +1,157 @@
+"""Helpers for exchanging trace data.
+
+Split-Phase Cross-Rank Exchange
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+:func:`grudge.eager.cross_rank_trace_pairs` posts its sends and receives and
+waits for them to complete before returning, so a rank sits idle while its
+messages are in flight. The functions here split the exchange in two phases so
+that operators can post the communication early, do their rank-local work
+(volume terms, interior and boundary face fluxes), and only then collect the
+remote data. Each exchange that is in flight at the same time as another one
+needs its own *tag*.
+
+.. autoclass:: CrossRankTracePairExchange
+.. autofunction:: start_cross_rank_trace_pairs
+.. autofunction:: finish_cross_rank_trace_pairs
+"""
+
+__copyright__ = """
+Copyright (C) 2021 University of Illinois Board of Trustees
+"""
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+from numbers import Number
+
+import numpy as np
+from pytools.obj_array import make_obj_array
+from meshmode.mesh import BTAG_PARTITION
+# NOTE: _RankBoundaryCommunication is private to grudge. This module relies on
+# its constructor taking (discr, remote_rank, local_dofs, tag=...), which posts
+# the sends and receives, and on its finish() method returning the
+# TracePair. requirements.txt takes grudge from its main branch, so check
+# these (and the fake in test/test_trace_pair.py) whenever grudge is updated.
+from grudge.trace_pair import (
+    TracePair,
+    connected_ranks,
+    _RankBoundaryCommunication
+)
+
+
+class CrossRankTracePairExchange:
+    """Handle for a cross-rank trace pair exchange that is in flight.
+
+    Created by :func:`start_cross_rank_trace_pairs`; the exchanged trace pairs
+    are obtained by calling :meth:`finish`, or equivalently
+    :func:`finish_cross_rank_trace_pairs`, exactly once.
+
+    .. automethod:: finish
+    """
+
+    def __init__(self, discr, ary, tag=None):
+        """Post the non-blocking sends and receives for *ary*."""
+        if isinstance(ary, np.ndarray):
+            self._shape = ary.shape
+            self._components = list(ary.ravel())
+        else:
+            self._shape = None
+            self._components = [ary]
+
+        self._remote_ranks = list(connected_ranks(discr))
+
+        # Constant components need no communication; they are their own
+        # exterior value.
+        self._rank_comms = [
+            [None if isinstance(comp, Number)
+             else _RankBoundaryCommunication(discr, remote_rank, comp, tag=tag)
+             for comp in self._components]
+            for remote_rank in self._remote_ranks]
+
+        self._finished = False
+
+    def finish(self):
+        """Wait for the exchange to complete.
+
+        Returns
+        -------
+        list
+            One :class:`~grudge.trace_pair.TracePair` per neighboring rank, in
+            the same format as returned by
+            :func:`grudge.eager.cross_rank_trace_pairs`.
+        """
+        if self._finished:
+            raise RuntimeError("Cross-rank exchange has already been finished.")
+        self._finished = True
+
+        result = []
+        for remote_rank, comms in zip(self._remote_ranks, self._rank_comms):
+            remote_btag = BTAG_PARTITION(remote_rank)
+            comp_tpairs = [
+                TracePair(remote_btag, interior=comp, exterior=comp)
+                if comm is None else comm.finish()
+                for comp, comm in zip(self._components, comms)]
+
+            if self._shape is None:
+                result.append(comp_tpairs[0])
+            else:
+                result.append(TracePair(
+                    remote_btag,
+                    interior=make_obj_array(
+                        [tpair.int for tpair in comp_tpairs]).reshape(self._shape),
+                    exterior=make_obj_array(
+                        [tpair.ext for tpair in comp_tpairs]).reshape(self._shape)))
+
+        return result
+
+
+def start_cross_rank_trace_pairs(discr, ary, tag=None):
+    """Begin exchanging the traces of *ary* with all neighboring ranks.
+
+    Parameters
+    ----------
+    discr: grudge.eager.EagerDGDiscretization
+        the discretization to use
+    ary
+        a :class:`~meshmode.dof_array.DOFArray`, a number, or an object array
+        of those, defined on the volume
+    tag: int
+        optional offset to the MPI message tag. Exchanges that are in flight
+        at the same time must be given distinct tags, as their messages would
+        otherwise only be told apart by the order in which they were posted.
+
+    Returns
+    -------
+    CrossRankTracePairExchange
+        handle to be passed to :func:`finish_cross_rank_trace_pairs`
+    """
+    return CrossRankTracePairExchange(discr, ary, tag=tag)
+
+
+def finish_cross_rank_trace_pairs(exchange):
+    """Complete the exchange begun by :func:`start_cross_rank_trace_pairs`.
+
+    Returns
+    -------
+    list
+        One :class:`~grudge.trace_pair.TracePair` per neighboring rank.
+    """
+    return exchange.finish()
@@ -30,8 +30,15 @@ THE SOFTWARE.
 __doc__ = """
 .. autoclass:: StatisticsAccumulator
 .. autofunction:: asdict_shallow
+.. autofunction:: get_package_version
+.. autofunction:: get_package_source_hash
+.. autofunction:: get_container_leaves
+.. autofunction:: is_tracing
+.. autofunction:: tracing
 """
 
+from contextlib import contextmanager
+from functools import lru_cache
 from typing import Optional
 
 
@@ -47,6 +54,111 @@ def asdict_shallow(dc_instance) -> dict:
             for attr in fields(dc_instance)}
 
 
+def get_package_version(name: str) -> str:
+    """Return the installed version of the distribution *name*.
+
+    Returns ``"unknown"`` if *name* is not installed, or its version cannot be
+    determined. This is meant for keys of on-disk caches of generated code,
+    which must change when the generating package is updated.
+    """
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+    except ImportError:  # Python < 3.8
+        from importlib_metadata import version, PackageNotFoundError
+
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return "unknown"
+
+
+@lru_cache(maxsize=None)
+def get_package_source_hash(name: str) -> str:
+    """Return a hash of the Python sources of the importable package *name*.
+
+    Unlike the version number, which development installs (e.g. editable
+    installs of a git checkout) keep across changes, the hash changes with
+    every change to the code of the package. This is meant for keys of
+    on-disk caches of generated code, which must change when the generating
+    package is updated. Returns ``"unknown"`` if *name* cannot be found. The
+    sources are read once per process.
+    """
+    import os
+    from hashlib import sha256
+    from importlib.util import find_spec
+
+    try:
+        spec = find_spec(name)
+    except (ImportError, ValueError):
+        spec = None
+    if spec is None:
+        return "unknown"
+
+    if spec.submodule_search_locations:
+        paths = []
+        for root in spec.submodule_search_locations:
+            for dirpath, dirnames, filenames in os.walk(root):
+                dirnames.sort()
+                paths.extend((root, os.path.join(dirpath, filename))
+                             for filename in sorted(filenames)
+                             if filename.endswith(".py"))
+    elif spec.origin is not None and os.path.exists(spec.origin):
+        paths = [(os.path.dirname(spec.origin), spec.origin)]
+    else:
+        return "unknown"
+
+    checksum = sha256()
+    for root, path in paths:
+        checksum.update(os.path.relpath(path, root).encode())
+        with open(path, "rb") as source_file:
+            checksum.update(source_file.read())
+    return checksum.hexdigest()
+
+
+def get_container_leaves(ary):
+    """Yield the arrays (or numbers) at the leaves of the container *ary*.
+
+    The leaves are visited depth-first, in the order of
+    :func:`arraycontext.serialize_container`. If *ary* is not an array
+    container, it is the only leaf.
+    """
+    from arraycontext import is_array_container, serialize_container
+
+    if is_array_container(ary):
+        for _, subary in serialize_container(ary):
+            yield from get_container_leaves(subary)
+    else:
+        yield ary
+
+
+_TRACING = False
+
+
+def is_tracing() -> bool:
+    """Return whether array operations are being traced into a program.
+
+    Inside :func:`tracing`, the arrays are symbolic placeholders without data,
+    so results must not be stored in caches that outlive the trace, and cache
+    keys must not be compared with traced values such as the time.
+    """
+    return _TRACING
+
+
+@contextmanager
+def tracing():
+    """Mark the array operations within the context as being traced.
+
+    See :func:`is_tracing`.
+    """
+    global _TRACING
+    was_tracing = _TRACING
+    _TRACING = True
+    try:
+        yield
+    finally:
+        _TRACING = was_tracing
+
+
 class StatisticsAccumulator:
     """Class that provides statistical functions for multiple values.
 
@@ -31,9 +31,9 @@ import numpy as np
 import numpy.linalg as la  # noqa
 from pytools.obj_array import flat_obj_array
 from meshmode.mesh import BTAG_ALL, BTAG_NONE  # noqa
-from meshmode.dof_array import thaw
 from grudge.trace_pair import TracePair
 from grudge.eager import interior_trace_pair, cross_rank_trace_pairs
+from mirgecom.geometry import get_normal
 
 
 def _flux(discr, c, w_tpair):
@@ -42,7 +42,7 @@ def _flux(discr, c, w_tpair):
 
     actx = w_tpair.int[0].array_context
 
-    normal = thaw(actx, discr.normal(w_tpair.dd))
+    normal = get_normal(actx, discr, w_tpair.dd)
 
     flux_weak = flat_obj_array(
         np.dot(v.avg, normal),
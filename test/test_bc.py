@@ -170,3 +170,46 @@ def test_slipwall_flux(actx_factory, dim, order):
         eoc.order_estimate() >= order - 0.5
         or eoc.max_error() < 1e-12
     )
+
+
+@pytest.mark.parametrize("time_dependent", [True, False])
+def test_prescribed_exterior_cache(actx_factory, time_dependent):
+    """Check that prescribed exterior solutions are reused when allowed."""
+    actx = actx_factory()
+
+    dim = 2
+    from meshmode.mesh.generation import generate_regular_rect_mesh
+    mesh = generate_regular_rect_mesh(
+        a=(-0.5,) * dim, b=(0.5,) * dim, nelements_per_axis=(4,) * dim
+    )
+
+    discr = EagerDGDiscretization(actx, mesh, order=2)
+    nodes = thaw(actx, discr.nodes())
+    eos = IdealSingleGas()
+
+    initializer = Lump(dim=dim, center=np.zeros(shape=(dim,)),
+                       velocity=np.ones(shape=(dim,)))
+    cv = initializer(nodes)
+
+    ncalls = 0
+
+    def userfunc(x_vec, t=0, **kwargs):
+        nonlocal ncalls
+        ncalls += 1
+        return initializer(x_vec, t=t)
+
+    from mirgecom.boundary import PrescribedBoundary
+    bndry = PrescribedBoundary(userfunc, time_dependent=time_dependent)
+
+    from functools import partial
+    bnd_norm = partial(discr.norm, p=np.inf, dd=BTAG_ALL)
+
+    # Repeated calls at the same time reuse the exterior solution
+    bnd_pair = bndry.boundary_pair(discr, btag=BTAG_ALL, eos=eos, cv=cv, t=0.0)
+    cached_pair = bndry.boundary_pair(discr, btag=BTAG_ALL, eos=eos, cv=cv, t=0.0)
+    assert ncalls == 1
+    assert bnd_norm((cached_pair.ext - bnd_pair.ext).mass) == 0.0
+
+    # A new time only requires a new exterior solution for time-dependent data
+    bndry.boundary_pair(discr, btag=BTAG_ALL, eos=eos, cv=cv, t=0.5)
+    assert ncalls == (2 if time_dependent else 1)
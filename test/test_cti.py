@@ -23,7 +23,9 @@ THE SOFTWARE.
 """
 
 import logging
-from mirgecom.mechanisms import get_mechanism_cti
+import numpy as np
+import pytest
+from mirgecom.mechanisms import get_mechanism_cti, get_thermochem_class
 
 logger = logging.getLogger(__name__)
 
@@ -34,3 +36,69 @@ def test_cti_reader():
     first_line = test_cti.partition("\n")[0].strip()
 
     assert first_line == "# CH4_BFER mechanisme: CH4 + 1.5 O2  => CO +2H2O"
+
+
+@pytest.mark.parametrize("mechname", ["uiuc", "sanDiego"])
+def test_thermochem_class_cache(tmp_path, monkeypatch, mechname):
+    """Test that the generated thermochemistry code is cached on disk."""
+    import cantera
+    import pyrometheus as pyro
+    from mirgecom import utils
+
+    mech_cti = get_mechanism_cti(mechname)
+    get_thermochem_class(mech_cti, cache_dir=str(tmp_path))
+
+    # The second request reuses the stored code
+    def fail_gen_thermochem_code(sol):
+        raise AssertionError("thermochemistry code generated again")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(pyro, "gen_thermochem_code", fail_gen_thermochem_code)
+        cached_cls = get_thermochem_class(mech_cti, cache_dir=str(tmp_path))
+
+        # A change to the sources of pyrometheus invalidates the stored code
+        patch.setattr(utils, "get_package_source_hash",
+                      lambda name: "changed-" + name)
+        with pytest.raises(AssertionError):
+            get_thermochem_class(mech_cti, cache_dir=str(tmp_path))
+
+    sol = cantera.Solution(phase_id="gas", source=mech_cti)
+    ref_mech = pyro.get_thermochem_class(sol)(np)
+    cached_mech = cached_cls(np)
+    assert cached_mech.species_names == ref_mech.species_names
+
+    temperature = np.linspace(300, 3000, 10)
+    y = np.ones(ref_mech.num_species) / ref_mech.num_species
+    y = y[:, None] * np.ones_like(temperature)
+    assert np.allclose(cached_mech.get_mixture_internal_energy_mass(temperature, y),
+                       ref_mech.get_mixture_internal_energy_mass(temperature, y),
+                       rtol=1e-14)
+
+
+def test_mechanism_reduction(tmp_path):
+    """Test DRG reduction of the San Diego mechanism for hydrogen ignition."""
+    import cantera
+    from mirgecom.mechanisms.reduction import reduce_mechanism
+
+    mech_cti = get_mechanism_cti("sanDiego")
+    conditions = [(1200.0, cantera.one_atm, "H2:2, O2:1, N2:3.76")]
+    reduction = reduce_mechanism(mech_cti, conditions,
+                                 target_species=["H2", "O2", "H2O"],
+                                 threshold=0.05, t_end=1e-3)
+
+    full_sol = cantera.Solution(phase_id="gas", source=mech_cti)
+    assert set(["H2", "O2", "H2O", "N2"]) <= set(reduction.species)
+    # The carbon species cannot be reached from a hydrogen-air mixture
+    assert not set(["CO", "CO2", "HCO"]) & set(reduction.species)
+    assert len(reduction.species) < full_sol.n_species
+    assert reduction.nreactions < full_sol.n_reactions
+    assert np.all(reduction.ignition_delay_errors < 0.1)
+    assert np.all(reduction.temperature_errors < 0.1)
+
+    # The skeletal mechanism round-trips through the CTI readers
+    cti_file = tmp_path / "skeletal.cti"
+    cti_file.write_text(reduction.cti)
+    reduced_cti = get_mechanism_cti(str(cti_file))
+    reduced_sol = cantera.Solution(phase_id="gas", source=reduced_cti)
+    assert tuple(reduced_sol.species_names) == reduction.species
+    assert reduced_sol.n_reactions == reduction.nreactions
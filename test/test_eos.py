@@ -42,7 +42,11 @@ from meshmode.array_context import (  # noqa
 
 import cantera
 import pyrometheus as pyro
-from mirgecom.eos import IdealSingleGas, PyrometheusMixture
+from mirgecom.eos import (
+    IdealSingleGas,
+    PyrometheusMixture,
+    TabulatedPyrometheusMixture
+)
 from mirgecom.initializers import (
     Vortex2D, Lump,
     MixtureInitializer
@@ -251,6 +255,83 @@ def test_pyrometheus_eos(ctx_factory, mechname, dim, y0, vel):
         assert discr.norm((internal_energy - pyro_e) / pyro_e, np.inf) < tol
         assert discr.norm((p - pyro_p) / pyro_p, np.inf) < tol
 
+        # The single-pass dependent variables agree with the mechanism
+        dv = eos.dependent_vars(cv)
+        pyro_r = prometheus_mechanism.get_specific_gas_constant(yin)
+        pyro_cp = prometheus_mechanism.get_mixture_specific_heat_cp_mass(pyro_t, yin)
+        pyro_gamma = pyro_cp / (pyro_cp - pyro_r)
+        pyro_c = actx.np.sqrt(pyro_gamma * pyro_p / pyro_rho)
+        assert discr.norm((dv.pressure - pyro_p) / pyro_p, np.inf) < tol
+        assert discr.norm((dv.gamma - pyro_gamma) / pyro_gamma, np.inf) < tol
+        assert discr.norm((dv.speed_of_sound - pyro_c) / pyro_c, np.inf) < tol
+        assert discr.norm((eos.gas_const(cv) - pyro_r) / pyro_r, np.inf) < tol
+
+
+@pytest.mark.parametrize("mechname", ["uiuc", "sanDiego"])
+@pytest.mark.parametrize("y0", [0, 1])
+def test_tabulated_pyrometheus_eos(ctx_factory, tmp_path, mechname, y0):
+    """Test that the tabulated mixture EOS reproduces the Pyrometheus temperature."""
+    cl_ctx = ctx_factory()
+    queue = cl.CommandQueue(cl_ctx)
+    actx = PyOpenCLArrayContext(queue)
+
+    dim = 2
+    nel_1d = 4
+
+    from meshmode.mesh.generation import generate_regular_rect_mesh
+
+    mesh = generate_regular_rect_mesh(
+        a=(-0.5,) * dim, b=(0.5,) * dim, nelements_per_axis=(nel_1d,) * dim
+    )
+
+    discr = EagerDGDiscretization(actx, mesh, order=3)
+    nodes = thaw(actx, discr.nodes())
+
+    mech_cti = get_mechanism_cti(mechname)
+    sol = cantera.Solution(phase_id="gas", source=mech_cti)
+    prometheus_mechanism = pyro.get_thermochem_class(sol)(actx.np)
+    nspecies = prometheus_mechanism.num_species
+
+    y0s = np.zeros(shape=(nspecies,))
+    for i in range(1, nspecies):
+        y0s[i] = y0 / (10.0 ** i)
+    y0s[0] = 1.0 - np.sum(y0s[1:])
+    velocity = np.zeros(shape=(dim,))
+
+    eos = TabulatedPyrometheusMixture(prometheus_mechanism,
+                                      table_cache_dir=str(tmp_path))
+
+    for tempin in [300.0, 1234.5, 3000.0]:
+        print(f"Testing {mechname}(t) = {tempin}")
+
+        # Vary the temperature across the domain
+        tin = tempin * (1.0 + 0.1 * nodes[0])
+        pin = 101500.0 + 0.0 * nodes[0]
+        yin = y0s * (discr.zeros(actx) + 1.0)
+        pyro_e = prometheus_mechanism.get_mixture_internal_energy_mass(tin, yin)
+        pyro_t = prometheus_mechanism.get_temperature(pyro_e, tempin, yin, True)
+
+        initializer = MixtureInitializer(dim=dim, nspecies=nspecies,
+                                         pressure=pin, temperature=pyro_t,
+                                         massfractions=y0s, velocity=velocity)
+        cv = initializer(eos=eos, t=0, x_vec=nodes)
+        temperature = eos.temperature(cv)
+
+        assert discr.norm((temperature - pyro_t) / pyro_t, np.inf) < 1e-10
+
+    # A second instance reads the tables from the disk cache
+    cached_eos = TabulatedPyrometheusMixture(prometheus_mechanism,
+                                             table_cache_dir=str(tmp_path))
+    assert np.array_equal(cached_eos._species_energy_table,
+                          eos._species_energy_table)
+
+    # Warm starting does not apply to the table lookup
+    TabulatedPyrometheusMixture(prometheus_mechanism, warm_start=False,
+                                table_cache_dir=str(tmp_path))
+    with pytest.raises(ValueError):
+        TabulatedPyrometheusMixture(prometheus_mechanism, warm_start=True,
+                                    table_cache_dir=str(tmp_path))
+
 
 @pytest.mark.parametrize(("mechname", "rate_tol"),
                          [("uiuc", 1e-12),
@@ -463,3 +544,321 @@ def test_idealsingle_vortex(ctx_factory):
     assert errmax < 1e-15
     assert kerr < 1e-15
     assert terr < 1e-15
+
+
+@pytest.mark.parametrize("dim", [1, 2, 3])
+def test_idealsingle_dependent_vars(ctx_factory, dim):
+    """Test the single-pass IdealSingleGas dependent variables.
+
+    Tests that the dependent variables returned by IdealSingleGas, and held by
+    the FluidState, match those returned by the individual EOS methods.
+    """
+    cl_ctx = ctx_factory()
+    queue = cl.CommandQueue(cl_ctx)
+    actx = PyOpenCLArrayContext(queue)
+
+    nel_1d = 4
+
+    from meshmode.mesh.generation import generate_regular_rect_mesh
+
+    mesh = generate_regular_rect_mesh(
+        a=(-0.5,) * dim, b=(0.5,) * dim, nelements_per_axis=(nel_1d,) * dim
+    )
+
+    order = 3
+    discr = EagerDGDiscretization(actx, mesh, order=order)
+    nodes = thaw(actx, discr.nodes())
+
+    center = np.zeros(shape=(dim,))
+    velocity = np.zeros(shape=(dim,))
+    velocity[0] = 1
+    lump = Lump(dim=dim, center=center, velocity=velocity)
+    eos = IdealSingleGas()
+    cv = lump(nodes)
+
+    from mirgecom.eos import make_fluid_state
+    state = make_fluid_state(cv, eos)
+
+    tol = 1e-15
+    assert discr.norm(state.pressure - eos.pressure(cv), np.inf) < tol
+    assert discr.norm(state.temperature - eos.temperature(cv), np.inf) < tol
+    assert discr.norm(state.speed_of_sound - eos.sound_speed(cv), np.inf) < tol
+    assert discr.norm(state.velocity - cv.velocity, np.inf) < tol
+
+
+def test_eos_cache():
+    """Test the hits, misses, and LRU eviction of the EOS result cache."""
+    from mirgecom.eos import EOSCache
+    from mirgecom.fluid import make_conserved
+
+    def make_cv(mass):
+        return make_conserved(dim=2, mass=mass, energy=2*mass,
+                              momentum=make_obj_array([mass, mass]))
+
+    ncalls = []
+
+    def compute():
+        ncalls.append(1)
+        return len(ncalls)
+
+    cache = EOSCache(max_entries=2)
+    mass = np.ones(5)
+    cv = make_cv(mass)
+
+    assert cache.get_or_compute("temperature", cv, compute) == 1
+    assert cache.get_or_compute("temperature", cv, compute) == 1
+    # A new state made of the same arrays shares the cached result
+    same_cv = make_conserved(dim=2, mass=cv.mass, energy=cv.energy,
+                             momentum=cv.momentum)
+    assert cache.get_or_compute("temperature", same_cv, compute) == 1
+    assert cache.get_or_compute("pressure", cv, compute) == 2
+    assert (cache.hits, cache.misses) == (2, 2)
+
+    # Evicts the least recently used entry, "temperature"
+    other_cv = make_cv(np.ones(5))
+    assert cache.get_or_compute("temperature", other_cv, compute) == 3
+    assert len(cache) == 2
+    assert cache.get_or_compute("temperature", cv, compute) == 4
+    assert cache.get_or_compute("temperature", other_cv, compute) == 3
+
+
+def test_compiled_timestepper_rejects_host_side_eos(ctx_factory):
+    """Test that compiled steps refuse EOS features that work on the host."""
+    from mirgecom.integrators import rk4_step
+    from mirgecom.steppers import make_compiled_timestepper
+
+    cl_ctx = ctx_factory()
+    queue = cl.CommandQueue(cl_ctx)
+    actx = PyOpenCLArrayContext(queue)
+
+    sol = cantera.Solution(phase_id="gas", source=get_mechanism_cti("uiuc"))
+    prometheus_mechanism = pyro.get_thermochem_class(sol)(actx.np)
+
+    assert IdealSingleGas().get_host_side_features() == []
+    make_compiled_timestepper(actx, rk4_step, eos=IdealSingleGas())
+    make_compiled_timestepper(
+        actx, rk4_step, eos=PyrometheusMixture(prometheus_mechanism,
+                                               warm_start=False))
+
+    for eos in [PyrometheusMixture(prometheus_mechanism),
+                PyrometheusMixture(prometheus_mechanism, warm_start=False,
+                                   activity_temperature=1000.0),
+                TabulatedPyrometheusMixture(prometheus_mechanism)]:
+        assert eos.get_host_side_features()
+        with pytest.raises(ValueError):
+            make_compiled_timestepper(actx, rk4_step, eos=eos)
+
+
+def _setup_mixture(actx, mechname="uiuc", fuel="C2H4:1", nel_1d=4):
+    """Set up a stoichiometric fuel/air mixture at rest on a 1D discretization.
+
+    Returns the discretization, its nodes, the :mod:`cantera` solution holding
+    the mixture composition, and a function ``make_cv(eos, temperature)`` that
+    initializes the mixture at atmospheric pressure and *temperature*, which is
+    a number or a nodal field.
+    """
+    dim = 1
+    from meshmode.mesh.generation import generate_regular_rect_mesh
+    mesh = generate_regular_rect_mesh(a=(0.0,), b=(1.0,),
+                                      nelements_per_axis=(nel_1d,))
+    discr = EagerDGDiscretization(actx, mesh, order=2)
+    nodes = thaw(actx, discr.nodes())
+
+    sol = cantera.Solution(phase_id="gas", source=get_mechanism_cti(mechname))
+    sol.set_equivalence_ratio(phi=1.0, fuel=fuel, oxidizer="O2:1,N2:3.76")
+
+    def make_cv(eos, temperature):
+        initializer = MixtureInitializer(dim=dim, nspecies=sol.n_species,
+                                         pressure=101325.0,
+                                         temperature=temperature + 0*nodes[0],
+                                         massfractions=sol.Y,
+                                         velocity=np.zeros(shape=(dim,)))
+        return initializer(eos=eos, t=0, x_vec=nodes)
+
+    return discr, nodes, sol, make_cv
+
+
+def test_pyrometheus_eos_float32(ctx_factory):
+    """Test that the mixture EOS keeps a float32 state in single precision."""
+    cl_ctx = ctx_factory()
+    queue = cl.CommandQueue(cl_ctx)
+    actx = PyOpenCLArrayContext(queue)
+
+    discr, nodes, sol, make_cv = _setup_mixture(actx)
+    prometheus_mechanism = pyro.get_thermochem_class(sol)(actx.np)
+    eos = PyrometheusMixture(prometheus_mechanism, temperature_guess=1500.0)
+    cv64 = make_cv(eos, 1500.0 + 100.0*nodes[0])
+
+    from mirgecom.precision import cast_to_dtype
+    cv32 = cast_to_dtype(cv64, np.float32)
+    dv = eos.dependent_vars(cv32)
+    for ary in [dv.temperature, dv.pressure, dv.speed_of_sound, dv.gamma]:
+        assert ary.entry_dtype == np.float32
+
+    # The temperature is solved for in double precision
+    temperature64 = eos.dependent_vars(cv64).temperature
+    assert discr.norm(cast_to_dtype(dv.temperature, np.float64) - temperature64,
+                      np.inf) < 1e-2
+
+
+def test_temperature_warm_start(ctx_factory, tmp_path):
+    """Test that warm starting saves Newton iterations, also after a restart."""
+    cl_ctx = ctx_factory()
+    queue = cl.CommandQueue(cl_ctx)
+    actx = PyOpenCLArrayContext(queue)
+
+    discr, nodes, sol, make_cv = _setup_mixture(actx)
+
+    class CountingMechanism(pyro.get_thermochem_class(sol)):
+        # The heat capacity is evaluated once per Newton iteration
+        newton_iterations = 0
+
+        def get_mixture_specific_heat_cv_mass(self, temperature, mass_fractions):
+            self.newton_iterations += 1
+            return super().get_mixture_specific_heat_cv_mass(temperature,
+                                                             mass_fractions)
+
+    mech = CountingMechanism(actx.np)
+    cold_eos = PyrometheusMixture(mech, warm_start=False)
+
+    def count_iterations(eos, cv, dd=None):
+        mech.newton_iterations = 0
+        temperature = eos.temperature(cv, dd=dd)
+        return mech.newton_iterations, temperature
+
+    cv = make_cv(cold_eos, 1500.0 + 100.0*nodes[0])
+    next_cv = make_cv(cold_eos, 1501.0 + 100.0*nodes[0])
+
+    warm_eos = PyrometheusMixture(mech)
+    warm_eos.temperature(cv)
+    # A discretization of the same shape with a different DOF descriptor, e.g.
+    # another boundary, keeps its own seeds
+    other_eos = PyrometheusMixture(mech)
+    other_eos.temperature(cv)
+    other_eos.temperature(make_cv(cold_eos, 2500.0), dd=BTAG_ALL)
+    assert len(other_eos.get_temperature_seeds()) == 2
+
+    from mirgecom.restart import write_restart_file, read_restart_data
+    rst_filename = str(tmp_path / "seeds.pkl")
+    write_restart_file(actx, {"temperature_seeds": warm_eos.get_temperature_seeds()},
+                       rst_filename)
+    restarted_eos = PyrometheusMixture(mech)
+    restarted_eos.set_temperature_seeds(
+        read_restart_data(actx, rst_filename)["temperature_seeds"])
+
+    cold_iterations, cold_temperature = count_iterations(cold_eos, next_cv)
+    warm_iterations, warm_temperature = count_iterations(warm_eos, next_cv)
+    assert warm_iterations < cold_iterations
+    assert discr.norm(warm_temperature - cold_temperature, np.inf) < 1e-6
+    assert count_iterations(other_eos, next_cv)[0] == warm_iterations
+    assert count_iterations(restarted_eos, next_cv)[0] == warm_iterations
+
+
+@pytest.mark.parametrize(("mechname", "fuel"),
+                         [("uiuc", "C2H4:1"),
+                          ("sanDiego", "H2:1")])
+def test_chemistry_activity_mask(ctx_factory, mechname, fuel):
+    """Test that masked production rates vanish exactly at the inactive nodes."""
+    cl_ctx = ctx_factory()
+    queue = cl.CommandQueue(cl_ctx)
+    actx = PyOpenCLArrayContext(queue)
+
+    discr, nodes, sol, make_cv = _setup_mixture(actx, mechname=mechname,
+                                                fuel=fuel, nel_1d=8)
+    prometheus_mechanism = pyro.get_thermochem_class(sol)(actx.np)
+    nspecies = prometheus_mechanism.num_species
+
+    activity_temperature = 1000.0
+    eos = PyrometheusMixture(prometheus_mechanism)
+    masked_eos = PyrometheusMixture(prometheus_mechanism,
+                                    activity_temperature=activity_temperature)
+    # Cold on the left and hot on the right
+    cv = make_cv(eos, 300.0 + 1500.0 * nodes[0])
+
+    omega = eos.get_production_rates(cv)
+    masked_omega = masked_eos.get_production_rates(cv)
+    temperature = eos.temperature(cv)
+
+    active = actx.np.where(actx.np.less(temperature, activity_temperature),
+                           0.0, 1.0)
+    for i in range(nspecies):
+        scale = discr.norm(omega[i], np.inf) + 1e-30
+        assert discr.norm(masked_omega[i] - active*omega[i], np.inf) < 1e-12*scale
+
+
+def test_chemistry_activity_rate_recheck(ctx_factory):
+    """Test that nodes deactivated by the rate criterion are rechecked."""
+    cl_ctx = ctx_factory()
+    queue = cl.CommandQueue(cl_ctx)
+    actx = PyOpenCLArrayContext(queue)
+
+    discr, nodes, sol, make_cv = _setup_mixture(actx, nel_1d=8)
+    prometheus_mechanism = pyro.get_thermochem_class(sol)(actx.np)
+    nspecies = prometheus_mechanism.num_species
+
+    eos = PyrometheusMixture(prometheus_mechanism)
+    masked_eos = PyrometheusMixture(prometheus_mechanism, activity_rate=1e-3,
+                                    activity_recheck_interval=2)
+
+    def assert_rates_equal(masked_omega, omega, mask=1.0):
+        for i in range(nspecies):
+            scale = discr.norm(omega[i], np.inf) + 1e-30
+            assert (discr.norm(masked_omega[i] - mask*omega[i], np.inf)
+                    < 1e-12*scale)
+
+    # Quiet (cold) on the left, reacting on the right; all nodes are evaluated
+    # at first, and the quiet ones are deactivated
+    split_cv = make_cv(
+        eos, actx.np.where(actx.np.less(nodes[0], 0.5), 300.0, 1800.0))
+    assert_rates_equal(masked_eos.get_production_rates(split_cv),
+                       eos.get_production_rates(split_cv))
+
+    # A front reaches the quiet nodes, which remain inactive until the recheck
+    hot_cv = make_cv(eos, 1800.0)
+    omega = eos.get_production_rates(hot_cv)
+    was_active = actx.np.where(actx.np.less(nodes[0], 0.5), 0.0, 1.0)
+    assert_rates_equal(masked_eos.get_production_rates(hot_cv), omega,
+                       mask=was_active)
+    assert discr.norm(omega[0] * (1 - was_active), np.inf) > 0
+
+    # The recheck evaluates all nodes, which are then active again
+    assert_rates_equal(masked_eos.get_production_rates(hot_cv), omega)
+    assert_rates_equal(masked_eos.get_production_rates(hot_cv), omega)
+
+
+def test_frozen_rate_chemistry(ctx_factory):
+    """Test the reuse and the early refresh of frozen chemistry source terms."""
+    cl_ctx = ctx_factory()
+    queue = cl.CommandQueue(cl_ctx)
+    actx = PyOpenCLArrayContext(queue)
+
+    discr, nodes, sol, make_cv = _setup_mixture(actx)
+    prometheus_mechanism = pyro.get_thermochem_class(sol)(actx.np)
+    nspecies = prometheus_mechanism.num_species
+
+    from mirgecom.eos import FrozenRateChemistry
+    eos = PyrometheusMixture(prometheus_mechanism)
+    chemistry = FrozenRateChemistry(eos, max_reuse=2, temperature_tolerance=5.0)
+
+    cv = make_cv(eos, 1500.0)
+    sources = chemistry.get_species_source_terms(cv)
+    for _ in range(2):
+        # Small temperature changes reuse the frozen rates
+        reused = chemistry.get_species_source_terms(make_cv(eos, 1501.0))
+        for i in range(nspecies):
+            assert discr.norm(reused.species_mass[i]
+                              - sources.species_mass[i], np.inf) == 0
+    assert (chemistry.evaluations, chemistry.skips) == (1, 2)
+
+    # Refreshed after max_reuse reuses
+    chemistry.get_species_source_terms(cv)
+    assert (chemistry.evaluations, chemistry.skips) == (2, 2)
+
+    # Refreshed early by a large temperature change
+    hot_cv = make_cv(eos, 1600.0)
+    hot_sources = chemistry.get_species_source_terms(hot_cv)
+    assert (chemistry.evaluations, chemistry.skips) == (3, 2)
+    ref_sources = eos.get_species_source_terms(hot_cv)
+    for i in range(nspecies):
+        assert discr.norm(hot_sources.species_mass[i]
+                          - ref_sources.species_mass[i], np.inf) == 0
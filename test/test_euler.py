@@ -386,6 +386,234 @@ def test_facial_flux(actx_factory, nspecies, order, dim):
     )
 
 
+@pytest.mark.parametrize("dim", [1, 2, 3])
+@pytest.mark.parametrize("order", [1, 2, 3])
+def test_interior_facial_flux(actx_factory, dim, order):
+    """Check the one-sided interior face flux against the two-sided flux."""
+    actx = actx_factory()
+
+    from meshmode.mesh.generation import generate_regular_rect_mesh
+    mesh = generate_regular_rect_mesh(
+        a=(-0.5,) * dim, b=(0.5,) * dim, nelements_per_axis=(4,) * dim
+    )
+
+    discr = EagerDGDiscretization(actx, mesh, order=order)
+    nodes = thaw(actx, discr.nodes())
+
+    velocity = np.ones(shape=(dim,))
+    lump = Lump(dim=dim, center=np.zeros(shape=(dim,)), velocity=velocity)
+    cv = lump(nodes)
+    eos = IdealSingleGas()
+
+    from mirgecom.euler import _facial_flux, _interior_facial_flux
+    expected_flux = _facial_flux(discr, eos=eos,
+                                 cv_tpair=interior_trace_pair(discr, cv))
+    flux = _interior_facial_flux(discr, eos=eos, cv=cv)
+
+    flux_resid = (flux - expected_flux).join()
+    for i in range(len(flux_resid)):
+        assert discr.norm(flux_resid[i], np.inf, dd="all_faces") < 1e-13
+
+
+@pytest.mark.parametrize("flux_name", ["rusanov", "hll", "hllc", "roe"])
+@pytest.mark.parametrize("nspecies", [0, 3])
+@pytest.mark.parametrize("dim", [1, 2, 3])
+def test_numerical_flux_consistency(actx_factory, flux_name, nspecies, dim):
+    """Check that each numerical flux reduces to the physical normal flux.
+
+    With identical states on both sides of a face, every numerical flux in
+    :mod:`mirgecom.flux` must return the normal component of the inviscid flux.
+    """
+    actx = actx_factory()
+
+    from meshmode.mesh.generation import generate_regular_rect_mesh
+    mesh = generate_regular_rect_mesh(
+        a=(-0.5,) * dim, b=(0.5,) * dim, nelements_per_axis=(4,) * dim
+    )
+
+    discr = EagerDGDiscretization(actx, mesh, order=2)
+    nodes = thaw(actx, discr.nodes())
+
+    velocity = 0.5 + np.arange(dim)
+    if nspecies > 0:
+        spec_y0s = np.ones(shape=(nspecies,))
+        spec_amplitudes = np.ones(shape=(nspecies,))
+        lump = MulticomponentLump(
+            dim=dim, nspecies=nspecies, center=np.zeros(shape=(dim,)),
+            velocity=velocity, spec_y0s=spec_y0s, spec_amplitudes=spec_amplitudes)
+    else:
+        lump = Lump(dim=dim, center=np.zeros(shape=(dim,)), velocity=velocity)
+    eos = IdealSingleGas()
+
+    from mirgecom.eos import make_fluid_state
+    from mirgecom.flux import get_numerical_flux
+    from mirgecom.inviscid import inviscid_flux
+
+    cv = discr.project("vol", BTAG_ALL, lump(nodes))
+    state = make_fluid_state(cv, eos)
+    flux = inviscid_flux(discr, eos, cv, state=state)
+    normal = thaw(actx, discr.normal(BTAG_ALL))
+
+    numerical_flux_func = get_numerical_flux(flux_name)
+    num_flux = numerical_flux_func(
+        state_tpair=TracePair(BTAG_ALL, interior=state, exterior=state),
+        f_tpair=TracePair(BTAG_ALL, interior=flux, exterior=flux),
+        normal=normal)
+
+    resid = (num_flux - flux @ normal).join()
+    for i in range(len(resid)):
+        assert discr.norm(resid[i], np.inf, dd=BTAG_ALL) < 1e-12
+
+
+def _make_face_state(actx, discr, eos, nspecies, mass, pressure, velocity):
+    """Return a uniform fluid state and its inviscid flux on the boundary."""
+    from mirgecom.eos import make_fluid_state
+    ones = discr.project("vol", BTAG_ALL, discr.zeros(actx)) + 1
+    velocity = make_obj_array([v*ones for v in velocity])
+    mass = mass*ones
+    cv = make_conserved(
+        discr.dim, mass=mass,
+        energy=(pressure/(eos.gamma() - 1)
+                + 0.5*mass*np.dot(velocity, velocity)),
+        momentum=mass*velocity,
+        species_mass=make_obj_array([
+            2*(i + 1)/(nspecies*(nspecies + 1))*mass for i in range(nspecies)]))
+    state = make_fluid_state(cv, eos)
+    return state, inviscid_flux(discr, eos, cv, state=state)
+
+
+def _assert_flux_equal(discr, flux, expected, mask=1):
+    resid = (flux - expected).join()
+    scale = max(discr.norm(comp, np.inf, dd=BTAG_ALL)
+                for comp in expected.join()) + 1
+    for i in range(len(resid)):
+        assert discr.norm(mask*resid[i], np.inf, dd=BTAG_ALL) < 1e-12*scale
+
+
+@pytest.mark.parametrize("flux_name", ["hll", "hllc", "roe"])
+@pytest.mark.parametrize("nspecies", [0, 3])
+@pytest.mark.parametrize("dim", [1, 2, 3])
+def test_numerical_flux_supersonic_upwinding(actx_factory, flux_name, nspecies,
+                                             dim):
+    """Check that the upwind fluxes select the upwind side of supersonic jumps.
+
+    With both states moving supersonically in the same direction, the
+    numerical flux must be the physical flux of the upwind state.
+    """
+    actx = actx_factory()
+
+    from meshmode.mesh.generation import generate_regular_rect_mesh
+    mesh = generate_regular_rect_mesh(
+        a=(-0.5,) * dim, b=(0.5,) * dim, nelements_per_axis=(2,) * dim
+    )
+    discr = EagerDGDiscretization(actx, mesh, order=1)
+    eos = IdealSingleGas()
+
+    def supersonic_velocity(mass, pressure, mach):
+        velocity = np.zeros(dim)
+        velocity[0] = mach*np.sqrt(eos.gamma()*pressure/mass)
+        return velocity
+
+    state_int, flux_int = _make_face_state(
+        actx, discr, eos, nspecies, mass=1.0, pressure=1.0,
+        velocity=supersonic_velocity(1.0, 1.0, 3.0))
+    state_ext, flux_ext = _make_face_state(
+        actx, discr, eos, nspecies, mass=0.5, pressure=0.8,
+        velocity=supersonic_velocity(0.5, 0.8, 3.5))
+    normal = thaw(actx, discr.normal(BTAG_ALL))
+
+    from mirgecom.flux import get_numerical_flux
+    num_flux = get_numerical_flux(flux_name)(
+        state_tpair=TracePair(BTAG_ALL, interior=state_int, exterior=state_ext),
+        f_tpair=TracePair(BTAG_ALL, interior=flux_int, exterior=flux_ext),
+        normal=normal)
+
+    # The flow is along x, so only faces normal to x see a supersonic jump
+    outflow = actx.np.where(normal[0] > 0.5, 1.0 + 0*normal[0], 0*normal[0])
+    inflow = actx.np.where(normal[0] < -0.5, 1.0 + 0*normal[0], 0*normal[0])
+    _assert_flux_equal(discr, num_flux, flux_int @ normal, mask=outflow)
+    _assert_flux_equal(discr, num_flux, flux_ext @ normal, mask=inflow)
+
+
+@pytest.mark.parametrize("flux_name", ["hllc", "roe"])
+@pytest.mark.parametrize("nspecies", [0, 3])
+@pytest.mark.parametrize("dim", [1, 2, 3])
+def test_numerical_flux_stationary_contact(actx_factory, flux_name, nspecies,
+                                           dim):
+    """Check that a stationary contact discontinuity is preserved exactly.
+
+    Across a density jump at rest and in pressure equilibrium, the HLLC and
+    Roe fluxes must reduce to the pressure flux, with no numerical diffusion
+    of mass or energy.
+    """
+    actx = actx_factory()
+
+    from meshmode.mesh.generation import generate_regular_rect_mesh
+    mesh = generate_regular_rect_mesh(
+        a=(-0.5,) * dim, b=(0.5,) * dim, nelements_per_axis=(2,) * dim
+    )
+    discr = EagerDGDiscretization(actx, mesh, order=1)
+    eos = IdealSingleGas()
+
+    state_int, flux_int = _make_face_state(
+        actx, discr, eos, nspecies, mass=1.0, pressure=1.0, velocity=np.zeros(dim))
+    state_ext, flux_ext = _make_face_state(
+        actx, discr, eos, nspecies, mass=0.125, pressure=1.0, velocity=np.zeros(dim))
+    normal = thaw(actx, discr.normal(BTAG_ALL))
+
+    from mirgecom.flux import get_numerical_flux
+    num_flux = get_numerical_flux(flux_name)(
+        state_tpair=TracePair(BTAG_ALL, interior=state_int, exterior=state_ext),
+        f_tpair=TracePair(BTAG_ALL, interior=flux_int, exterior=flux_ext),
+        normal=normal)
+
+    zeros = 0*normal[0]
+    expected = make_conserved(
+        dim, mass=zeros, energy=zeros, momentum=1.0*normal,
+        species_mass=make_obj_array([zeros for _ in range(nspecies)]))
+    _assert_flux_equal(discr, num_flux, expected)
+
+
+@pytest.mark.parametrize("flux_name", ["rusanov", "hll", "hllc", "roe"])
+@pytest.mark.parametrize("nspecies", [0, 3])
+@pytest.mark.parametrize("dim", [1, 2, 3])
+def test_numerical_flux_antisymmetry(actx_factory, flux_name, nspecies, dim):
+    """Check that swapping the sides of a face flips the sign of the flux.
+
+    The flux from the exterior state into the interior one, seen along the
+    reversed normal, must be the negative of the original flux.
+    """
+    actx = actx_factory()
+
+    from meshmode.mesh.generation import generate_regular_rect_mesh
+    mesh = generate_regular_rect_mesh(
+        a=(-0.5,) * dim, b=(0.5,) * dim, nelements_per_axis=(2,) * dim
+    )
+    discr = EagerDGDiscretization(actx, mesh, order=1)
+    eos = IdealSingleGas()
+
+    state_a, flux_a = _make_face_state(
+        actx, discr, eos, nspecies, mass=1.0, pressure=1.0,
+        velocity=0.3 + np.arange(dim))
+    state_b, flux_b = _make_face_state(
+        actx, discr, eos, nspecies, mass=0.4, pressure=0.3,
+        velocity=-0.2 - 0.5*np.arange(dim))
+    normal = thaw(actx, discr.normal(BTAG_ALL))
+
+    from mirgecom.flux import get_numerical_flux
+    numerical_flux_func = get_numerical_flux(flux_name)
+    num_flux = numerical_flux_func(
+        state_tpair=TracePair(BTAG_ALL, interior=state_a, exterior=state_b),
+        f_tpair=TracePair(BTAG_ALL, interior=flux_a, exterior=flux_b),
+        normal=normal)
+    swapped_flux = numerical_flux_func(
+        state_tpair=TracePair(BTAG_ALL, interior=state_b, exterior=state_a),
+        f_tpair=TracePair(BTAG_ALL, interior=flux_b, exterior=flux_a),
+        normal=-normal)
+
+    _assert_flux_equal(discr, swapped_flux, -num_flux)
+
+
 @pytest.mark.parametrize("nspecies", [0, 10])
 @pytest.mark.parametrize("dim", [1, 2, 3])
 @pytest.mark.parametrize("order", [1, 2, 3])
@@ -513,6 +741,136 @@ def test_uniform_rhs(actx_factory, nspecies, dim, order):
     )
 
 
+@pytest.mark.parametrize("dim", [1, 2, 3])
+@pytest.mark.parametrize("order", [1, 2, 3])
+def test_overintegrated_uniform_rhs(actx_factory, dim, order):
+    """Check that the overintegrated Euler RHS vanishes for uniform flow."""
+    actx = actx_factory()
+
+    from meshmode.mesh.generation import generate_regular_rect_mesh
+    mesh = generate_regular_rect_mesh(
+        a=(-0.5,) * dim, b=(0.5,) * dim, nelements_per_axis=(4,) * dim
+    )
+
+    from grudge.dof_desc import DISCR_TAG_BASE, DISCR_TAG_QUAD
+    from meshmode.discretization.poly_element import \
+            QuadratureSimplexGroupFactory, \
+            PolynomialWarpAndBlendGroupFactory
+    discr = EagerDGDiscretization(
+        actx, mesh,
+        discr_tag_to_group_factory={
+            DISCR_TAG_BASE: PolynomialWarpAndBlendGroupFactory(order),
+            DISCR_TAG_QUAD: QuadratureSimplexGroupFactory(2*order + 1),
+        }
+    )
+
+    mass = discr.zeros(actx) + 1
+    energy = discr.zeros(actx) + 2.5
+    mom = make_obj_array([discr.zeros(actx) + (-1.0)**i for i in range(dim)])
+    cv = make_conserved(dim, mass=mass, energy=energy, momentum=mom)
+
+    boundaries = {BTAG_ALL: DummyBoundary()}
+    inviscid_rhs = euler_operator(discr, eos=IdealSingleGas(),
+                                  boundaries=boundaries, cv=cv, t=0.0,
+                                  quad_tag=DISCR_TAG_QUAD)
+
+    rhs = inviscid_rhs.join()
+    for i in range(len(rhs)):
+        assert discr.norm(rhs[i], np.inf) < 1e-9
+
+
+@pytest.mark.parametrize("dim", [1, 2, 3])
+@pytest.mark.parametrize("order", [1, 2, 3])
+def test_overintegrated_lump_rhs(actx_factory, dim, order):
+    """Check the overintegrated Euler RHS of a moving lump against the exact RHS.
+
+    Unlike for uniform flow, the fluxes of the lump are not polynomial, so a
+    wrong projection to or from the quadrature discretization shows up as a
+    lack of convergence.
+    """
+    actx = actx_factory()
+
+    from grudge.dof_desc import DISCR_TAG_BASE, DISCR_TAG_QUAD
+    from meshmode.discretization.poly_element import \
+            QuadratureSimplexGroupFactory, \
+            PolynomialWarpAndBlendGroupFactory
+    from meshmode.mesh.generation import generate_regular_rect_mesh
+    from pytools.convergence import EOCRecorder
+
+    eoc_rec = EOCRecorder()
+
+    for nel_1d in [4, 8, 12]:
+        mesh = generate_regular_rect_mesh(
+            a=(-5,) * dim, b=(5,) * dim, nelements_per_axis=(nel_1d,) * dim
+        )
+        discr = EagerDGDiscretization(
+            actx, mesh,
+            discr_tag_to_group_factory={
+                DISCR_TAG_BASE: PolynomialWarpAndBlendGroupFactory(order),
+                DISCR_TAG_QUAD: QuadratureSimplexGroupFactory(2*order + 1),
+            }
+        )
+        nodes = thaw(actx, discr.nodes())
+
+        lump = Lump(dim=dim, center=np.zeros(shape=(dim,)),
+                    velocity=np.ones(shape=(dim,)))
+        lump_soln = lump(nodes)
+        boundaries = {BTAG_ALL: PrescribedBoundary(lump)}
+        inviscid_rhs = euler_operator(
+            discr, eos=IdealSingleGas(), boundaries=boundaries, cv=lump_soln,
+            t=0.0, quad_tag=DISCR_TAG_QUAD)
+        expected_rhs = lump.exact_rhs(discr, cv=lump_soln, t=0)
+
+        err_max = discr.norm((inviscid_rhs-expected_rhs).join(), np.inf)
+        eoc_rec.add_data_point(1.0 / nel_1d, err_max)
+
+    logger.info(
+        f"Error for (dim,order) = ({dim},{order}):\n"
+        f"{eoc_rec}"
+    )
+
+    assert (
+        eoc_rec.order_estimate() >= order - 0.5
+        or eoc_rec.max_error() < 1e-10
+    )
+
+
+def test_euler_operator_keeps_eos_cache(actx_factory):
+    """Check that the operator leaves the EOS results cached before it."""
+    actx = actx_factory()
+
+    dim = 2
+    from meshmode.mesh.generation import generate_regular_rect_mesh
+    mesh = generate_regular_rect_mesh(
+        a=(-0.5,) * dim, b=(0.5,) * dim, nelements_per_axis=(2,) * dim
+    )
+    discr = EagerDGDiscretization(actx, mesh, order=1)
+
+    from mirgecom.eos import EOSCache
+
+    class CachingIdealSingleGas(IdealSingleGas):
+        cache = EOSCache()
+
+    eos = CachingIdealSingleGas()
+
+    def make_cv(energy):
+        return make_conserved(
+            dim, mass=discr.zeros(actx) + 1, energy=discr.zeros(actx) + energy,
+            momentum=make_obj_array([discr.zeros(actx) for _ in range(dim)]))
+
+    # E.g. the source terms of an RHS, computed before the operator is applied
+    cv = make_cv(2.5)
+    eos.cache.get_or_compute("temperature", cv, lambda: eos.temperature(cv))
+    assert len(eos.cache) == 1
+
+    euler_operator(discr, eos=eos, boundaries={BTAG_ALL: DummyBoundary()},
+                   cv=cv, t=0.0)
+    assert len(eos.cache) == 1
+
+    eos.cache.get_or_compute("temperature", cv, lambda: eos.temperature(cv))
+    assert eos.cache.hits == 1
+
+
 @pytest.mark.parametrize("order", [1, 2, 3])
 def test_vortex_rhs(actx_factory, order):
     """Tests the inviscid rhs using the non-trivial 2D isentropic vortex
@@ -622,6 +980,118 @@ def test_lump_rhs(actx_factory, dim, order):
     )
 
 
+@pytest.mark.parametrize("dim", [1, 2, 3])
+def test_float32_rhs(actx_factory, dim):
+    """Check the Euler RHS and a time step of a state stored in float32.
+
+    The dependent variables and the fluxes must stay in single precision, and
+    the RHS and the advanced state must agree with their double precision
+    counterparts to single precision accuracy.
+    """
+    actx = actx_factory()
+
+    from meshmode.mesh.generation import generate_regular_rect_mesh
+    mesh = generate_regular_rect_mesh(
+        a=(-5,) * dim, b=(5,) * dim, nelements_per_axis=(4,) * dim
+    )
+    discr = EagerDGDiscretization(actx, mesh, order=2)
+    nodes = thaw(actx, discr.nodes())
+
+    lump = Lump(dim=dim, center=np.zeros(shape=(dim,)),
+                velocity=np.ones(shape=(dim,)))
+    eos = IdealSingleGas()
+    boundaries = {BTAG_ALL: PrescribedBoundary(lump)}
+
+    from mirgecom.eos import make_fluid_state
+    from mirgecom.geometry import get_normal
+    from mirgecom.precision import (
+        PrecisionPolicy, cast_to_dtype, make_mixed_precision_timestepper)
+
+    cv64 = lump(nodes)
+    cv32 = cast_to_dtype(cv64, np.float32)
+
+    state = make_fluid_state(cv32, eos)
+    for ary in [state.pressure, state.temperature, state.speed_of_sound]:
+        assert ary.entry_dtype == np.float32
+    flux = inviscid_flux(discr, eos, cv32, state=state)
+    for ary in flux.join().ravel():
+        assert ary.entry_dtype == np.float32
+    assert get_normal(actx, discr, BTAG_ALL,
+                      dtype=np.float32)[0].entry_dtype == np.float32
+
+    def rhs(t, state):
+        return euler_operator(discr, eos=eos, boundaries=boundaries, cv=state,
+                              t=t)
+
+    def rel_err(ary32, ary64):
+        ary32 = ary32.join()
+        ary64 = ary64.join()
+        return max(
+            discr.norm(cast_to_dtype(ary32[i], np.float64) - ary64[i], np.inf)
+            / discr.norm(ary64[i], np.inf)
+            for i in range(len(ary64)))
+
+    assert rel_err(rhs(0, cv32), rhs(0, cv64)) < 1e-4
+
+    dt = 1e-3
+    stepper = make_mixed_precision_timestepper(
+        rk4_step, PrecisionPolicy(state_dtype=np.float32))
+    state32 = stepper(state=cv32, t=0, dt=dt, rhs=rhs)
+    for ary in state32.join():
+        assert ary.entry_dtype == np.float32
+    assert rel_err(state32, rk4_step(state=cv64, t=0, dt=dt, rhs=rhs)) < 1e-5
+
+
+def test_compiled_euler_step(actx_factory):
+    """Check compiled steps of the Euler operator against eager steps.
+
+    The prescribed boundary depends on time, which is a traced argument of the
+    compiled step, so its exterior data cache must be bypassed while tracing.
+    """
+    pytest.importorskip("pytato")
+    import arraycontext
+    from arraycontext import freeze
+    from meshmode.mesh.generation import generate_regular_rect_mesh
+    from mirgecom.steppers import make_compiled_timestepper
+
+    eager_actx = actx_factory()
+    lazy_actx_class = getattr(arraycontext, "PytatoPyOpenCLArrayContext",
+                              getattr(arraycontext, "PytatoArrayContext", None))
+    if lazy_actx_class is None:
+        pytest.skip("no lazy array context available")
+    lazy_actx = lazy_actx_class(eager_actx.queue)
+
+    dim = 2
+    mesh = generate_regular_rect_mesh(
+        a=(-5,) * dim, b=(5,) * dim, nelements_per_axis=(4,) * dim
+    )
+    lump = Lump(dim=dim, center=np.zeros(shape=(dim,)),
+                velocity=np.ones(shape=(dim,)))
+    eos = IdealSingleGas()
+
+    def run(actx, timestepper):
+        discr = EagerDGDiscretization(actx, mesh, order=2)
+        boundaries = {BTAG_ALL: PrescribedBoundary(lump)}
+
+        def rhs(t, state):
+            return euler_operator(discr, eos=eos, boundaries=boundaries,
+                                  cv=state, t=t)
+
+        cv = lump(thaw(actx, discr.nodes()))
+        t = 0
+        dt = 1e-3
+        for _ in range(3):
+            cv = timestepper(state=cv, t=t, dt=dt, rhs=rhs)
+            t += dt
+        return [actx.to_numpy(freeze(ary, actx)[0]) for ary in cv.join()]
+
+    eager_result = run(eager_actx, rk4_step)
+    lazy_result = run(lazy_actx,
+                      make_compiled_timestepper(lazy_actx, rk4_step, eos=eos))
+    for lazy_ary, eager_ary in zip(lazy_result, eager_result):
+        assert np.allclose(lazy_ary, eager_ary, rtol=1e-12, atol=1e-12)
+
+
 @pytest.mark.parametrize("dim", [1, 2, 3])
 @pytest.mark.parametrize("order", [1, 2, 4])
 @pytest.mark.parametrize("v0", [0.0, 1.0])
@@ -141,3 +141,88 @@ def test_analytic_comparison(actx_factory):
 
     errors = compare_fluid_solutions(discr, cv, vortex_soln)
     assert errors == expected_errors
+
+
+@pytest.mark.parametrize("dim", [2, 3])
+def test_group_boundary_tags(actx_factory, dim):
+    """Check that grouping boundary tags does not change the Euler RHS."""
+    actx = actx_factory()
+
+    from grudge.dof_desc import DTAG_BOUNDARY
+    from meshmode.mesh.generation import generate_regular_rect_mesh
+    dim_names = ["x", "y", "z"]
+    boundary_tag_to_face = {}
+    for i in range(dim):
+        boundary_tag_to_face["-"+str(i)] = ["-"+dim_names[i]]
+        boundary_tag_to_face["+"+str(i)] = ["+"+dim_names[i]]
+    mesh = generate_regular_rect_mesh(
+        a=(-0.5,) * dim, b=(0.5,) * dim, nelements_per_axis=(4,) * dim,
+        boundary_tag_to_face=boundary_tag_to_face)
+
+    from mirgecom.initializers import Lump
+    from mirgecom.boundary import PrescribedBoundary, AdiabaticSlipBoundary
+    initializer = Lump(dim=dim, center=np.zeros(shape=(dim,)),
+                       velocity=np.ones(shape=(dim,)))
+    inflow = PrescribedBoundary(initializer)
+    wall = AdiabaticSlipBoundary()
+    boundaries = {DTAG_BOUNDARY("-0"): inflow, DTAG_BOUNDARY("+0"): inflow}
+    for i in range(1, dim):
+        boundaries[DTAG_BOUNDARY("-"+str(i))] = wall
+        boundaries[DTAG_BOUNDARY("+"+str(i))] = wall
+
+    from mirgecom.simutil import group_boundary_tags
+    grouped_mesh, grouped_boundaries = group_boundary_tags(mesh, boundaries)
+    assert len(grouped_boundaries) == 2
+
+    from mirgecom.euler import euler_operator
+    eos = IdealSingleGas()
+
+    def compute_rhs(mesh, boundaries):
+        discr = EagerDGDiscretization(actx, mesh, order=2)
+        nodes = thaw(discr.nodes(), actx)
+        cv = initializer(nodes)
+        rhs = euler_operator(discr, eos=eos, boundaries=boundaries, cv=cv)
+        return discr, rhs
+
+    discr, rhs = compute_rhs(mesh, boundaries)
+    _, grouped_rhs = compute_rhs(grouped_mesh, grouped_boundaries)
+
+    resid = (grouped_rhs - rhs).join()
+    for i in range(len(resid)):
+        assert discr.norm(resid[i], np.inf) < 1e-12
+
+
+def test_geometry_cache(actx_factory):
+    """Check that cached geometry is reused until the cache is cleared."""
+    actx = actx_factory()
+    dim = 2
+
+    from meshmode.mesh import BTAG_ALL
+    from meshmode.mesh.generation import generate_regular_rect_mesh
+    mesh = generate_regular_rect_mesh(
+        a=(-0.5,) * dim, b=(0.5,) * dim, nelements_per_axis=(4,) * dim)
+    discr = EagerDGDiscretization(actx, mesh, order=2)
+
+    from mirgecom.geometry import (
+        get_normal, get_nodes, get_area_element, clear_geometry_cache)
+    normal = get_normal(actx, discr, BTAG_ALL)
+    assert get_normal(actx, discr, BTAG_ALL) is normal
+
+    expected_normal = thaw(discr.normal(BTAG_ALL), actx)
+    for i in range(dim):
+        assert discr.norm(normal[i] - expected_normal[i], np.inf,
+                          dd=BTAG_ALL) == 0
+
+    nodes = get_nodes(actx, discr)
+    assert get_nodes(actx, discr, "vol") is nodes
+
+    # The boundary faces are edges of length 1/4, and the reference edge has
+    # length 2
+    face_jacobian = get_area_element(actx, discr, BTAG_ALL)
+    assert get_area_element(actx, discr, BTAG_ALL) is face_jacobian
+    assert discr.norm(face_jacobian - 1/8, np.inf, dd=BTAG_ALL) < 1e-13
+    assert get_area_element(
+        actx, discr, BTAG_ALL, dtype=np.float32).entry_dtype == np.float32
+
+    clear_geometry_cache(discr)
+    assert get_normal(actx, discr, BTAG_ALL) is not normal
@@ -29,10 +29,15 @@ import logging
 import pytest
 import importlib
 
+from pyopencl.tools import (  # noqa
+    pytest_generate_tests_for_pyopencl as pytest_generate_tests,
+)
 from mirgecom.integrators import (euler_step,
                                   lsrk54_step,
                                   lsrk144_step,
-                                  rk4_step)
+                                  rk4_step,
+                                  bs32_step,
+                                  dp54_step)
 
 logger = logging.getLogger(__name__)
 
@@ -41,7 +46,9 @@ logger = logging.getLogger(__name__)
                          [(euler_step, 1),
                           (lsrk54_step, 4),
                           (lsrk144_step, 4),
-                          (rk4_step, 4)])
+                          (rk4_step, 4),
+                          (bs32_step, 3),
+                          (dp54_step, 5)])
 def test_integration_order(integrator, method_order):
     """Test that time integrators have correct order."""
 
@@ -71,6 +78,268 @@ def test_integration_order(integrator, method_order):
     assert integrator_eoc.order_estimate() >= method_order - .01
 
 
+@pytest.mark.parametrize("integrator", [euler_step, lsrk54_step, lsrk144_step,
+                                        rk4_step, bs32_step, dp54_step])
+def test_integrator_registers(integrator):
+    """Test that in-place stepping leaves the input state alone."""
+    state = np.array([1.0, 2.0, 3.0])
+    initial_state = state.copy()
+    stage_states = []
+
+    def rhs(t, state):
+        # Each stage gets a new view of the registers, for identity-keyed caches
+        assert not any(state is prev for prev in stage_states)
+        stage_states.append(state)
+        return -np.cos(t)*state
+
+    new_state = integrator(state, 0.0, 0.1, rhs)
+    assert np.all(state == initial_state)
+    assert new_state is not state
+
+    # Compare with a step of the same (linear, non-autonomous) problem taken
+    # with scalar states, which are updated out of place
+    scalar_state = integrator(1.0, 0.0, 0.1, lambda t, y: -np.cos(t)*y)
+    assert np.allclose(new_state, scalar_state*initial_state, rtol=1e-14)
+
+
+@pytest.mark.parametrize("integrator", [euler_step, lsrk54_step, lsrk144_step,
+                                        rk4_step, bs32_step, dp54_step])
+def test_integrator_pass_through_rhs(integrator):
+    """Test in-place stepping with a RHS that returns its argument."""
+    state = np.array([1.0, 2.0, 3.0])
+
+    def rhs(t, state):
+        return state
+
+    new_state = integrator(state, 0.0, 0.1, rhs)
+    scalar_state = integrator(1.0, 0.0, 0.1, lambda t, y: y)
+    assert np.allclose(new_state, scalar_state*state, rtol=1e-14)
+    assert np.all(state == [1.0, 2.0, 3.0])
+
+
+def test_axpby_aliasing():
+    """Test in-place updates whose inputs alias the output."""
+    from mirgecom.inplace import axpby, scale
+
+    y = np.array([1.0, 2.0, 3.0])
+    assert np.all(axpby(2, y, 3, y) == [5.0, 10.0, 15.0])
+
+    y = np.array([1.0, 2.0, 3.0])
+    assert np.all(axpby(2, y[::-1], 3, y) == [9.0, 10.0, 11.0])
+
+    x = np.array([1.0, 2.0, 3.0])
+    out = np.full(3, np.nan)
+    assert scale(2, x, out=out) is out
+    assert np.all(out == [2.0, 4.0, 6.0])
+
+
+@pytest.mark.parametrize(("integrator", "register_name"),
+                         [(lsrk54_step, "lsrk_increment"),
+                          (rk4_step, "rk4_stage")])
+def test_integrator_register_reuse(integrator, register_name):
+    """Test that the registers that are not returned are kept across steps."""
+    from mirgecom import inplace
+
+    def rhs(t, state):
+        return -state
+
+    initial_state = np.array([1.0, 2.0, 3.0])
+    state = integrator(initial_state, 0.0, 0.1, rhs)
+    registers = {key: register for key, register in inplace._registers.items()
+                 if key[0] == register_name}
+    assert len(registers) == 1
+
+    state = integrator(state, 0.1, 0.1, rhs)
+    for key, register in registers.items():
+        assert inplace._registers[key] is register
+    assert np.allclose(state, np.exp(-0.2)*initial_state, rtol=1e-6)
+
+
+@pytest.mark.parametrize("coefs_name", ["BogackiShampine32Coefs",
+                                        "DormandPrince54Coefs"])
+def test_adaptive_rk_advance_state(coefs_name):
+    """Test error-controlled integration through the stepper interface."""
+    from mirgecom.integrators import embedded_rk
+    from mirgecom.integrators import AdaptiveRKIntegrator
+    from mirgecom.steppers import advance_state
+
+    def rhs(t, state):
+        return -np.cos(t)*state
+
+    def exact_soln(t):
+        return np.exp(-np.sin(t))
+
+    t_final = 2.0
+    errors = []
+    nrhs = []
+    for rtol in [1e-4, 1e-8]:
+        integrator = AdaptiveRKIntegrator(getattr(embedded_rk, coefs_name),
+                                          rtol=rtol, atol=1e-12)
+        istep, t, state = advance_state(rhs=rhs, timestepper=integrator,
+                                        state=np.array([1.0]), t=0.0, dt=1e-3,
+                                        t_final=t_final)
+        assert t == t_final
+        assert istep == integrator.naccepted
+        errors.append(abs(state[0] - exact_soln(t_final)))
+        nrhs.append(integrator.nrhs)
+
+    # Tighter tolerances buy accuracy with more RHS evaluations
+    assert errors[0] < 1e-3
+    assert errors[1] < 1e-7
+    assert nrhs[1] > nrhs[0]
+
+
+def test_adaptive_rk_conserved_vars(ctx_factory):
+    """Test error-controlled integration of a state on an array context."""
+    import pyopencl as cl
+    from arraycontext import PyOpenCLArrayContext
+    from meshmode.dof_array import DOFArray
+    from mirgecom.fluid import make_conserved
+    from mirgecom.integrators import AdaptiveRKIntegrator
+    from mirgecom.integrators.embedded_rk import _weighted_rms_norm
+    from mirgecom.steppers import advance_state
+
+    cl_ctx = ctx_factory()
+    queue = cl.CommandQueue(cl_ctx)
+    actx = PyOpenCLArrayContext(queue)
+
+    dim = 2
+    nspecies = 2
+    fields = [np.linspace(1, 2, 12).reshape(3, 4) + i
+              for i in range(2 + dim + nspecies)]
+
+    def make_state(scale=1.0):
+        dof_arrays = [DOFArray(actx, (actx.from_numpy(scale*field),))
+                      for field in fields]
+        return make_conserved(
+            dim, mass=dof_arrays[0], energy=dof_arrays[1],
+            momentum=np.array(dof_arrays[2:2+dim], dtype=object),
+            species_mass=np.array(dof_arrays[2+dim:], dtype=object))
+
+    # The weighted RMS of the container is that of its entries
+    error = make_state(1e-6)
+    state = make_state()
+    new_state = make_state(2.0)
+    flat_error = np.concatenate([field.ravel() for field in fields])*1e-6
+    flat_weights = 1e-8 + 1e-4*2*np.concatenate(
+        [field.ravel() for field in fields])
+    assert np.isclose(
+        _weighted_rms_norm(error, state, new_state, atol=1e-8, rtol=1e-4),
+        np.sqrt(np.mean((flat_error/flat_weights)**2)), rtol=1e-12)
+
+    def rhs(t, cv):
+        return -np.cos(t)*cv
+
+    t_final = 2.0
+    integrator = AdaptiveRKIntegrator(rtol=1e-8, atol=1e-12)
+    istep, t, cv = advance_state(rhs=rhs, timestepper=integrator,
+                                 state=make_state(), t=0.0, dt=1e-3,
+                                 t_final=t_final)
+    assert t == t_final
+    assert istep == integrator.naccepted
+
+    exact_cv = make_state(np.exp(-np.sin(t_final)))
+    for ary, exact_ary in zip(cv.join(), exact_cv.join()):
+        assert np.allclose(actx.to_numpy(ary[0]), actx.to_numpy(exact_ary[0]),
+                           rtol=1e-6, atol=0)
+
+
+@pytest.mark.parametrize("integrator", [rk4_step, lsrk54_step])
+def test_compiled_timestepper(ctx_factory, integrator):
+    """Test that compiled steps on a lazy array context match eager steps."""
+    pytest.importorskip("pytato")
+    import pyopencl as cl
+    import arraycontext
+    from meshmode.dof_array import DOFArray
+    from mirgecom.steppers import make_compiled_timestepper
+
+    cl_ctx = ctx_factory()
+    queue = cl.CommandQueue(cl_ctx)
+    eager_actx = arraycontext.PyOpenCLArrayContext(queue)
+    lazy_actx_class = getattr(arraycontext, "PytatoPyOpenCLArrayContext",
+                              getattr(arraycontext, "PytatoArrayContext", None))
+    if lazy_actx_class is None:
+        pytest.skip("no lazy array context available")
+    lazy_actx = lazy_actx_class(queue)
+
+    def rhs(t, u):
+        return -(1 + t)*u + 0.1*u*u
+
+    def run(actx, timestepper):
+        u0 = np.linspace(0.5, 1.5, 20).reshape(4, 5)
+        u = DOFArray(actx, (actx.from_numpy(u0),))
+        t = 0
+        for _ in range(5):
+            u = timestepper(state=u, t=t, dt=0.01, rhs=rhs)
+            t += 0.01
+        return actx.to_numpy(arraycontext.freeze(u[0], actx))
+
+    eager_result = run(eager_actx, integrator)
+    lazy_result = run(lazy_actx,
+                      make_compiled_timestepper(lazy_actx, integrator))
+    assert np.allclose(lazy_result, eager_result, rtol=1e-13, atol=0)
+
+
+def test_rosenbrock23_stiff_batch():
+    """Test the batched Rosenbrock integrator on stiff, node-local systems.
+
+    The first system is the Robertson chemical kinetics problem, the others
+    are linear decays of increasing stiffness.
+    """
+    from mirgecom.integrators import rosenbrock23_integrate
+
+    rates = np.array([0.0, 1.0, 1e4, 1e8])
+
+    def rhs(y, nodes):
+        a, b, c = y
+        robertson = np.array([-0.04*a + 1e4*b*c,
+                              0.04*a - 1e4*b*c - 3e7*b*b,
+                              3e7*b*b])
+        return np.where(nodes == 0, robertson, -rates[nodes]*y)
+
+    y0 = np.ones((3, 4))
+    y0[1:, 0] = 0
+    y = rosenbrock23_integrate(rhs, y0, 40.0, rtol=1e-6, atol=1e-10)
+
+    # Reference solution of the Robertson problem at t=40
+    robertson_ref = np.array([0.7158271, 9.185535e-6, 0.2841637])
+    assert np.max(np.abs(y[:, 0] - robertson_ref) / robertson_ref) < 1e-3
+    assert np.allclose(y[:, 1:], np.exp(-40*rates[1:]), rtol=1e-3, atol=1e-9)
+
+
+def test_mixed_precision_timestepper():
+    """Test that the mixed-precision wrapper stores the state in float32."""
+    from pytools.obj_array import make_obj_array
+    from mirgecom.precision import (
+        PrecisionPolicy, make_mixed_precision_timestepper)
+
+    policy = PrecisionPolicy(state_dtype=np.float32)
+    stepper = make_mixed_precision_timestepper(rk4_step, policy)
+
+    rhs_dtypes = set()
+
+    def rhs(t, state):
+        rhs_dtypes.add(state[0].dtype)
+        return -state
+
+    state = make_obj_array([np.ones(4)])
+    t = 0
+    dt = 0.1
+    while t < 1 - 1e-8:
+        state = stepper(state, t, dt, rhs)
+        t += dt
+
+    assert state[0].dtype == np.float32
+    assert rhs_dtypes == {np.dtype(np.float32)}
+    assert np.allclose(state[0], np.exp(-1), rtol=1e-5)
+
+    # Writing the state in double precision
+    rst_data = PrecisionPolicy(state_dtype=np.float32).cast_restart_data(
+        {"state": state, "step": 10})
+    assert rst_data["state"][0].dtype == np.float64
+    assert rst_data["step"] == 10
+
+
 leap_spec = importlib.util.find_spec("leap")
 found = leap_spec is not None
 if found:
@@ -133,3 +402,114 @@ if found:
 
         logger.info(f"Time Integrator EOC:\n = {integrator_eoc}")
         assert integrator_eoc.order_estimate() >= method_order - .1
+
+    def test_leap_stepper_class_cache(tmp_path, monkeypatch):
+        """Test that generated leap stepper classes are cached and reused."""
+        from mirgecom import steppers
+
+        def rhs(t, y):
+            return -y
+
+        method = ODE23MethodBuilder("y", use_high_order=True)
+        steppers._leap_stepper_classes.clear()
+        stepper_cls = steppers._get_leap_stepper_class(method, "y",
+                                                       cache_dir=str(tmp_path))
+
+        # Reused from memory, for an equivalent method instance too
+        assert steppers._get_leap_stepper_class(
+            ODE23MethodBuilder("y", use_high_order=True), "y",
+            cache_dir=str(tmp_path)) is stepper_cls
+        # Different parameters or component ids generate new classes
+        assert steppers._get_leap_stepper_class(
+            ODE23MethodBuilder("y", use_high_order=False), "y",
+            cache_dir=str(tmp_path)) is not stepper_cls
+        assert steppers._get_leap_stepper_class(
+            ODE23MethodBuilder("z", use_high_order=True), "z",
+            cache_dir=str(tmp_path)) is not stepper_cls
+        # State of unknown effect on the generated code disables caching
+        method_with_state = ODE23MethodBuilder("y", use_high_order=True)
+        method_with_state.last_generated_code = object()
+        assert steppers._get_leap_stepper_key(method_with_state, "y") is None
+        assert steppers._get_leap_stepper_class(
+            method_with_state, "y", cache_dir=str(tmp_path)) is not stepper_cls
+
+        # All of the state of a method builder is part of the key, including
+        # parameters that only some builders have
+        def make_imex_method(**kwargs):
+            return KennedyCarpenterIMEXARK4MethodBuilder("y", **kwargs)
+
+        imex_keys = [
+            steppers._get_leap_stepper_key(make_imex_method(**kwargs), "y")
+            for kwargs in [
+                dict(use_implicit=False, explicit_rhs_name="y"),
+                dict(use_implicit=False, explicit_rhs_name="z"),
+                dict(use_explicit=False, implicit_rhs_name="y"),
+                dict(use_implicit=False, explicit_rhs_name="y")]]
+        assert None not in imex_keys
+        assert len(set(imex_keys[:3])) == 3
+        assert imex_keys[3] == imex_keys[0]
+
+        from mirgecom.steppers import MultirateMethod
+
+        def make_multirate_method(slow_interval):
+            return MultirateMethod([("fast", rhs, 1), ("slow", rhs, slow_interval)],
+                                   component_id="y")
+
+        multirate_cls = steppers._get_leap_stepper_class(
+            make_multirate_method(2), "y", cache_dir=str(tmp_path))
+        assert steppers._get_leap_stepper_class(
+            make_multirate_method(2), "y",
+            cache_dir=str(tmp_path)) is multirate_cls
+        assert steppers._get_leap_stepper_class(
+            make_multirate_method(4), "y",
+            cache_dir=str(tmp_path)) is not multirate_cls
+
+        # Rebuilt from the code cached on disk, without code generation
+        def fail_generate(self):
+            raise AssertionError("leap code generated again")
+
+        steppers._leap_stepper_classes.clear()
+        monkeypatch.setattr(ODE23MethodBuilder, "generate", fail_generate)
+        disk_cls = steppers._get_leap_stepper_class(method, "y",
+                                                    cache_dir=str(tmp_path))
+        assert disk_cls is not stepper_cls
+
+        # Only the state and timestep are set up in advance_state
+        _, t, state = advance_state(rhs=rhs, timestepper=method, dt=0.01,
+                                    state=1.0, t=0.0, t_final=1.0,
+                                    component_id="y")
+        assert abs(state - np.exp(-t)) < 1e-6
+
+    @pytest.mark.parametrize("order", [2, 3])
+    def test_multirate_integration_order(order):
+        """Test the order and the evaluation counts of multirate stepping."""
+        from mirgecom.steppers import MultirateMethod
+
+        nevals = {"fast": 0, "slow": 0}
+
+        def fast_rhs(t, y):
+            nevals["fast"] += 1
+            return -y
+
+        def slow_rhs(t, y):
+            nevals["slow"] += 1
+            return -0.5*y
+
+        method = MultirateMethod([("fast", fast_rhs, 1), ("slow", slow_rhs, 4)],
+                                 order=order, component_id="y")
+
+        from pytools.convergence import EOCRecorder
+        integrator_eoc = EOCRecorder()
+
+        for dt in [0.2, 0.1, 0.05]:
+            nevals.update(fast=0, slow=0)
+            _, t, state = advance_state(rhs=None, timestepper=method, dt=dt,
+                                        state=1.0, t=0.0, t_final=2.0)
+            error = np.abs(state - np.exp(-1.5*t)) / np.exp(-1.5*t)
+            integrator_eoc.add_data_point(dt, error)
+
+        logger.info(f"Multirate EOC:\n = {integrator_eoc}")
+        assert integrator_eoc.order_estimate() >= order - 0.2
+        # The slow component is evaluated about once per four substeps, apart
+        # from the start-up steps
+        assert nevals["slow"] < nevals["fast"] / 2
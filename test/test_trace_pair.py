@@ -0,0 +1,106 @@
+"""Test the split-phase cross-rank trace pair exchange."""
+
+__copyright__ = """
+Copyright (C) 2021 University of Illinois Board of Trustees
+"""
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import logging
+
+import mirgecom.trace_pair as trace_pair
+from grudge.trace_pair import TracePair
+from meshmode.mesh import BTAG_PARTITION
+
+logger = logging.getLogger(__name__)
+
+
+def test_overlapping_cross_rank_exchanges(monkeypatch):
+    """Test that concurrent cross-rank exchanges are matched by their tags.
+
+    The MPI communication is replaced by a mailbox that, like MPI, matches
+    receives to messages with the same source, destination, and tag in the
+    order in which both were posted. Two ranks post two exchanges each, in
+    different orders.
+    """
+    mailbox = {}
+    nreceives = {}
+
+    class FakeDiscretization:
+        def __init__(self, rank):
+            self.rank = rank
+
+    class FakeRankBoundaryCommunication:
+        def __init__(self, discr, remote_rank, local_dofs, tag=None):
+            self.rank = discr.rank
+            self.remote_rank = remote_rank
+            self.local_dofs = local_dofs
+            self.tag = tag
+            mailbox.setdefault((self.rank, remote_rank, tag), []).append(
+                local_dofs)
+            recv_key = (remote_rank, self.rank, tag)
+            self.recv_index = nreceives.get(recv_key, 0)
+            nreceives[recv_key] = self.recv_index + 1
+
+        def finish(self):
+            remote_dofs = mailbox[self.remote_rank, self.rank,
+                                  self.tag][self.recv_index]
+            return TracePair(BTAG_PARTITION(self.remote_rank),
+                             interior=self.local_dofs, exterior=remote_dofs)
+
+    monkeypatch.setattr(trace_pair, "_RankBoundaryCommunication",
+                        FakeRankBoundaryCommunication)
+    monkeypatch.setattr(trace_pair, "connected_ranks",
+                        lambda discr: [1 - discr.rank])
+
+    def exchange(u_tag, alpha_tag):
+        mailbox.clear()
+        nreceives.clear()
+        discr0 = FakeDiscretization(0)
+        discr1 = FakeDiscretization(1)
+        u_exchange0 = trace_pair.start_cross_rank_trace_pairs(
+            discr0, "u0", tag=u_tag)
+        alpha_exchange0 = trace_pair.start_cross_rank_trace_pairs(
+            discr0, "alpha0", tag=alpha_tag)
+        alpha_exchange1 = trace_pair.start_cross_rank_trace_pairs(
+            discr1, "alpha1", tag=alpha_tag)
+        u_exchange1 = trace_pair.start_cross_rank_trace_pairs(
+            discr1, "u1", tag=u_tag)
+        return [
+            tpair.ext
+            for exch in [alpha_exchange0, u_exchange0, u_exchange1,
+                         alpha_exchange1]
+            for tpair in trace_pair.finish_cross_rank_trace_pairs(exch)]
+
+    assert exchange(u_tag=1, alpha_tag=2) == ["alpha1", "u1", "u0", "alpha0"]
+
+    # With a shared tag, the messages get mixed up
+    assert exchange(u_tag=None, alpha_tag=None) != ["alpha1", "u1", "u0",
+                                                    "alpha0"]
+
+
+if __name__ == "__main__":
+    import sys
+    if len(sys.argv) > 1:
+        exec(sys.argv[1])
+    else:
+        from pytest import main
+        main([__file__])